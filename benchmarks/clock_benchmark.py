@@ -0,0 +1,54 @@
+"""
+Compare the per-read cost of TTL checks with the system clock and a coarse clock.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/clock_benchmark.py
+"""
+
+import time
+import timeit
+
+from fastcfg.cache import Cache
+from fastcfg.cache.strategies import TTLCacheStrategy
+from fastcfg.clock import CoarseClock
+
+READS = 1_000_000
+REPEAT = 7
+
+
+def best_ns_per_read(func) -> float:
+    """Run `func` READS times, REPEAT times over, and return the best ns per call."""
+    return min(timeit.repeat(func, number=READS, repeat=REPEAT)) / READS * 1e9
+
+
+def main():
+    clock = CoarseClock(resolution=0.01)
+
+    system_cache = Cache(TTLCacheStrategy(seconds=600))
+    coarse_cache = Cache(TTLCacheStrategy(seconds=600, clock=clock))
+    system_cache.set_value("key", "value")
+    coarse_cache.set_value("key", "value")
+
+    results = [
+        ("time.time()", best_ns_per_read(time.time)),
+        ("CoarseClock.now", best_ns_per_read(lambda: clock.now)),
+        (
+            "Cache.get_value, system clock",
+            best_ns_per_read(lambda: system_cache.get_value("key")),
+        ),
+        (
+            "Cache.get_value, coarse clock",
+            best_ns_per_read(lambda: coarse_cache.get_value("key")),
+        ),
+    ]
+
+    clock.stop()
+
+    width = max(len(name) for name, _ in results)
+    for name, ns in results:
+        print(f"{name:<{width}}  {ns:7.1f} ns/read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure how many change events per second the event system delivers.
+
+Each scenario flips a nested value back and forth, firing one change per
+assignment that propagates through three levels of configs.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/events_benchmark.py
+"""
+
+import timeit
+
+from fastcfg.config import Config
+
+CHANGES = 200_000
+REPEAT = 5
+
+
+def best_events_per_second(func) -> float:
+    """Run `func` CHANGES times, REPEAT times over, and return the best rate."""
+    return CHANGES / min(timeit.repeat(func, number=CHANGES, repeat=REPEAT))
+
+
+def flipper(config: Config):
+    """Return a function changing the nested port on every call."""
+    item = config.service.database.port._item
+    values = [5432, 6432]
+    state = {"index": 0}
+
+    def flip():
+        state["index"] ^= 1
+        item.value = values[state["index"]]
+
+    return flip
+
+
+def main():
+    def build():
+        return Config(service={"database": {"port": 5432}})
+
+    def noop(event):
+        pass
+
+    no_listeners = build()
+
+    leaf_listener = build()
+    leaf_listener.service.database.port.on_change(noop)
+
+    every_level = build()
+    every_level.service.database.port.on_change(noop)
+    every_level.service.database.on_change(noop)
+    every_level.service.on_change(noop)
+    every_level.on_change(noop)
+
+    results = [
+        ("No listeners", best_events_per_second(flipper(no_listeners))),
+        ("Leaf listener", best_events_per_second(flipper(leaf_listener))),
+        (
+            "Listener at every level",
+            best_events_per_second(flipper(every_level)),
+        ),
+    ]
+
+    width = max(len(name) for name, _ in results)
+    for name, rate in results:
+        print(f"{name:<{width}}  {rate:12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure the cost of validating values against a chain of validators.
+
+Each scenario validates a value against a type, a range and a regex validator,
+either through live item reads, whose state changes on every read or never, or
+by validating a built-in item directly.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/validation_benchmark.py
+"""
+
+import itertools
+import timeit
+
+from fastcfg.config.items import BuiltInConfigItem, LiveConfigItem
+from fastcfg.validation.policies import (
+    RangeValidator,
+    RegexValidator,
+    TypeValidator,
+)
+
+CALLS = 200_000
+REPEAT = 5
+
+
+def best_ns_per_call(func) -> float:
+    """Run `func` CALLS times, REPEAT times over, and return the best time per call."""
+    return min(timeit.repeat(func, number=CALLS, repeat=REPEAT)) / CALLS * 1e9
+
+
+def add_validators(item):
+    item.add_validator(TypeValidator(str))
+    item.add_validator(RegexValidator(r"^[a-z]+-\d+$"))
+    item.add_validator(RangeValidator("a", "z"))
+    return item
+
+
+class CyclingTracker:
+    """A state tracker cycling through values on every read."""
+
+    def __init__(self, *values):
+        self._values = itertools.cycle(values)
+
+    def get_state(self):
+        return next(self._values)
+
+
+def main():
+    changing = add_validators(
+        LiveConfigItem(CyclingTracker("host-1", "host-2", "host-3"))
+    )
+    unchanged = add_validators(LiveConfigItem(CyclingTracker("host-1")))
+    built_in = add_validators(BuiltInConfigItem("host-1"))
+
+    results = [
+        ("Live read, changed state", best_ns_per_call(lambda: changing.value)),
+        (
+            "Live read, unchanged state",
+            best_ns_per_call(lambda: unchanged.value),
+        ),
+        ("Built-in validate()", best_ns_per_call(built_in.validate)),
+    ]
+
+    width = max(len(name) for name, _ in results)
+    for name, ns in results:
+        print(f"{name:<{width}}  {ns:8,.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
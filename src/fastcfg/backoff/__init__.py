@@ -3,20 +3,66 @@ This module provides an implementation of an exponential backoff mechanism.
 
 Classes:
     BackoffPolicy: Configuration class for the exponential backoff mechanism.
+    BackoffMetrics: What a call with backoff went through, reported to the policy's metrics hook.
+    RetryBudget: A process-wide token bucket limiting retries to a ratio of successful calls.
 
 Functions:
+    set_retry_budget: Install (or remove) the process-wide retry budget.
+    get_retry_budget: Get the process-wide retry budget.
+    record_success: Credit a successful call to the retry budget.
+    try_acquire_retry: Charge a retry to the retry budget.
+    backoff_delay: Compute how long to wait before a given retry attempt.
+    should_retry: Check if an error is worth retrying under a backoff policy.
+    report_metrics: Report a call's metrics to the policy's metrics hook.
+    call_with_backoff: Call a function, retrying it with exponential backoff.
     exponential_backoff: Decorator function to apply exponential backoff retries to a function.
 
 Exceptions:
     MaxRetriesExceededError: Raised when the maximum number of retries is exceeded.
+    BackoffDeadlineExceededError: Raised when the next retry would end past the policy's deadline.
+    RetryBudgetExhaustedError: Raised when the retry budget denies a retry.
+
+Usage Example:
+    from fastcfg.backoff import RetryBudget, set_retry_budget
+
+    # At most one retry per ten successful calls, across every tracker
+    set_retry_budget(RetryBudget(ratio=0.1))
 """
 
 import functools
 import random
+import threading
 import time
 from dataclasses import dataclass
+from typing import Callable, Optional
 
-from fastcfg.exceptions import MaxRetriesExceededError
+from fastcfg.exceptions import (
+    BackoffDeadlineExceededError,
+    MaxRetriesExceededError,
+    RetryBudgetExhaustedError,
+)
+
+JITTER_MODES = ("equal", "full", "decorrelated")
+
+
+@dataclass
+class BackoffMetrics:
+    """
+    What a call with backoff went through, reported to the policy's metrics hook.
+
+    Attributes:
+        attempts (int): The number of times the function was called.
+        total_time_slept (float): The seconds spent sleeping between attempts.
+        elapsed (float): The seconds spent in total, calls included.
+        succeeded (bool): Whether the last attempt succeeded.
+        error (Exception): The error of the last attempt, if it failed.
+    """
+
+    attempts: int
+    total_time_slept: float
+    elapsed: float
+    succeeded: bool
+    error: Optional[Exception] = None
 
 
 @dataclass
@@ -25,11 +71,23 @@ class BackoffPolicy:
     Configuration for the exponential backoff mechanism.
 
     Attributes:
-        max_retries (int): Maximum number of retry attempts.
+        max_retries (int): Maximum number of attempts, the first call included.
         base_delay (float): Initial delay between retries in seconds.
         max_delay (float): Maximum delay between retries in seconds.
         factor (float): Multiplicative factor for delay growth.
         jitter (bool): If True, adds a random jitter to the delay.
+        deadline (float): Maximum seconds spent across every attempt and delay, if any.
+            No retry is started if its delay would end past the deadline.
+        jitter_mode (str): How jitter is applied, when enabled:
+            - "equal": a random delay between half and all of the exponential delay.
+            - "full": a random delay between zero and the exponential delay.
+            - "decorrelated": a random delay between `base_delay` and three times
+              the previous delay, capped at `max_delay`.
+        retry_on (Callable[[Exception], bool]): Whether an error is worth retrying.
+            Errors it rejects, such as non-transient ones, are raised right away.
+            Defaults to retrying every error.
+        metrics_hook (Callable[[BackoffMetrics], None]): Called with the metrics of
+            every call once it succeeds or gives up.
     """
 
     max_retries: int
@@ -37,6 +95,298 @@ class BackoffPolicy:
     max_delay: float
     factor: float
     jitter: bool
+    deadline: Optional[float] = None
+    jitter_mode: str = "equal"
+    retry_on: Optional[Callable[[Exception], bool]] = None
+    metrics_hook: Optional[Callable[[BackoffMetrics], None]] = None
+
+    def __post_init__(self):
+        if self.jitter_mode not in JITTER_MODES:
+            raise ValueError(
+                f"jitter_mode must be one of {JITTER_MODES}, got {self.jitter_mode!r}."
+            )
+
+
+class RetryBudget:
+    """
+    A process-wide token bucket limiting retries to a ratio of successful calls.
+
+    Purpose:
+        - When a shared dependency goes down, every tracker retrying on its own
+          multiplies the load on it. The budget caps retries across all of them,
+          so an outage doesn't turn into a self-inflicted overload.
+
+    How it Works:
+        - Every successful call deposits `ratio` tokens, up to `max_tokens`.
+        - Tokens also trickle in at `min_retries_per_second`, so processes with
+          little traffic can still retry now and then.
+        - Every retry withdraws a token. Without one, the retry is denied and the
+          call fails right away with `RetryBudgetExhaustedError`.
+
+    Attributes:
+        ratio (float): The tokens deposited per successful call.
+        min_retries_per_second (float): The tokens deposited per second regardless of traffic.
+        max_tokens (float): The most tokens the bucket holds.
+        denied (int): The number of retries denied so far.
+
+    Methods:
+        record_success(): Deposit the tokens earned by a successful call.
+        try_acquire(): Withdraw a token for a retry, if there is one.
+        tokens(): The number of tokens currently available.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+    ):
+        """
+        Initialize the budget, starting with a full bucket.
+
+        Args:
+            ratio (float): The tokens deposited per successful call. Defaults to 0.1,
+                allowing one retry for every ten successful calls.
+            min_retries_per_second (float): The tokens deposited per second regardless of traffic.
+                Defaults to 1.
+            max_tokens (float): The most tokens the bucket holds, which bounds retry
+                bursts. Defaults to 10.
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self.denied = 0
+
+        self._tokens = max_tokens
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryBudget(ratio={self.ratio}, "
+            f"min_retries_per_second={self.min_retries_per_second}, "
+            f"max_tokens={self.max_tokens}, tokens={self.tokens():.2f}, "
+            f"denied={self.denied})"
+        )
+
+    def _deposit(self, amount: float) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._deposit((now - self._refilled_at) * self.min_retries_per_second)
+        self._refilled_at = now
+
+    def record_success(self) -> None:
+        """Deposit the tokens earned by a successful call."""
+        with self._lock:
+            self._deposit(self.ratio)
+
+    def try_acquire(self) -> bool:
+        """
+        Withdraw a token for a retry, if there is one.
+
+        Returns:
+            bool: True if the retry may proceed, False if it is denied.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.denied += 1
+            return False
+
+    def tokens(self) -> float:
+        """The number of tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+# The process-wide retry budget, `None` when retries are unlimited
+_retry_budget: Optional[RetryBudget] = None
+
+
+def set_retry_budget(retry_budget: Optional[RetryBudget]) -> None:
+    """
+    Install (or remove) the process-wide retry budget.
+
+    Every retry made by `exponential_backoff`, `call_with_backoff` and the
+    background retries of live trackers is then charged to it.
+
+    Args:
+        retry_budget (RetryBudget, optional): The budget, or `None` for unlimited retries.
+    """
+    global _retry_budget
+    _retry_budget = retry_budget
+
+
+def get_retry_budget() -> Optional[RetryBudget]:
+    """
+    Get the process-wide retry budget.
+
+    Returns:
+        Optional[RetryBudget]: The budget, or `None` if retries are unlimited.
+    """
+    return _retry_budget
+
+
+def record_success() -> None:
+    """Credit a successful call to the retry budget, if one is installed."""
+    if _retry_budget is not None:
+        _retry_budget.record_success()
+
+
+def try_acquire_retry() -> bool:
+    """
+    Charge a retry to the retry budget, if one is installed.
+
+    Returns:
+        bool: True if the retry may proceed, False if the budget denies it.
+    """
+    return _retry_budget is None or _retry_budget.try_acquire()
+
+
+def backoff_delay(
+    backoff_policy: BackoffPolicy,
+    attempt: int,
+    previous_delay: Optional[float] = None,
+) -> float:
+    """
+    Compute how long to wait after a failed attempt.
+
+    Args:
+        backoff_policy (BackoffPolicy): The backoff policy.
+        attempt (int): The zero-based index of the attempt that failed.
+        previous_delay (float, optional): The previous delay, used by decorrelated jitter.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    if backoff_policy.jitter and backoff_policy.jitter_mode == "decorrelated":
+        previous_delay = previous_delay or backoff_policy.base_delay
+        return min(
+            backoff_policy.max_delay,
+            random.uniform(backoff_policy.base_delay, previous_delay * 3),
+        )
+
+    sleep_time = backoff_policy.base_delay * (backoff_policy.factor**attempt)
+    sleep_time = min(sleep_time, backoff_policy.max_delay)
+
+    if backoff_policy.jitter:
+        if backoff_policy.jitter_mode == "full":
+            sleep_time *= random.random()
+        else:
+            sleep_time *= 0.5 + random.random() / 2
+
+    return sleep_time
+
+
+def should_retry(backoff_policy: BackoffPolicy, exc: Exception) -> bool:
+    """
+    Check if an error is worth retrying under a backoff policy.
+
+    Args:
+        backoff_policy (BackoffPolicy): The backoff policy.
+        exc (Exception): The error raised by the last attempt.
+
+    Returns:
+        bool: False if the policy's `retry_on` predicate rejects the error.
+    """
+    return backoff_policy.retry_on is None or backoff_policy.retry_on(exc)
+
+
+def report_metrics(backoff_policy: BackoffPolicy, metrics: BackoffMetrics):
+    """
+    Report a call's metrics to the policy's metrics hook, if it has one.
+
+    Args:
+        backoff_policy (BackoffPolicy): The backoff policy.
+        metrics (BackoffMetrics): The metrics of the call.
+    """
+    if backoff_policy.metrics_hook is not None:
+        backoff_policy.metrics_hook(metrics)
+
+
+def call_with_backoff(backoff_policy: BackoffPolicy, func, *args, **kwargs):
+    """
+    Call a function, retrying it with exponential backoff.
+
+    Unlike `exponential_backoff`, nothing is wrapped, which suits callers that
+    retry a different function (such as a bound method) on every call.
+
+    Args:
+        backoff_policy (BackoffPolicy): The backoff policy.
+        func (Callable): The function to call.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        Any: The result of the function call.
+
+    Raises:
+        MaxRetriesExceededError: If every attempt failed.
+        BackoffDeadlineExceededError: If the next retry would end past the policy's deadline.
+        RetryBudgetExhaustedError: If the retry budget denied a retry.
+        Exception: The original error, if the policy's `retry_on` predicate rejects it.
+    """
+    start = time.monotonic()
+    total_time_slept = 0
+    sleep_time = None
+    # The function is always called at least once
+    attempts = max(1, backoff_policy.max_retries)
+
+    def report(attempt: int, error: Optional[Exception] = None):
+        report_metrics(
+            backoff_policy,
+            BackoffMetrics(
+                attempts=attempt + 1,
+                total_time_slept=total_time_slept,
+                elapsed=time.monotonic() - start,
+                succeeded=error is None,
+                error=error,
+            ),
+        )
+
+    for attempt in range(attempts):
+        try:
+            value = func(*args, **kwargs)
+        except Exception as exc:
+            report_error = functools.partial(report, attempt, exc)
+
+            if not should_retry(backoff_policy, exc):
+                report_error()
+                raise
+
+            if attempt == attempts - 1:
+                report_error()
+                raise MaxRetriesExceededError(
+                    backoff_policy, total_time_slept
+                ) from exc
+
+            sleep_time = backoff_delay(backoff_policy, attempt, sleep_time)
+
+            deadline = backoff_policy.deadline
+            if (
+                deadline is not None
+                and time.monotonic() - start + sleep_time > deadline
+            ):
+                report_error()
+                raise BackoffDeadlineExceededError(
+                    backoff_policy, total_time_slept
+                ) from exc
+
+            if not try_acquire_retry():
+                report_error()
+                raise RetryBudgetExhaustedError(_retry_budget) from exc
+
+            time.sleep(sleep_time)
+            total_time_slept += sleep_time
+        else:
+            record_success()
+            report(attempt)
+            return value
 
 
 def exponential_backoff(backoff_policy: BackoffPolicy):
@@ -50,6 +400,7 @@ def exponential_backoff(backoff_policy: BackoffPolicy):
             - max_delay (float): Maximum delay between retries in seconds.
             - factor (float): Multiplicative factor for delay growth.
             - jitter (bool): If True, adds a random jitter to the delay.
+            - deadline, jitter_mode, retry_on and metrics_hook, see `BackoffPolicy`.
 
     Returns:
         function: Wrapped function with retry mechanism.
@@ -58,33 +409,7 @@ def exponential_backoff(backoff_policy: BackoffPolicy):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            delay = backoff_policy.base_delay
-
-            total_time_slept = 0
-
-            for attempt in range(backoff_policy.max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as exc:
-
-                    if attempt == backoff_policy.max_retries - 1:
-                        raise MaxRetriesExceededError(
-                            backoff_policy, total_time_slept
-                        ) from exc
-
-                    sleep_time = delay * (backoff_policy.factor**attempt)
-
-                    if backoff_policy.jitter:
-                        sleep_time = min(
-                            sleep_time, backoff_policy.max_delay
-                        ) * (0.5 + random.random() / 2)
-                    else:
-                        sleep_time = min(sleep_time, backoff_policy.max_delay)
-
-                    time.sleep(sleep_time)
-                    total_time_slept += sleep_time
-
-            return func(*args, **kwargs)
+            return call_with_backoff(backoff_policy, func, *args, **kwargs)
 
         return wrapper
 
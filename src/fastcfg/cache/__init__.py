@@ -5,23 +5,41 @@ strategies in the fastcfg library.
 Classes:
     - AbstractCacheStrategy: An abstract base class defining the interface for cache strategies.
     - AbstractUsageCacheStrategy: An abstract base class for usage-based cache eviction strategies.
-    - Cache: A class that manages cache entries using a specified cache strategy.
+    - Cache: A class that manages cache entries using a specified cache strategy and storage backend.
 
 Exceptions:
     - MissingCacheKeyError: Raised when a requested cache key is not found.
 
 Modules:
     - cache_store: Provides a global store for managing cache instances.
+    - backends: Provides the storage backends (in-memory, SQLite) used by `Cache`.
 """
 
+import copy
+import time
 import uuid
+import weakref
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Any, Dict, Optional
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    MutableMapping,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from fastcfg.cache.backends import AbstractCacheBackend, InMemoryCacheBackend
 from fastcfg.cache.store import cache_store
 from fastcfg.exceptions import MissingCacheKeyError
 
+if TYPE_CHECKING:
+    from fastcfg.clock import CoarseClock
+
 
 class AbstractCacheStrategy(ABC):
     """
@@ -34,8 +52,73 @@ class AbstractCacheStrategy(ABC):
           any invalidation cleanup for a given cache key and optionally returns a
           default value.
         - on_access(key: str, meta: Dict[str, Any]) -> None: Update metadata or perform actions upon cache access.
+        - on_eviction(key: str) -> None: Forget any per-key state once an entry leaves the cache.
+        - record_cost(key: str, cost: float) -> None: Observe how long it took to fetch the value for a key.
+        - on_restore(key: str, value: Any, meta: Dict[str, Any]) -> None: Pick up an entry that already existed in a persistent backend.
+        - needs_refresh(meta_value: Any) -> bool: Determine if a valid entry should be refreshed ahead of expiry.
+        - can_serve_stale(meta_value: Any) -> bool: Determine if an expired entry may still be served when refetching fails.
+        - bind(cache: 'Cache') -> AbstractCacheStrategy: Create a copy of the strategy that owns its state for a single cache.
+
+    Strategies are shared as templates (see `fastcfg.cache.policies`), so any
+    bookkeeping they keep between calls must be created in `_reset_state`.
+    `Cache` binds its own copy on construction, which keeps that state private
+    to the cache instead of leaking it between every cache using the policy.
     """
 
+    # A weak reference to the owning cache, so the cache and its strategy
+    # don't keep each other alive once the cache is no longer used
+    _owner: Optional["weakref.ref[Cache]"] = None
+
+    # An optional `CoarseClock` read instead of `time.time()` on hot paths
+    _clock: Optional["CoarseClock"] = None
+
+    def bind(self, cache: "Cache") -> "AbstractCacheStrategy":
+        """
+        Create a copy of this strategy that keeps its state for `cache` only.
+
+        Args:
+            cache (Cache): The cache that will own the returned strategy.
+
+        Returns:
+            AbstractCacheStrategy: A fresh copy of the strategy bound to `cache`.
+        """
+        strategy = copy.copy(self)
+        strategy._owner = weakref.ref(cache)
+        strategy._reset_state()
+        return strategy
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Weak references can't be pickled, `Cache` binds the copy again
+        state.pop("_owner", None)
+        return state
+
+    def _now(self) -> float:
+        """The current wall clock time, read from the strategy's clock if it has one."""
+        clock = self._clock
+        return time.time() if clock is None else clock.now
+
+    def _reset_state(self) -> None:
+        """Initialize (or drop) any per-cache bookkeeping kept by the strategy."""
+
+    def _evict(self, key: str, meta: Dict[str, Any]) -> None:
+        """
+        Evict an entry on behalf of the strategy.
+
+        When the strategy is bound to a cache, the cached value is evicted as
+        well so the value and its metadata never drift apart.
+
+        Args:
+            key (str): The key of the entry to evict.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner.evict(key)
+        else:
+            self.on_eviction(key)
+            meta.pop(key, None)
+
     @abstractmethod
     def is_valid(self, meta_value: Any) -> bool:
         """Determine if the cache entry is still valid based on the strategy."""
@@ -51,6 +134,23 @@ class AbstractCacheStrategy(ABC):
     def on_access(self, key: str, meta: Dict[str, Any]) -> None:
         """Update metadata or perform actions upon cache access."""
 
+    def on_eviction(self, key: str) -> None:
+        """Forget any per-key state once an entry has left the cache."""
+
+    def record_cost(self, key: str, cost: float) -> None:
+        """Observe how long, in seconds, fetching the value for a key took."""
+
+    def on_restore(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """Pick up an entry that already existed in a persistent backend."""
+
+    def needs_refresh(self, meta_value: Any) -> bool:
+        """Determine if a valid entry should be refreshed ahead of expiry."""
+        return False
+
+    def can_serve_stale(self, meta_value: Any) -> bool:
+        """Determine if an expired entry may still be served when refetching fails."""
+        return False
+
 
 class AbstractUsageCacheStrategy(AbstractCacheStrategy, ABC):
     """
@@ -60,6 +160,8 @@ class AbstractUsageCacheStrategy(AbstractCacheStrategy, ABC):
         - __init__(capacity: int): Initialize the strategy with a given capacity.
         - is_valid(meta_value: Optional[Any]) -> bool: Determine if a cache entry is valid based on usage.
         - _remove_excess_entries(meta: Dict[str, Any], to_remove_key: str) -> None: Remove excess entries if capacity is exceeded.
+        - on_eviction(key: str) -> None: Drop the key from the usage order.
+        - on_restore(key: str, value: Any, meta: Dict[str, Any]) -> None: Track a restored entry as if it had just been inserted.
         - on_invalidation(key: str, cache: 'Cache') -> None: Perform any invalidation cleanup for a given cache key.
         - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Execute cache strategy policy upon insertion.
         - on_access(key: str, meta: Dict[str, Any]) -> None: Update metadata or perform actions upon cache access.
@@ -73,6 +175,10 @@ class AbstractUsageCacheStrategy(AbstractCacheStrategy, ABC):
             capacity (int): The maximum number of entries the cache can hold.
         """
         self._capacity = capacity
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """Start with an empty usage order."""
         self._order: OrderedDict[str, Any] = OrderedDict()
 
     def is_valid(self, meta_value: Optional[Any]) -> bool:
@@ -98,8 +204,27 @@ class AbstractUsageCacheStrategy(AbstractCacheStrategy, ABC):
             to_remove_key (str): The key of the entry to remove.
         """
         if to_remove_key in self._order:
-            del self._order[to_remove_key]
-            del meta[to_remove_key]
+            self._evict(to_remove_key, meta)
+
+    def on_restore(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Track a restored entry as if it had just been inserted.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        self.on_insertion(key, value, meta)
+
+    def on_eviction(self, key: str) -> None:
+        """
+        Drop the key from the usage order.
+
+        Args:
+            key (str): The key of the evicted entry.
+        """
+        self._order.pop(key, None)
 
     def on_invalidation(self, key: str, cache: "Cache") -> None:
         """
@@ -128,22 +253,80 @@ class Cache:
 
     Methods:
         - __init__(cache_strategy: ICacheStrategy): Initialize the cache with a given strategy.
-        - set_value(key: str, value: Any) -> None: Set the value and associated metadata for a given key.
+        - set_value(key: str, value: Any, cost: Optional[float] = None, tags: Iterable[str] = ()) -> None: Set the value and associated metadata for a given key.
         - get_value(key: str) -> Any: Retrieve the value for a given key if it's valid.
         - is_valid(key: str) -> bool: Check if a key is present and valid in the cache.
         - get_metadata(key: str) -> Optional[Any]: Get metadata associated with a given cache key.
+        - get_stale_value(key: str) -> Any: Retrieve an expired value that may still be served on error.
+        - needs_refresh(key: str) -> bool: Check if a cached key should be refreshed ahead of expiry.
+        - evict(key: str) -> None: Remove an entry and its metadata from the cache.
+        - clear() -> None: Remove every entry from the cache.
+        - fill_lock(key: str) -> ContextManager: Serialize fetches that fill a missing entry.
+        - set_negative(key: str, ttl: float, value: Any = None, error: BaseException = None) -> None: Remember a miss or a failed fetch.
+        - get_negative(key: str) -> Tuple[Any, Optional[BaseException]]: Retrieve a remembered miss or failed fetch.
+        - invalidate_tag(tag: str) -> int: Evict every entry carrying a tag.
+
+    Entries can carry tags, such as their source type or host, so related
+    entries can be dropped together with `cache_store.invalidate(tag=...)`.
+
+    Negative entries (misses and failed fetches) have their own TTL and are kept
+    apart from the regular entries, in process memory whatever the backend, as
+    the exceptions they hold are not necessarily serializable.
+
+    The strategy passed in is treated as a template: the cache binds its own
+    copy, so usage-based strategies such as `LRU_POLICY` keep a separate order
+    for every cache that uses them.
     """
 
     def __init__(
-        self, cache_strategy: AbstractCacheStrategy, name: str = None
+        self,
+        cache_strategy: AbstractCacheStrategy,
+        name: str = None,
+        backend: Optional[AbstractCacheBackend] = None,
     ):
-        self._cache_strategy = cache_strategy
-        self._cache: Dict[str, Any] = {}
-        self._meta: Dict[str, Any] = {}
+        """
+        Initialize the cache.
+
+        Args:
+            cache_strategy (AbstractCacheStrategy): The strategy deciding validity and eviction.
+            name (str, optional): A globally unique name. Generated if not provided.
+            backend (AbstractCacheBackend, optional): Where entries are stored.
+                Defaults to an `InMemoryCacheBackend`.
+        """
+        self._backend = backend or InMemoryCacheBackend()
+        self._cache: MutableMapping[str, Any] = self._backend.values
+        self._meta: MutableMapping[str, Any] = self._backend.meta
+        self._negative: Dict[
+            str, Tuple[float, Any, Optional[BaseException]]
+        ] = {}
+
+        # Tags by key, and keys by tag
+        self._key_tags: Dict[str, Set[str]] = {}
+        self._tag_keys: Dict[str, Set[str]] = {}
+
+        self._cache_strategy = cache_strategy.bind(self)
 
         self.name = name
 
         self._handle_new_cache()
+        self._restore_entries()
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache_strategy._owner = weakref.ref(self)
+
+    def _restore_entries(self):
+        """
+        Let the strategy pick up entries that already exist in the backend.
+
+        Persistent backends may hold entries written by an earlier process; the
+        strategy is told about each of them so usage-based eviction covers them too.
+        """
+        for key in list(self._meta):
+            if key in self._cache:
+                self._cache_strategy.on_restore(
+                    key, self._cache[key], self._meta
+                )
 
     def _handle_new_cache(self):
         """
@@ -166,10 +349,64 @@ class Cache:
 
         cache_store.add_cache(self)
 
-    def set_value(self, key: str, value: Any) -> None:
-        """Set the value and associated metadata for a given key in the cache."""
+    def set_value(
+        self,
+        key: str,
+        value: Any,
+        cost: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Set the value and associated metadata for a given key in the cache.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+            cost (float, optional): How long, in seconds, fetching the value took.
+                Cost-aware strategies use it to keep expensive entries longer.
+            tags (Iterable[str]): Tags to invalidate the entry by.
+        """
+        self._negative.pop(key, None)
         self._cache[key] = value
+        if cost is not None:
+            self._cache_strategy.record_cost(key, cost)
         self._cache_strategy.on_insertion(key, value, self._meta)
+        self._tag(key, tags)
+
+    def _tag(self, key: str, tags: Iterable[str]) -> None:
+        """Index an entry under each of its tags, here and in the cache store."""
+        # The entry replaces any previous one, tags included
+        self._untag(key)
+        for tag in tags:
+            self._key_tags.setdefault(key, set()).add(tag)
+            keys = self._tag_keys.get(tag)
+            if keys is None:
+                keys = self._tag_keys[tag] = set()
+                cache_store.index_tag(self, tag)
+            keys.add(key)
+
+    def _untag(self, key: str) -> None:
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Evict every entry carrying a tag.
+
+        Args:
+            tag (str): The tag to invalidate.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        keys = self._tag_keys.pop(tag, set())
+        for key in keys:
+            self.evict(key)
+        return len(keys)
 
     def get_value(self, key: str) -> Any:
         """Retrieve the value for a given key from the cache if it's valid."""
@@ -179,10 +416,15 @@ class Cache:
                 self._cache_strategy.on_access(key, self._meta)
                 return self._cache[key]
             else:
+                if self._cache_strategy.can_serve_stale(meta_value):
+                    # Keep the expired entry around so it can be served if
+                    # refetching fails, see `get_stale_value`
+                    raise MissingCacheKeyError(key)
+
                 value = self._cache_strategy.on_invalidation(key, self)
 
-                del self._cache[key]
-                del self._meta[key]
+                # Drops its tags and the strategy's state along with it
+                self.evict(key)
 
                 # If we have a default value returned by on_validation, return it
                 if value:
@@ -192,6 +434,27 @@ class Cache:
         else:
             raise MissingCacheKeyError(key)
 
+    def get_stale_value(self, key: str) -> Any:
+        """
+        Retrieve an expired value that the strategy still allows serving.
+
+        Used as a fallback when refetching an expired entry fails.
+
+        Raises:
+            MissingCacheKeyError: If the key is absent or too stale to serve.
+        """
+        if key in self._cache and self._cache_strategy.can_serve_stale(
+            self._meta[key]
+        ):
+            return self._cache[key]
+        raise MissingCacheKeyError(key)
+
+    def needs_refresh(self, key: str) -> bool:
+        """Check if a cached key should be refreshed ahead of its expiry."""
+        return key in self._meta and self._cache_strategy.needs_refresh(
+            self._meta[key]
+        )
+
     def is_valid(self, key: str) -> bool:
         """Check if a key is present and valid in the cache."""
         return key in self._cache and self._cache_strategy.is_valid(
@@ -201,3 +464,75 @@ class Cache:
     def get_metadata(self, key: str) -> Optional[Any]:
         """Get metadata associated with a given cache key."""
         return self._meta.get(key, None)
+
+    def evict(self, key: str) -> None:
+        """Remove an entry and its metadata from the cache, if present."""
+        self._negative.pop(key, None)
+        self._untag(key)
+        self._cache.pop(key, None)
+        self._meta.pop(key, None)
+        self._cache_strategy.on_eviction(key)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache and reset the strategy state."""
+        self._backend.clear()
+        self._negative.clear()
+        self._key_tags.clear()
+        self._tag_keys.clear()
+        self._cache_strategy._reset_state()
+
+    def set_negative(
+        self,
+        key: str,
+        ttl: float,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Remember a miss or a failed fetch for a given key.
+
+        Args:
+            key (str): The cache key.
+            ttl (float): How long, in seconds, the negative entry stays valid.
+            value (Any, optional): The negative value to serve, such as a not found response.
+            error (BaseException, optional): The exception to raise again instead.
+            tags (Iterable[str]): Tags to invalidate the entry by.
+        """
+        self._negative[key] = (time.monotonic() + ttl, value, error)
+        self._tag(key, tags)
+
+    def get_negative(self, key: str) -> Tuple[Any, Optional[BaseException]]:
+        """
+        Retrieve a remembered miss or failed fetch for a given key.
+
+        Returns:
+            Tuple[Any, Optional[BaseException]]: The negative value and the exception, if any.
+
+        Raises:
+            MissingCacheKeyError: If no valid negative entry exists for the key.
+        """
+        entry = self._negative.get(key)
+        if entry is None:
+            raise MissingCacheKeyError(key)
+
+        expiry, value, error = entry
+        if time.monotonic() >= expiry:
+            self._negative.pop(key, None)
+            if key not in self._cache:
+                self._untag(key)
+            raise MissingCacheKeyError(key)
+
+        return value, error
+
+    def fill_lock(self, key: Optional[str] = None) -> ContextManager:
+        """
+        Serialize fetches that fill a missing entry, see `AbstractCacheBackend.fill_lock`.
+
+        Args:
+            key (str, optional): The key of the missing entry.
+
+        Returns:
+            ContextManager: A context manager holding the backend's fill lock for the key.
+        """
+        return self._backend.fill_lock(key)
@@ -0,0 +1,676 @@
+"""
+This module provides the storage backends that hold cache entries for `Cache`.
+
+A backend exposes two mutable mappings, one for the cached values and one for
+the metadata written by the cache strategy. Because strategies only ever use
+mapping operations on the metadata, every strategy works on top of every backend.
+
+Classes:
+    AbstractCacheBackend: An abstract base class defining the interface for cache backends.
+    InMemoryCacheBackend: A backend keeping entries in process-local dictionaries.
+    SQLiteCacheBackend: A persistent backend storing serialized entries in a SQLite database.
+    SharedMemoryCacheBackend: A backend sharing serialized entries between forked worker processes.
+
+Usage Example:
+    from fastcfg.cache import Cache
+    from fastcfg.cache.backends import SQLiteCacheBackend
+    from fastcfg.cache.policies import TEN_MIN_TTL
+
+    # Entries survive restarts and are shared by every process using the file
+    cache = Cache(TEN_MIN_TTL, backend=SQLiteCacheBackend("/tmp/fastcfg.db"))
+"""
+
+import contextlib
+import os
+import pickle
+import sqlite3
+import stat
+import struct
+import tempfile
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from multiprocessing import resource_tracker, shared_memory
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Tuple,
+)
+
+from fastcfg.exceptions import MissingDependencyError
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class AbstractCacheBackend(ABC):
+    """
+    An abstract base class that defines the interface for cache backends.
+
+    Attributes:
+        values (MutableMapping[str, Any]): The cached values by key.
+        meta (MutableMapping[str, Any]): The strategy metadata by key.
+
+    Methods:
+        - clear() -> None: Remove every value and metadata entry.
+        - close() -> None: Release any resources held by the backend.
+        - fill_lock(key: str) -> ContextManager: Serialize fetches that fill a missing entry.
+    """
+
+    def __init__(self):
+        self._reset_fill_locks()
+
+    def _reset_fill_locks(self) -> None:
+        # By key: [lock, number of callers holding or waiting for it]
+        self._fill_locks: Dict[Any, List[Any]] = {}
+        self._fill_locks_guard = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_fill_locks"]
+        del state["_fill_locks_guard"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._reset_fill_locks()
+
+    @property
+    @abstractmethod
+    def values(self) -> MutableMapping[str, Any]:
+        """The cached values by key."""
+
+    @property
+    @abstractmethod
+    def meta(self) -> MutableMapping[str, Any]:
+        """The strategy metadata by key."""
+
+    def clear(self) -> None:
+        """Remove every value and metadata entry."""
+        self.values.clear()
+        self.meta.clear()
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+    @contextlib.contextmanager
+    def fill_lock(self, key: Any = None) -> Iterator[None]:
+        """
+        Serialize fetches that fill a missing entry.
+
+        Whoever holds the lock fetches the missing value while everyone else
+        waits and then reads it from the cache instead of fetching it again.
+        The default lock covers the threads of the current process, one lock
+        per key, so misses on unrelated keys are fetched concurrently. Backends
+        shared between processes extend it across them.
+
+        Args:
+            key (Any): The key of the missing entry.
+
+        Yields:
+            None: While the lock is held.
+        """
+        with self._fill_locks_guard:
+            entry = self._fill_locks.get(key)
+            if entry is None:
+                entry = self._fill_locks[key] = [threading.RLock(), 0]
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._fill_locks_guard:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._fill_locks[key]
+
+
+class InMemoryCacheBackend(AbstractCacheBackend):
+    """
+    A backend keeping entries in process-local dictionaries.
+
+    This is the default backend of `Cache`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._values: Dict[str, Any] = {}
+        self._meta: Dict[str, Any] = {}
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        return self._values
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self._meta
+
+
+class _SQLiteMapping(MutableMapping):
+    """A mutable mapping view over one kind of entry in the SQLite cache table."""
+
+    def __init__(self, backend: "SQLiteCacheBackend", kind: str):
+        self._backend = backend
+        self._kind = kind
+
+    def _execute(self, sql: str, *params: Any) -> list:
+        return self._backend._execute(
+            sql, self._backend.namespace, self._kind, *params
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        rows = self._execute(
+            "SELECT data FROM fastcfg_cache"
+            " WHERE namespace = ? AND kind = ? AND key = ?",
+            key,
+        )
+        if not rows:
+            raise KeyError(key)
+        return pickle.loads(rows[0][0])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO fastcfg_cache (namespace, kind, key, data)"
+            " VALUES (?, ?, ?, ?)",
+            key,
+            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._execute(
+            "DELETE FROM fastcfg_cache"
+            " WHERE namespace = ? AND kind = ? AND key = ?",
+            key,
+        )
+
+    def __contains__(self, key: object) -> bool:
+        rows = self._execute(
+            "SELECT 1 FROM fastcfg_cache"
+            " WHERE namespace = ? AND kind = ? AND key = ?",
+            key,
+        )
+        return bool(rows)
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._execute(
+            "SELECT key FROM fastcfg_cache WHERE namespace = ? AND kind = ?"
+        )
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        rows = self._execute(
+            "SELECT COUNT(*) FROM fastcfg_cache"
+            " WHERE namespace = ? AND kind = ?"
+        )
+        return rows[0][0]
+
+    def clear(self) -> None:
+        self._execute(
+            "DELETE FROM fastcfg_cache WHERE namespace = ? AND kind = ?"
+        )
+
+
+class SQLiteCacheBackend(AbstractCacheBackend):
+    """
+    A persistent backend storing serialized entries in a SQLite database.
+
+    Purpose:
+        - Lets worker restarts and serverless cold starts reuse values fetched by
+          earlier processes instead of refetching every remote value.
+        - Values and strategy metadata (such as TTL deadlines) are pickled, so any
+          picklable value can be cached.
+
+    Several caches can share one database file by using different namespaces.
+    Remember to give the cache entries stable keys (for live state trackers, pass
+    `cache_key`) so a restarted process looks up the same entries.
+
+    Attributes:
+        namespace (str): The namespace isolating this backend's entries in the database.
+    """
+
+    def __init__(self, path: os.PathLike, namespace: str = "default"):
+        """
+        Initialize the backend, creating the database file and table if needed.
+
+        Args:
+            path (os.PathLike): The path of the SQLite database file.
+            namespace (str): The namespace isolating this backend's entries. Defaults to "default".
+        """
+        super().__init__()
+        self.namespace = namespace
+        self._lock = threading.Lock()
+
+        # Autocommit mode, each statement is its own transaction
+        self._connection = sqlite3.connect(
+            os.fspath(path), check_same_thread=False, isolation_level=None
+        )
+
+        with self._lock:
+            # WAL lets readers in other processes proceed while one writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS fastcfg_cache ("
+                " namespace TEXT NOT NULL,"
+                " kind TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " data BLOB NOT NULL,"
+                " PRIMARY KEY (namespace, kind, key))"
+            )
+
+        self._values = _SQLiteMapping(self, "value")
+        self._meta = _SQLiteMapping(self, "meta")
+
+    def _execute(self, sql: str, *params: Any) -> list:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    @property
+    def values(self) -> MutableMapping[str, Any]:
+        return self._values
+
+    @property
+    def meta(self) -> MutableMapping[str, Any]:
+        return self._meta
+
+    def clear(self) -> None:
+        """Remove every value and metadata entry in this namespace."""
+        self._execute(
+            "DELETE FROM fastcfg_cache WHERE namespace = ?", self.namespace
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class _SharedMemoryMapping(MutableMapping):
+    """A mutable mapping view over one kind of entry in the shared segment."""
+
+    def __init__(self, backend: "SharedMemoryCacheBackend", kind: str):
+        self._backend = backend
+        self._kind = kind
+
+    def _keys(self) -> Dict[str, Tuple[int, int]]:
+        return self._backend._read_index()[self._kind]
+
+    def __getitem__(self, key: str) -> Any:
+        return self._backend._get(self._kind, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._backend._set(self._kind, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self._backend._delete(self._kind, key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys()))
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def clear(self) -> None:
+        self._backend._clear_kind(self._kind)
+
+
+def _private_lock_dir() -> str:
+    """A directory in the temporary directory that only the current user can write to."""
+    path = os.path.join(tempfile.gettempdir(), f"fastcfg-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+
+    info = os.lstat(path)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"Lock directory '{path}' is not a private directory of the current user."
+        )
+    return path
+
+
+def _open_lock_file(path: str):
+    """Open a lock file for this user only, refusing to follow a symlink."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    return os.fdopen(fd, "r+b")
+
+
+def _empty_index() -> Dict[str, Dict[str, Tuple[int, int]]]:
+    return {"values": {}, "meta": {}}
+
+
+class SharedMemoryCacheBackend(AbstractCacheBackend):
+    """
+    A backend sharing serialized entries between forked worker processes.
+
+    Purpose:
+        - Lets pre-forked workers (e.g. gunicorn) share cached values, so a remote
+          document is fetched once for the whole host instead of once per worker
+          and kept in memory once instead of once per worker.
+        - Combined with `fill_lock`, the first worker to miss fetches the value
+          while the others wait and then read it from shared memory.
+
+    How it Works:
+        - The segment starts with a header holding a generation counter, the end
+          of the data area and the length of the index stored right after it.
+        - Each value and metadata entry is pickled on its own into a slice of
+          the data area. The index maps every key to the offset and length of
+          its slice.
+        - Readers take a shared lock on a lock file, and only unpickle the index
+          again when the generation changed since their last read. Reading an
+          entry unpickles its slice alone, straight from the shared buffer, so
+          workers keep no copy of the cached values between reads.
+        - Writers take an exclusive lock, append the new slice, write the index
+          after it and bump the generation. Replaced and removed slices are
+          reclaimed by compacting the data area once the segment is full.
+        - Each process opens its own lock files, reopened after a fork, so a
+          backend created before forking (e.g. with gunicorn `--preload`) still
+          excludes the workers from each other.
+
+    A write pickles the new entry and the index of keys, not the other entries.
+    Every read of a value unpickles it, which suits large documents read a few
+    times per request better than tiny values read in hot loops.
+
+    Caches are keyed per process by default, so give live trackers a stable
+    `cache_key` for the workers to find each other's entries. The segment is
+    not removed when a process exits; call `unlink` once no worker needs it.
+
+    Attributes:
+        name (str): The name of the shared memory segment.
+        generation (int): The number of writes made to the segment so far.
+    """
+
+    # Generation, end of the data area, length of the index
+    _HEADER = struct.Struct("QQQ")
+
+    def __init__(
+        self,
+        name: str,
+        size: int = 16 * 1024 * 1024,
+        lock_path: os.PathLike = None,
+    ):
+        """
+        Initialize the backend, creating the shared memory segment if needed.
+
+        Args:
+            name (str): The name of the shared memory segment, identical in every worker.
+            size (int): The size of the segment in bytes, used when creating it. Defaults to 16 MiB.
+            lock_path (os.PathLike, optional): The path of the lock file. Defaults to a file
+                named after the segment, in a directory of the temporary directory
+                private to the current user.
+
+        Raises:
+            MissingDependencyError: If the platform lacks `fcntl` file locking.
+            PermissionError: If the default lock directory belongs to another user.
+        """
+        if fcntl is None:
+            raise MissingDependencyError("fcntl")
+
+        super().__init__()
+        self.name = name
+
+        try:
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=size
+            )
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        # Python's resource tracker would unlink the segment as soon as the
+        # process that created or attached it exits, pulling it from under
+        # the other workers, so its lifetime is managed by `unlink` instead
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        self._lock_path = os.fspath(
+            lock_path
+            or os.path.join(_private_lock_dir(), f"fastcfg-{name}.lock")
+        )
+        self._lock_file = None
+        self._fill_lock_file = None
+        self._open_lock_files()
+        _fork_safe_backends.add(self)
+
+        self._generation_seen = -1
+        self._index = _empty_index()
+
+        self._values = _SharedMemoryMapping(self, "values")
+        self._meta = _SharedMemoryMapping(self, "meta")
+
+    def _open_lock_files(self) -> None:
+        """
+        Open the lock files for the current process.
+
+        A flock belongs to the open file description, which forked processes
+        share, so each process must open the files itself to be excluded from
+        the others. Threads take a lock of their own first, since they share
+        the process's description. Reads and writes of the segment use a
+        different lock than fills, so cached reads don't wait for a fetch.
+        """
+        for file in (self._lock_file, self._fill_lock_file):
+            if file is not None:
+                file.close()
+
+        self._lock_file = _open_lock_file(self._lock_path)
+        self._fill_lock_file = _open_lock_file(f"{self._lock_path}.fill")
+        self._thread_lock = threading.RLock()
+        self._fill_thread_lock = threading.RLock()
+
+    @contextlib.contextmanager
+    def _locked(self, file, thread_lock, operation: int):
+        with thread_lock:
+            fcntl.flock(file.fileno(), operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    @property
+    def generation(self) -> int:
+        """The number of writes made to the segment so far."""
+        generation, _, _ = self._HEADER.unpack_from(self._shm.buf, 0)
+        return generation
+
+    def _data_end(self) -> int:
+        _, data_end, _ = self._HEADER.unpack_from(self._shm.buf, 0)
+        # Zero in a segment that was never written
+        return data_end or self._HEADER.size
+
+    def _load_index(self) -> Dict[str, Dict[str, Tuple[int, int]]]:
+        """Return the current index, unpickling it only if it changed."""
+        generation, data_end, index_length = self._HEADER.unpack_from(
+            self._shm.buf, 0
+        )
+
+        if generation != self._generation_seen:
+            if index_length:
+                with self._shm.buf[
+                    data_end : data_end + index_length
+                ] as payload:
+                    self._index = pickle.loads(payload)
+            else:
+                self._index = _empty_index()
+            self._generation_seen = generation
+
+        return self._index
+
+    def _read_index(self) -> Dict[str, Dict[str, Tuple[int, int]]]:
+        with self._locked(self._lock_file, self._thread_lock, fcntl.LOCK_SH):
+            return self._load_index()
+
+    def _get(self, kind: str, key: str) -> Any:
+        with self._locked(self._lock_file, self._thread_lock, fcntl.LOCK_SH):
+            offset, length = self._load_index()[kind][key]
+            # Unpickle straight from the shared buffer without copying it
+            with self._shm.buf[offset : offset + length] as payload:
+                return pickle.loads(payload)
+
+    def _copy_index(self) -> Dict[str, Dict[str, Tuple[int, int]]]:
+        return {kind: dict(keys) for kind, keys in self._load_index().items()}
+
+    def _publish(
+        self, index: Dict[str, Dict[str, Tuple[int, int]]], data_end: int
+    ) -> None:
+        """
+        Write the index after the data area and bump the generation.
+
+        Raises:
+            ValueError: If the index does not fit in the segment.
+        """
+        payload = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+        self._check_fits(data_end + len(payload))
+
+        self._shm.buf[data_end : data_end + len(payload)] = payload
+        generation = self.generation + 1
+        self._HEADER.pack_into(
+            self._shm.buf, 0, generation, data_end, len(payload)
+        )
+
+        self._index = index
+        self._generation_seen = generation
+
+    def _check_fits(self, end: int) -> None:
+        if end > self._shm.size:
+            raise ValueError(
+                f"Cache entries of {end} bytes do not fit in "
+                f"shared memory segment '{self.name}' of {self._shm.size} bytes."
+            )
+
+    def _compact(self, index: Dict[str, Dict[str, Tuple[int, int]]]) -> int:
+        """
+        Move the live slices to the start of the data area, updating the index.
+
+        Returns:
+            int: The new end of the data area.
+        """
+        slices = [
+            (kind, key, bytes(self._shm.buf[offset : offset + length]))
+            for kind, keys in index.items()
+            for key, (offset, length) in keys.items()
+        ]
+
+        offset = self._HEADER.size
+        for kind, key, data in slices:
+            self._shm.buf[offset : offset + len(data)] = data
+            index[kind][key] = (offset, len(data))
+            offset += len(data)
+        return offset
+
+    def _set(self, kind: str, key: str, value: Any) -> None:
+        """
+        Store an entry in a new slice.
+
+        Raises:
+            ValueError: If the entry does not fit in the segment, even once compacted.
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._locked(self._lock_file, self._thread_lock, fcntl.LOCK_EX):
+            index = self._copy_index()
+            index[kind].pop(key, None)
+            data_end = self._data_end()
+
+            # Leave room for the index, which grows by about one key
+            index_room = len(pickle.dumps(index)) + len(key) + 64
+            if data_end + len(data) + index_room > self._shm.size:
+                data_end = self._compact(index)
+                self._check_fits(data_end + len(data) + index_room)
+
+            self._shm.buf[data_end : data_end + len(data)] = data
+            index[kind][key] = (data_end, len(data))
+            self._publish(index, data_end + len(data))
+
+    def _delete(self, kind: str, key: str) -> bool:
+        """Remove an entry, returning whether it existed."""
+        with self._locked(self._lock_file, self._thread_lock, fcntl.LOCK_EX):
+            if key not in self._load_index()[kind]:
+                return False
+            index = self._copy_index()
+            del index[kind][key]
+            self._publish(index, self._data_end())
+            return True
+
+    def _clear_kind(self, *kinds: str) -> None:
+        with self._locked(self._lock_file, self._thread_lock, fcntl.LOCK_EX):
+            index = self._copy_index()
+            for kind in kinds or tuple(index):
+                index[kind].clear()
+            if not any(index.values()):
+                # Nothing left to keep, the data area starts over
+                self._publish(index, self._HEADER.size)
+            else:
+                self._publish(index, self._data_end())
+
+    @property
+    def values(self) -> MutableMapping[str, Any]:
+        return self._values
+
+    @property
+    def meta(self) -> MutableMapping[str, Any]:
+        return self._meta
+
+    def clear(self) -> None:
+        """Remove every value and metadata entry for every worker."""
+        self._clear_kind()
+
+    @contextlib.contextmanager
+    def fill_lock(self, key: Any = None):
+        """
+        Serialize fetches that fill missing entries across every worker.
+
+        A single lock covers every key: flocks taken by the threads of a process
+        on the same file would not exclude each other.
+
+        Yields:
+            None: While this process holds the lock.
+        """
+        with self._locked(
+            self._fill_lock_file, self._fill_thread_lock, fcntl.LOCK_EX
+        ):
+            yield
+
+    def close(self) -> None:
+        """Detach from the shared memory segment and close the lock files."""
+        _fork_safe_backends.discard(self)
+        self._index = _empty_index()
+        self._shm.close()
+        self._lock_file.close()
+        self._fill_lock_file.close()
+
+    def unlink(self) -> None:
+        """Remove the shared memory segment once no worker needs it anymore."""
+        # `SharedMemory.unlink` unregisters the segment from the resource
+        # tracker, which fails unless it is registered again first
+        resource_tracker.register(self._shm._name, "shared_memory")
+        self._shm.unlink()
+
+
+# Backends whose lock files must be reopened in forked children
+_fork_safe_backends: "weakref.WeakSet[SharedMemoryCacheBackend]" = (
+    weakref.WeakSet()
+)
+
+
+def _reopen_lock_files_after_fork() -> None:
+    for backend in list(_fork_safe_backends):
+        backend._open_lock_files()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_lock_files_after_fork)
@@ -6,21 +6,48 @@ Attributes:
     duration of 10 minutes.
     ONE_HOUR_TTL (TTLCacheStrategy): A TTL (Time-To-Live) cache strategy with a duration of 1 hour.
     DAILY_TTL (TTLCacheStrategy): A TTL (Time-To-Live) cache strategy with a duration of 1 day.
+    JITTERED_TEN_MIN_TTL (JitteredTTLCacheStrategy): A TTL cache strategy with a
+    nominal duration of 10 minutes, randomized by up to 10% and refreshed ahead
+    of expiry, so processes started together do not expire entries together.
+    ADAPTIVE_TTL (AdaptiveTTLCacheStrategy): A TTL cache strategy starting at 10
+    minutes per key, growing up to 1 day for values that don't change and
+    shrinking down to 30 seconds for values that do.
     LRU_POLICY (LRUCacheStrategy): A Least Recently Used (LRU) cache strategy 
     with a default capacity of 100 entries.
     MRU_POLICY (MRUCacheStrategy): A Most Recently Used (MRU) cache strategy
     with a default capacity of 100 entries.
+    TINY_LFU_POLICY (WTinyLFUCacheStrategy): A scan-resistant W-TinyLFU cache
+    strategy with a default capacity of 100 entries.
+    ARC_POLICY (ARCCacheStrategy): An Adaptive Replacement Cache strategy with a
+    default capacity of 100 entries.
+    BYTE_BUDGET_POLICY (ByteBudgetCacheStrategy): A size-aware LRU cache strategy
+    with a default budget of 64 MiB of cached values.
+
+Every `Cache` binds its own copy of the policy it is given, so these shared
+instances never leak eviction state between caches.
 """
 
 from fastcfg.cache.strategies import (
+    AdaptiveTTLCacheStrategy,
+    ARCCacheStrategy,
+    ByteBudgetCacheStrategy,
+    JitteredTTLCacheStrategy,
     LRUCacheStrategy,
     MRUCacheStrategy,
     TTLCacheStrategy,
+    WTinyLFUCacheStrategy,
 )
 
 TEN_MIN_TTL = TTLCacheStrategy(seconds=60 * 10)
 ONE_HOUR_TTL = TTLCacheStrategy(seconds=60 * 60)
 DAILY_TTL = TTLCacheStrategy(seconds=60 * 60 * 24)
+JITTERED_TEN_MIN_TTL = JitteredTTLCacheStrategy(seconds=60 * 10, jitter=0.1)
+ADAPTIVE_TTL = AdaptiveTTLCacheStrategy(
+    min_seconds=30, max_seconds=60 * 60 * 24, initial_seconds=60 * 10
+)
 
 LRU_POLICY = LRUCacheStrategy(capacity=100)
 MRU_POLICY = MRUCacheStrategy(capacity=100)
+TINY_LFU_POLICY = WTinyLFUCacheStrategy(capacity=100)
+ARC_POLICY = ARCCacheStrategy(capacity=100)
+BYTE_BUDGET_POLICY = ByteBudgetCacheStrategy(max_bytes=64 * 1024 * 1024)
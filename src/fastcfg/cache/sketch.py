@@ -0,0 +1,122 @@
+"""
+This module provides a compact frequency sketch used by admission-based cache
+strategies.
+
+Classes:
+    CountMinSketch: A count-min sketch with small saturating counters and periodic aging.
+"""
+
+from typing import Hashable, List, Optional
+
+# Counters saturate at this value, mirroring the 4-bit counters of TinyLFU
+MAX_COUNT = 15
+
+# Translation table that halves every counter in a single pass
+_HALVE = bytes(i >> 1 for i in range(256))
+
+_MASK = (1 << 64) - 1
+
+# Odd 64-bit multipliers, one per row, used to derive independent indexes
+_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD,
+    0xC4CEB9FE1A85EC53,
+    0x94D049BB133111EB,
+    0xBF58476D1CE4E5B9,
+)
+
+
+class CountMinSketch:
+    """
+    A count-min sketch that estimates how often keys have been seen.
+
+    Purpose:
+        - Tracks approximate access frequencies in a fixed amount of memory, including
+          for keys that are no longer (or not yet) cached.
+        - Periodically halves every counter so the estimates favour recent history.
+
+    Attributes:
+        _width (int): The number of counters per row.
+        _rows (List[bytearray]): The counter rows, one per hash function.
+        _sample_size (int): The number of increments between two aging passes.
+
+    Methods:
+        increment(key): Record one occurrence of a key.
+        frequency(key): Estimate how often a key has been seen.
+        reset(): Forget every recorded occurrence.
+    """
+
+    def __init__(
+        self, width: int, depth: int = 4, sample_size: Optional[int] = None
+    ):
+        """
+        Initialize the sketch.
+
+        Args:
+            width (int): The number of counters per row, typically a few times the cache capacity.
+            depth (int): The number of rows (hash functions), at most 8. Defaults to 4.
+            sample_size (int, optional): The number of increments between two aging
+                passes. Defaults to ten times the width.
+        """
+        self._width = max(1, width)
+        self._depth = min(depth, len(_SEEDS))
+        self._sample_size = sample_size or 10 * self._width
+        self._rows: List[bytearray] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every recorded occurrence."""
+        self._rows = [bytearray(self._width) for _ in range(self._depth)]
+        self._additions = 0
+
+    def _indexes(self, key: Hashable) -> List[int]:
+        h = hash(key) & _MASK
+        indexes = []
+        for seed in _SEEDS[: self._depth]:
+            # Multiplicative hashing, folding the high bits into the low ones
+            x = (h * seed) & _MASK
+            indexes.append((x ^ (x >> 32)) % self._width)
+        return indexes
+
+    def increment(self, key: Hashable) -> None:
+        """
+        Record one occurrence of a key.
+
+        Uses a conservative update: only the counters holding the current
+        minimum are incremented, which keeps over-estimation low.
+
+        Args:
+            key (Hashable): The key that was seen.
+        """
+        indexes = self._indexes(key)
+        current = min(row[i] for row, i in zip(self._rows, indexes))
+
+        if current < MAX_COUNT:
+            for row, i in zip(self._rows, indexes):
+                if row[i] == current:
+                    row[i] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def frequency(self, key: Hashable) -> int:
+        """
+        Estimate how often a key has been seen.
+
+        Args:
+            key (Hashable): The key to look up.
+
+        Returns:
+            int: The estimated number of occurrences, saturating at `MAX_COUNT`.
+        """
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        """Halve every counter so older occurrences weigh less."""
+        for row in self._rows:
+            row[:] = row.translate(_HALVE)
+        self._additions //= 2
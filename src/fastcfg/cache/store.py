@@ -2,7 +2,7 @@
 This module provides a global store for managing multiple cache instances.
 
 Classes:
-    CacheStore: A class that provides a centralized store for cache instances, allowing for adding, retrieving, and clearing caches globally.
+    CacheStore: A class that provides a centralized store for cache instances, allowing for adding, retrieving, clearing and invalidating caches globally.
 
 Global Variables:
     cache_store (CacheStore): A global instance of the CacheStore class for managing cache instances.
@@ -23,9 +23,13 @@ Usage Example:
 
     # Clear all caches
     cache_store.clear_all_caches()
+
+    # Drop every entry tagged by the AppConfig trackers
+    cache_store.invalidate(tag="appconfig")
 """
 
-from typing import TYPE_CHECKING, Optional
+import weakref
+from typing import TYPE_CHECKING, Dict, Optional
 
 if TYPE_CHECKING:
     from fastcfg.cache import Cache
@@ -40,19 +44,31 @@ class CacheStore:
     Purpose:
         - This class provides a centralized store for cache instances.
         - It allows for adding, retrieving, and clearing caches globally.
+        - It indexes which caches hold entries with a given tag, so tagged
+          entries can be invalidated without visiting every cache.
+
+    Caches are held weakly: a cache that is no longer used anywhere else, for
+    example because its `LiveConfigItem` was dropped, is freed along with its
+    entries and disappears from the store.
 
     Attributes:
-        _caches (set): A set to store cache instances.
+        _caches (weakref.WeakValueDictionary): The cache instances by name.
+        _tags (Dict[str, weakref.WeakSet]): The caches holding entries with each tag.
 
     Methods:
         add_cache(cache): Adds a cache instance to the global store.
         clear_all_caches(): Clears all caches in the global store.
         clear_cache(cache_name): Clears a specific cache by name.
         get_cache(cache_name): Retrieves a specific cache by name.
+        index_tag(cache, tag): Records that a cache holds entries with a tag.
+        invalidate(tag): Evicts every entry with a tag from every cache.
     """
 
     def __init__(self):
-        self._caches = {}
+        self._caches: "weakref.WeakValueDictionary[str, Cache]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._tags: Dict[str, "weakref.WeakSet[Cache]"] = {}
 
     def add_cache(self, cache: Cache):
         """
@@ -77,7 +93,8 @@ class CacheStore:
         """
         Clears all caches globally.
         """
-        for cache in self._caches.values():
+        # Copy first, caches may be collected while iterating
+        for cache in list(self._caches.values()):
             cache.clear()
 
     def clear_cache(self, cache_name: str):
@@ -87,8 +104,9 @@ class CacheStore:
         Args:
             cache_name (str): The name of the cache to clear.
         """
-        if cache_name in self._caches:
-            self._caches[cache_name].clear()
+        cache = self._caches.get(cache_name)
+        if cache is not None:
+            cache.clear()
 
     def get_cache(self, cache_name: str) -> Optional[Cache]:
         """
@@ -102,6 +120,38 @@ class CacheStore:
         """
         return self._caches.get(cache_name)
 
+    def index_tag(self, cache: Cache, tag: str):
+        """
+        Records that a cache holds entries with a tag.
+
+        Called by `Cache` when it first stores an entry with the tag.
+
+        Args:
+            cache (Cache): The cache holding the tagged entries.
+            tag (str): The tag.
+        """
+        caches = self._tags.get(tag)
+        if caches is None:
+            caches = self._tags[tag] = weakref.WeakSet()
+        caches.add(cache)
+
+    def invalidate(self, tag: str) -> int:
+        """
+        Evicts every entry with a tag from every cache.
+
+        Only the caches that stored entries with the tag are visited.
+
+        Args:
+            tag (str): The tag to invalidate, such as a source type or a host.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        caches = self._tags.pop(tag, None)
+        if caches is None:
+            return 0
+        return sum(cache.invalidate_tag(tag) for cache in list(caches))
+
 
 # Global instance of CacheStore
 cache_store = CacheStore()
@@ -11,6 +11,23 @@ Classes:
             - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Set the TTL for a cache entry upon insertion.
             - on_invalidation(key: str, cache: Cache) -> None: Perform any invalidation cleanup for a given cache key.
 
+    AdaptiveTTLCacheStrategy (TTLCacheStrategy): A TTL cache strategy that lengthens the TTL of keys whose value rarely changes and shortens it for volatile keys.
+        - Methods:
+            - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Compare the value with the previous one and adapt the key's TTL.
+            - current_ttl(key: str) -> float: Get the TTL currently used for a key.
+
+    SoftTTLCacheStrategy (ICacheStrategy): A cache strategy with a soft TTL that flags entries for refresh, a hard TTL that forces a refetch, and a stale-if-error window.
+        - Methods:
+            - is_valid(meta_value: Optional[Tuple[float, float, float]]) -> bool: Check if the hard TTL has not passed yet.
+            - needs_refresh(meta_value: Optional[Tuple[float, float, float]]) -> bool: Check if the soft TTL has passed.
+            - can_serve_stale(meta_value: Optional[Tuple[float, float, float]]) -> bool: Check if the value is still within the maximum staleness.
+
+    JitteredTTLCacheStrategy (ICacheStrategy): A TTL cache strategy that randomizes each entry's lifetime and refreshes entries probabilistically ahead of expiry.
+        - Methods:
+            - is_valid(meta_value: Optional[Tuple[float, float]]) -> bool: Check if the jittered TTL has not passed yet.
+            - needs_refresh(meta_value: Optional[Tuple[float, float]]) -> bool: Decide whether to refresh the entry early.
+            - record_cost(key: str, cost: float) -> None: Remember how long fetching the value took.
+
     LRUCacheStrategy (IUsageCacheStrategy): A cache strategy that evicts the least recently used (LRU) entries when capacity is exceeded.
         - Methods:
             - on_access(key: str, meta: Dict[str, Any]) -> None: Update the access order to mark the key as most recently used.
@@ -20,12 +37,88 @@ Classes:
         - Methods:
             - on_access(key: str, meta: Dict[str, Any]) -> None: Update the access order to mark the key as most recently used.
             - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Handle insertion and evict if necessary.
+
+    ByteBudgetCacheStrategy (LRUCacheStrategy): A cache strategy that evicts the least recently used entries once the approximate size of the cached values exceeds a byte budget.
+        - Methods:
+            - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Record the entry size and evict until the cache fits the budget.
+            - on_eviction(key: str) -> None: Release the size accounted to an evicted entry.
+
+    WTinyLFUCacheStrategy (AbstractCacheStrategy): A scan-resistant strategy that admits entries into the main cache only if they are used more often than the entry they would replace.
+        - Methods:
+            - on_access(key: str, meta: Dict[str, Any]) -> None: Record the access and promote the entry.
+            - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Place the entry in the admission window and run admission.
+
+    CostAwareWTinyLFUCacheStrategy (WTinyLFUCacheStrategy): A W-TinyLFU strategy that weights access frequency by the observed fetch latency.
+        - Methods:
+            - record_cost(key: str, cost: float) -> None: Track the fetch latency of a key.
+
+    ARCCacheStrategy (AbstractCacheStrategy): An adaptive replacement cache balancing recency and frequency with ghost lists.
+        - Methods:
+            - on_access(key: str, meta: Dict[str, Any]) -> None: Promote the entry to the frequent list.
+            - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Adapt the target size and evict if necessary.
+
+Functions:
+    approximate_size(value: Any) -> int: Estimate the memory footprint of a value in bytes.
+    fingerprint(value: Any) -> bytes: Compute a short digest identifying a value.
 """
 
+import hashlib
+import itertools
+import math
+import pickle
+import random
+import sys
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from fastcfg.cache import AbstractCacheStrategy, AbstractUsageCacheStrategy, Cache
+from fastcfg.cache.sketch import CountMinSketch
+from fastcfg.clock import CoarseClock
+
+# Types whose size is fully accounted for by `sys.getsizeof`
+_ATOMIC_TYPES = (str, bytes, bytearray, memoryview, int, float, bool, complex)
+
+
+def approximate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a value in bytes.
+
+    Containers and object attributes are walked recursively and shared objects
+    are only counted once. The result is an approximation meant for budgeting,
+    not an exact accounting of the interpreter's allocations.
+
+    Args:
+        value (Any): The value to measure.
+
+    Returns:
+        int: The approximate size of the value in bytes.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, _ATOMIC_TYPES):
+            continue
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+
+    return total
 
 
 class TTLCacheStrategy(AbstractCacheStrategy):
@@ -34,22 +127,26 @@ class TTLCacheStrategy(AbstractCacheStrategy):
 
     Attributes:
         _seconds (int): The TTL value in seconds.
+        _clock (CoarseClock): The clock to read instead of `time.time()`, if any.
 
     Methods:
-        - __init__(seconds: int): Initialize the strategy with a TTL value.
+        - __init__(seconds: int, clock: Optional[CoarseClock]): Initialize the strategy with a TTL value.
         - is_valid(meta_value: Optional[float]) -> bool: Check if the cache entry is still valid based on the TTL.
         - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Set the TTL for a cache entry upon insertion.
         - on_invalidation(key: str, cache: Cache) -> None: Perform any invalidation cleanup for a given cache key.
     """
 
-    def __init__(self, seconds: int):
+    def __init__(self, seconds: int, clock: Optional[CoarseClock] = None):
         """
         Initialize the strategy with a TTL value.
 
         Args:
             seconds (int): The TTL value in seconds.
+            clock (CoarseClock, optional): A coarse clock to read the time from,
+                which is cheaper than `time.time()` for frequently read entries.
         """
         self._seconds = seconds
+        self._clock = clock
 
     def is_valid(self, meta_value: Optional[float]) -> bool:
         """
@@ -61,7 +158,10 @@ class TTLCacheStrategy(AbstractCacheStrategy):
         Returns:
             bool: True if the entry is still valid, False otherwise.
         """
-        return meta_value is not None and time.time() < meta_value
+        if meta_value is None:
+            return False
+        clock = self._clock
+        return (time.time() if clock is None else clock.now) < meta_value
 
     def on_insertion(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
         """
@@ -72,7 +172,7 @@ class TTLCacheStrategy(AbstractCacheStrategy):
             value (Any): The cache value.
             meta (Dict[str, Any]): The metadata dictionary.
         """
-        meta[key] = time.time() + self._seconds
+        meta[key] = self._now() + self._seconds
 
     def on_invalidation(self, key: str, cache: Cache) -> None:
         """
@@ -85,6 +185,383 @@ class TTLCacheStrategy(AbstractCacheStrategy):
         pass
 
 
+def fingerprint(value: Any) -> bytes:
+    """
+    Compute a short digest identifying a value, to detect when it changes.
+
+    The pickled value is hashed when possible, its `repr` otherwise.
+
+    Args:
+        value (Any): The value to fingerprint.
+
+    Returns:
+        bytes: A 16 byte digest.
+    """
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        data = repr(value).encode("utf-8", "backslashreplace")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class AdaptiveTTLCacheStrategy(TTLCacheStrategy):
+    """
+    A TTL cache strategy that adapts each key's TTL to how often its value changes.
+
+    Purpose:
+        - Replaces hand-picked static TTLs: keys that change weekly end up cached
+          for long, keys that change every minute are refetched often.
+
+    How it Works:
+        - Each time a key is (re)fetched, the new value's fingerprint is compared
+          with the previous one.
+        - An unchanged value multiplies the key's TTL by `growth`, a changed one
+          multiplies it by `shrink`, always within `[min_seconds, max_seconds]`.
+          Shrinking faster than growing keeps volatile keys fresh.
+
+    The learned TTLs outlive the entries themselves, so they carry over from one
+    expiry to the next. Only the `max_keys` most recently inserted keys are
+    remembered, so keys that come and go don't grow the state without bound.
+    The metadata is the expiry timestamp, as for `TTLCacheStrategy`.
+
+    Methods:
+        - __init__(min_seconds, max_seconds, initial_seconds, growth, shrink, fingerprint, clock, max_keys): Initialize the strategy.
+        - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Compare the value with the previous one and adapt the key's TTL.
+        - current_ttl(key: str) -> float: Get the TTL currently used for a key.
+    """
+
+    def __init__(
+        self,
+        min_seconds: float,
+        max_seconds: float,
+        initial_seconds: Optional[float] = None,
+        growth: float = 2.0,
+        shrink: float = 0.25,
+        fingerprint: Callable[[Any], Any] = fingerprint,
+        clock: Optional[CoarseClock] = None,
+        max_keys: int = 10_000,
+    ):
+        """
+        Initialize the strategy.
+
+        Args:
+            min_seconds (float): The shortest TTL a key may get.
+            max_seconds (float): The longest TTL a key may get.
+            initial_seconds (float, optional): The TTL of keys seen for the first time.
+                Defaults to `min_seconds`.
+            growth (float): The factor applied when the value did not change. Defaults to 2.
+            shrink (float): The factor applied when the value changed. Defaults to 0.25.
+            fingerprint (Callable[[Any], Any]): Computes a comparable fingerprint of a value.
+                Override it for values embedding volatile data, such as response headers.
+            clock (CoarseClock, optional): A coarse clock to read the time from.
+            max_keys (int): The number of keys whose TTL is remembered. Defaults to 10,000.
+
+        Raises:
+            ValueError: If the bounds or factors are inconsistent.
+        """
+        if not 0 < min_seconds <= max_seconds:
+            raise ValueError("Expected 0 < min_seconds <= max_seconds.")
+        if growth < 1 or not 0 < shrink <= 1:
+            raise ValueError("Expected growth >= 1 and 0 < shrink <= 1.")
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1.")
+
+        initial_seconds = initial_seconds or min_seconds
+        super().__init__(
+            min(max(initial_seconds, min_seconds), max_seconds), clock
+        )
+
+        self._min_seconds = min_seconds
+        self._max_seconds = max_seconds
+        self._growth = growth
+        self._shrink = shrink
+        self._fingerprint = fingerprint
+        self._max_keys = max_keys
+
+    def _reset_state(self) -> None:
+        # The last fingerprint and learned TTL of each key, least recently inserted first
+        self._learned: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+
+    def current_ttl(self, key: str) -> float:
+        """
+        Get the TTL currently used for a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            float: The TTL in seconds.
+        """
+        learned = self._learned.get(key)
+        return self._seconds if learned is None else learned[1]
+
+    def on_insertion(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Compare the value with the previous one and adapt the key's TTL.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        fingerprint = self._fingerprint(value)
+        learned = self._learned.pop(key, None)
+
+        if learned is None:
+            ttl = self._seconds
+        elif learned[0] == fingerprint:
+            ttl = min(learned[1] * self._growth, self._max_seconds)
+        else:
+            ttl = max(learned[1] * self._shrink, self._min_seconds)
+
+        self._learned[key] = (fingerprint, ttl)
+        if len(self._learned) > self._max_keys:
+            self._learned.popitem(last=False)
+        meta[key] = self._now() + ttl
+
+
+class SoftTTLCacheStrategy(AbstractCacheStrategy):
+    """
+    A cache strategy with two deadlines and a stale-if-error window.
+
+    - Before the soft TTL, the entry is served as is.
+    - Between the soft and the hard TTL, the entry is still served but flagged
+      for refresh, which `CacheMixin` performs in the background.
+    - After the hard TTL, the entry must be refetched. If refetching fails, the
+      stale value keeps being served for up to `max_stale_seconds` more.
+
+    The metadata for each entry is a `(soft_deadline, hard_deadline, stale_deadline)` tuple.
+
+    Methods:
+        - __init__(soft_seconds: float, hard_seconds: float, max_stale_seconds: float, clock: Optional[CoarseClock]): Initialize the strategy with its deadlines.
+        - is_valid(meta_value: Optional[Tuple[float, float, float]]) -> bool: Check if the hard TTL has not passed yet.
+        - needs_refresh(meta_value: Optional[Tuple[float, float, float]]) -> bool: Check if the soft TTL has passed.
+        - can_serve_stale(meta_value: Optional[Tuple[float, float, float]]) -> bool: Check if the value is still within the maximum staleness.
+        - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Set the deadlines for a cache entry upon insertion.
+    """
+
+    def __init__(
+        self,
+        soft_seconds: float,
+        hard_seconds: float,
+        max_stale_seconds: float = 0,
+        clock: Optional[CoarseClock] = None,
+    ):
+        """
+        Initialize the strategy with its deadlines.
+
+        Args:
+            soft_seconds (float): Seconds after which the entry is flagged for refresh.
+            hard_seconds (float): Seconds after which the entry must be refetched.
+            max_stale_seconds (float): Seconds past the hard TTL during which the
+                stale value is served if refetching fails.
+            clock (CoarseClock, optional): A coarse clock to read the time from.
+
+        Raises:
+            ValueError: If the soft TTL is longer than the hard TTL.
+        """
+        if soft_seconds > hard_seconds:
+            raise ValueError("soft_seconds must not exceed hard_seconds.")
+
+        self._soft_seconds = soft_seconds
+        self._hard_seconds = hard_seconds
+        self._max_stale_seconds = max_stale_seconds
+        self._clock = clock
+
+    def is_valid(
+        self, meta_value: Optional[Tuple[float, float, float]]
+    ) -> bool:
+        """
+        Check if the hard TTL has not passed yet.
+
+        Args:
+            meta_value (Optional[Tuple[float, float, float]]): The metadata value to check.
+
+        Returns:
+            bool: True if the entry can be served without refetching, False otherwise.
+        """
+        if meta_value is None:
+            return False
+        clock = self._clock
+        return (time.time() if clock is None else clock.now) < meta_value[1]
+
+    def needs_refresh(
+        self, meta_value: Optional[Tuple[float, float, float]]
+    ) -> bool:
+        """
+        Check if the soft TTL has passed.
+
+        Args:
+            meta_value (Optional[Tuple[float, float, float]]): The metadata value to check.
+
+        Returns:
+            bool: True if the entry should be refreshed, False otherwise.
+        """
+        if meta_value is None:
+            return False
+        clock = self._clock
+        return (time.time() if clock is None else clock.now) >= meta_value[0]
+
+    def can_serve_stale(
+        self, meta_value: Optional[Tuple[float, float, float]]
+    ) -> bool:
+        """
+        Check if the value is still within the maximum staleness.
+
+        Args:
+            meta_value (Optional[Tuple[float, float, float]]): The metadata value to check.
+
+        Returns:
+            bool: True if the value may be served when refetching fails, False otherwise.
+        """
+        return meta_value is not None and self._now() < meta_value[2]
+
+    def on_insertion(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Set the deadlines for a cache entry upon insertion.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        now = self._now()
+        hard_deadline = now + self._hard_seconds
+        meta[key] = (
+            now + self._soft_seconds,
+            hard_deadline,
+            hard_deadline + self._max_stale_seconds,
+        )
+
+
+class JitteredTTLCacheStrategy(AbstractCacheStrategy):
+    """
+    A TTL cache strategy that spreads expirations out and refreshes ahead of expiry.
+
+    Purpose:
+        - Processes that start together and share a TTL would otherwise expire
+          (and refetch) every entry in the same second. Each entry's TTL is
+          scaled by a random factor in `[1 - jitter, 1 + jitter]` instead.
+        - Entries are refreshed early with a probability that rises as expiry
+          approaches, following the XFetch algorithm (Vattani et al., "Optimal
+          Probabilistic Cache Stampede Prevention"). An entry is flagged once
+          `now - delta * beta * log(random())` reaches its expiry, where `delta`
+          is how long the last fetch took, so slow fetches start earlier.
+
+    `CacheMixin` performs the flagged refreshes in the background while the
+    cached value keeps being served. The metadata for each entry is an
+    `(expiry, delta)` tuple.
+
+    Methods:
+        - __init__(seconds: float, jitter: float, beta: float, rng: random.Random, clock: Optional[CoarseClock]): Initialize the strategy.
+        - is_valid(meta_value: Optional[Tuple[float, float]]) -> bool: Check if the jittered TTL has not passed yet.
+        - needs_refresh(meta_value: Optional[Tuple[float, float]]) -> bool: Decide whether to refresh the entry early.
+        - record_cost(key: str, cost: float) -> None: Remember how long fetching the value took.
+        - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Set the jittered expiry for a cache entry.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        jitter: float = 0.1,
+        beta: float = 1.0,
+        rng: Optional[random.Random] = None,
+        clock: Optional[CoarseClock] = None,
+    ):
+        """
+        Initialize the strategy.
+
+        Args:
+            seconds (float): The nominal TTL in seconds.
+            jitter (float): The maximum relative deviation from the nominal TTL,
+                between 0 and 1. Defaults to 0.1 (plus or minus 10%).
+            beta (float): How eagerly entries are refreshed early. Values above 1
+                favour earlier refreshes, 0 disables them. Defaults to 1.0.
+            rng (random.Random, optional): The random number generator to use.
+                Defaults to the `random` module's shared generator.
+            clock (CoarseClock, optional): A coarse clock to read the time from.
+
+        Raises:
+            ValueError: If `jitter` is not between 0 and 1 or `beta` is negative.
+        """
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 (inclusive) and 1.")
+        if beta < 0:
+            raise ValueError("beta must not be negative.")
+
+        self._seconds = seconds
+        self._jitter = jitter
+        self._beta = beta
+        self._rng = rng or random
+        self._clock = clock
+
+    def _reset_state(self) -> None:
+        # Fetch durations recorded since the key's last insertion
+        self._costs: Dict[str, float] = {}
+
+    def record_cost(self, key: str, cost: float) -> None:
+        """
+        Remember how long fetching the value took.
+
+        Args:
+            key (str): The cache key.
+            cost (float): The fetch duration in seconds.
+        """
+        self._costs[key] = cost
+
+    def is_valid(self, meta_value: Optional[Tuple[float, float]]) -> bool:
+        """
+        Check if the jittered TTL has not passed yet.
+
+        Args:
+            meta_value (Optional[Tuple[float, float]]): The metadata value to check.
+
+        Returns:
+            bool: True if the entry is still valid, False otherwise.
+        """
+        if meta_value is None:
+            return False
+        clock = self._clock
+        return (time.time() if clock is None else clock.now) < meta_value[0]
+
+    def needs_refresh(self, meta_value: Optional[Tuple[float, float]]) -> bool:
+        """
+        Decide whether to refresh the entry early.
+
+        Args:
+            meta_value (Optional[Tuple[float, float]]): The metadata value to check.
+
+        Returns:
+            bool: True if the entry should be refreshed now, False otherwise.
+        """
+        if meta_value is None:
+            return False
+
+        expiry, delta = meta_value
+        if not delta or not self._beta:
+            return False
+
+        # 1 - random() lies in (0, 1], so the logarithm is defined and <= 0
+        gap = -delta * self._beta * math.log(1.0 - self._rng.random())
+        return self._now() + gap >= expiry
+
+    def on_insertion(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Set the jittered expiry for a cache entry upon insertion.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        factor = 1 + self._rng.uniform(-self._jitter, self._jitter)
+        delta = self._costs.pop(key, 0.0)
+        meta[key] = (self._now() + self._seconds * factor, delta)
+
+    def on_eviction(self, key: str) -> None:
+        self._costs.pop(key, None)
+
+
 class LRUCacheStrategy(AbstractUsageCacheStrategy):
     """
     A cache strategy that evicts the least recently used (LRU) entries when capacity is exceeded.
@@ -124,6 +601,8 @@ class LRUCacheStrategy(AbstractUsageCacheStrategy):
             meta (Dict[str, Any]): The metadata dictionary.
         """
         self._order[key] = None
+        self._order.move_to_end(key)
+        meta[key] = True
         if len(self._order) > self._capacity:
             lru_key = next(iter(self._order))
             self._remove_excess_entries(meta, lru_key)
@@ -168,6 +647,502 @@ class MRUCacheStrategy(AbstractUsageCacheStrategy):
             meta (Dict[str, Any]): The metadata dictionary.
         """
         self._order[key] = None
+        meta[key] = True
         if len(self._order) > self._capacity:
             mru_key = next(reversed(self._order))
             self._remove_excess_entries(meta, mru_key)
+
+
+class ByteBudgetCacheStrategy(LRUCacheStrategy):
+    """
+    A cache strategy that evicts the least recently used entries once the
+    approximate size of the cached values exceeds a byte budget.
+
+    Entry counts are a poor proxy for memory when cached documents range from a
+    few hundred bytes to many megabytes, so this strategy budgets by size
+    instead. An entry larger than the whole budget is evicted immediately.
+
+    Methods:
+        - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Record the entry size and evict until the cache fits the budget.
+        - on_eviction(key: str) -> None: Release the size accounted to an evicted entry.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Initialize the strategy with a byte budget.
+
+        Args:
+            max_bytes (int): The approximate number of bytes the cached values may occupy.
+            sizeof (Callable[[Any], int], optional): Function used to measure a value.
+                Defaults to `approximate_size`.
+        """
+        self._sizeof = sizeof or approximate_size
+        super().__init__(capacity=max_bytes)
+
+    def _reset_state(self) -> None:
+        """Start with an empty usage order and no accounted bytes."""
+        super()._reset_state()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """The approximate number of bytes currently held by the cache."""
+        return self._total_bytes
+
+    def on_insertion(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Record the entry size and evict until the cache fits the budget.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        size = self._sizeof(value)
+
+        self._total_bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+        self._order[key] = None
+        self._order.move_to_end(key)
+        meta[key] = True
+
+        while self._total_bytes > self._capacity and self._order:
+            lru_key = next(iter(self._order))
+            self._remove_excess_entries(meta, lru_key)
+
+    def on_eviction(self, key: str) -> None:
+        """
+        Release the size accounted to an evicted entry.
+
+        Args:
+            key (str): The key of the evicted entry.
+        """
+        super().on_eviction(key)
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+
+class WTinyLFUCacheStrategy(AbstractCacheStrategy):
+    """
+    A scan-resistant cache strategy based on W-TinyLFU.
+
+    New entries land in a small LRU admission window. When the window overflows,
+    its least recently used entry competes with the main cache's eviction victim
+    and is only admitted if a count-min sketch says it is used more often. The
+    main cache is a segmented LRU (probation and protected segments), so a one-off
+    scan, such as a full `refresh()` of a large tree, cannot flush the hot set.
+
+    Methods:
+        - on_access(key: str, meta: Dict[str, Any]) -> None: Record the access and promote the entry.
+        - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Place the entry in the admission window and run admission.
+        - on_eviction(key: str) -> None: Drop the key from every segment.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+    ):
+        """
+        Initialize the strategy with a capacity value.
+
+        Args:
+            capacity (int): The maximum number of entries that can be stored in the cache.
+            window_ratio (float): The share of the capacity given to the admission window.
+            protected_ratio (float): The share of the main cache reserved for entries
+                that were accessed again after admission.
+        """
+        self._capacity = capacity
+        self._window_capacity = min(
+            capacity, max(1, round(capacity * window_ratio))
+        )
+        self._main_capacity = capacity - self._window_capacity
+        self._protected_capacity = int(self._main_capacity * protected_ratio)
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """Start with empty segments and a fresh frequency sketch."""
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+        self._sketch = CountMinSketch(width=max(64, 4 * self._capacity))
+
+    def is_valid(self, meta_value: Optional[Any]) -> bool:
+        """
+        Determine if a cache entry is valid based on usage.
+
+        Args:
+            meta_value (Optional[Any]): The metadata value to check.
+
+        Returns:
+            bool: True if the entry is valid, False otherwise.
+        """
+        return meta_value is not None
+
+    def _score(self, key: str) -> float:
+        """Return how valuable it is to keep `key` cached."""
+        return self._sketch.frequency(key)
+
+    def on_access(self, key: str, meta: Dict[str, Any]) -> None:
+        """
+        Record the access and promote the entry.
+
+        Args:
+            key (str): The cache key.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        self._sketch.increment(key)
+
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+
+            if len(self._protected) > self._protected_capacity:
+                demoted = self._select_victim(self._protected)
+                del self._protected[demoted]
+                self._probation[demoted] = None
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+
+    def on_insertion(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Place the entry in the admission window and run admission.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        meta[key] = True
+
+        if (
+            key in self._window
+            or key in self._probation
+            or key in self._protected
+        ):
+            # Overwriting a resident entry counts as a use
+            self.on_access(key, meta)
+            return
+
+        self._sketch.increment(key)
+        self._window[key] = None
+
+        if len(self._window) > self._window_capacity:
+            candidate, _ = self._window.popitem(last=False)
+            self._admit(candidate, meta)
+
+    def on_restore(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Track a restored entry as if it had just been inserted.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        self.on_insertion(key, value, meta)
+
+    def _admit(self, candidate: str, meta: Dict[str, Any]) -> None:
+        """
+        Decide whether an entry leaving the window enters the main cache.
+
+        Args:
+            candidate (str): The key leaving the admission window.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        if len(self._probation) + len(self._protected) < self._main_capacity:
+            self._probation[candidate] = None
+            return
+
+        if self._probation:
+            segment = self._probation
+        elif self._protected:
+            segment = self._protected
+        else:
+            # There is no main cache to admit into
+            self._evict(candidate, meta)
+            return
+
+        victim = self._select_victim(segment)
+
+        if self._score(candidate) > self._score(victim):
+            del segment[victim]
+            self._evict(victim, meta)
+            self._probation[candidate] = None
+        else:
+            self._evict(candidate, meta)
+
+    def _select_victim(self, segment: "OrderedDict[str, None]") -> str:
+        """Return the key to move out of a segment, its least recently used one."""
+        return next(iter(segment))
+
+    def on_eviction(self, key: str) -> None:
+        """
+        Drop the key from every segment.
+
+        Args:
+            key (str): The key of the evicted entry.
+        """
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+
+class CostAwareWTinyLFUCacheStrategy(WTinyLFUCacheStrategy):
+    """
+    A W-TinyLFU cache strategy that weights access frequency by fetch latency.
+
+    Each key's frequency estimate is multiplied by its fetch latency relative to
+    the average latency seen by the cache. Expensive remote values therefore win
+    admission contests against cheap ones. The same weighted score picks which
+    entry leaves a segment: among the `victim_sample` least recently used entries
+    of the probation or protected segment, the one with the lowest score is
+    evicted or demoted, so an admitted expensive entry is not the first to go.
+    Keys without an observed latency are weighted as average.
+
+    Methods:
+        - record_cost(key: str, cost: float) -> None: Track the fetch latency of a key.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+        smoothing: float = 0.3,
+        victim_sample: int = 4,
+    ):
+        """
+        Initialize the strategy with a capacity value.
+
+        Args:
+            capacity (int): The maximum number of entries that can be stored in the cache.
+            window_ratio (float): The share of the capacity given to the admission window.
+            protected_ratio (float): The share of the main cache reserved for entries
+                that were accessed again after admission.
+            smoothing (float): The weight of the newest latency sample in the moving averages.
+            victim_sample (int): How many of the least recently used entries of a segment
+                compete on score when one must leave it.
+        """
+        self._smoothing = smoothing
+        self._victim_sample = max(1, victim_sample)
+        super().__init__(
+            capacity=capacity,
+            window_ratio=window_ratio,
+            protected_ratio=protected_ratio,
+        )
+
+    def _reset_state(self) -> None:
+        """Start with empty segments and no observed latencies."""
+        super()._reset_state()
+        self._costs: Dict[str, float] = {}
+        self._mean_cost: Optional[float] = None
+
+    def _moving_average(self, previous: Optional[float], cost: float) -> float:
+        if previous is None:
+            return cost
+        return previous + self._smoothing * (cost - previous)
+
+    def record_cost(self, key: str, cost: float) -> None:
+        """
+        Track the fetch latency of a key.
+
+        Args:
+            key (str): The cache key.
+            cost (float): How long, in seconds, fetching the value took.
+        """
+        self._costs[key] = self._moving_average(self._costs.get(key), cost)
+        self._mean_cost = self._moving_average(self._mean_cost, cost)
+
+    def _score(self, key: str) -> float:
+        """Return the frequency estimate weighted by the relative fetch latency."""
+        weight = 1.0
+        if key in self._costs and self._mean_cost:
+            weight = self._costs[key] / self._mean_cost
+
+        # +1 so that a rarely seen but very expensive entry still has weight
+        return (self._sketch.frequency(key) + 1) * weight
+
+    def _select_victim(self, segment: "OrderedDict[str, None]") -> str:
+        """Return the lowest scored of the least recently used keys of a segment."""
+        candidates = itertools.islice(segment, self._victim_sample)
+        return min(candidates, key=self._score)
+
+    def on_eviction(self, key: str) -> None:
+        """
+        Drop the key from every segment and forget its latency.
+
+        Args:
+            key (str): The key of the evicted entry.
+        """
+        super().on_eviction(key)
+        self._costs.pop(key, None)
+
+
+class ARCCacheStrategy(AbstractCacheStrategy):
+    """
+    A cache strategy implementing the Adaptive Replacement Cache (ARC).
+
+    Entries seen once live in a recency list (T1) and entries seen again move to
+    a frequency list (T2). Ghost lists (B1, B2) remember recently evicted keys and
+    steer the target size of T1, so the cache adapts between recency- and
+    frequency-heavy workloads. A single scan only churns T1 and leaves the
+    frequently used entries in T2 untouched.
+
+    Methods:
+        - on_access(key: str, meta: Dict[str, Any]) -> None: Promote the entry to the frequent list.
+        - on_insertion(key: str, value: Any, meta: Dict[str, Any]) -> None: Adapt the target size and evict if necessary.
+        - on_eviction(key: str) -> None: Drop the key from every list.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the strategy with a capacity value.
+
+        Args:
+            capacity (int): The maximum number of entries that can be stored in the cache.
+        """
+        self._capacity = capacity
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """Start with empty resident and ghost lists."""
+        self._t1: OrderedDict[str, None] = OrderedDict()
+        self._t2: OrderedDict[str, None] = OrderedDict()
+        self._b1: OrderedDict[str, None] = OrderedDict()
+        self._b2: OrderedDict[str, None] = OrderedDict()
+        self._target_t1 = 0.0
+
+    def is_valid(self, meta_value: Optional[Any]) -> bool:
+        """
+        Determine if a cache entry is valid based on usage.
+
+        Args:
+            meta_value (Optional[Any]): The metadata value to check.
+
+        Returns:
+            bool: True if the entry is valid, False otherwise.
+        """
+        return meta_value is not None
+
+    def on_access(self, key: str, meta: Dict[str, Any]) -> None:
+        """
+        Promote the entry to the frequent list.
+
+        Args:
+            key (str): The cache key.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        if key in self._t1:
+            del self._t1[key]
+            self._t2[key] = None
+        elif key in self._t2:
+            self._t2.move_to_end(key)
+
+    def on_restore(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Track a restored entry as if it had just been inserted.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        self.on_insertion(key, value, meta)
+
+    def _replace(self, key: str, meta: Dict[str, Any]) -> None:
+        """
+        Evict one resident entry into its ghost list.
+
+        Args:
+            key (str): The key being inserted.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        if len(self._t1) + len(self._t2) < self._capacity:
+            return
+
+        if self._t1 and (
+            len(self._t1) > self._target_t1
+            or (key in self._b2 and len(self._t1) == self._target_t1)
+            or not self._t2
+        ):
+            victim, _ = self._t1.popitem(last=False)
+            ghost = self._b1
+        else:
+            victim, _ = self._t2.popitem(last=False)
+            ghost = self._b2
+
+        self._evict(victim, meta)
+        # Added after the eviction so on_eviction does not forget the ghost
+        ghost[victim] = None
+
+    def on_insertion(self, key: str, value: Any, meta: Dict[str, Any]) -> None:
+        """
+        Adapt the target size and evict if necessary.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The cache value.
+            meta (Dict[str, Any]): The metadata dictionary.
+        """
+        meta[key] = True
+        capacity = self._capacity
+
+        if key in self._t1 or key in self._t2:
+            self.on_access(key, meta)
+            return
+
+        if key in self._b1:
+            # Recency is paying off, grow the recency target
+            delta = max(len(self._b2) / len(self._b1), 1)
+            self._target_t1 = min(capacity, self._target_t1 + delta)
+            self._replace(key, meta)
+            del self._b1[key]
+            self._t2[key] = None
+            return
+
+        if key in self._b2:
+            # Frequency is paying off, shrink the recency target
+            delta = max(len(self._b1) / len(self._b2), 1)
+            self._target_t1 = max(0, self._target_t1 - delta)
+            self._replace(key, meta)
+            del self._b2[key]
+            self._t2[key] = None
+            return
+
+        l1 = len(self._t1) + len(self._b1)
+        total = l1 + len(self._t2) + len(self._b2)
+
+        if l1 >= capacity:
+            if len(self._t1) < capacity:
+                self._b1.popitem(last=False)
+                self._replace(key, meta)
+            else:
+                victim, _ = self._t1.popitem(last=False)
+                self._evict(victim, meta)
+        elif total >= capacity:
+            if total >= 2 * capacity:
+                self._b2.popitem(last=False)
+            self._replace(key, meta)
+
+        self._t1[key] = None
+
+    def on_eviction(self, key: str) -> None:
+        """
+        Drop the key from every list.
+
+        Args:
+            key (str): The key of the evicted entry.
+        """
+        self._t1.pop(key, None)
+        self._t2.pop(key, None)
+        self._b1.pop(key, None)
+        self._b2.pop(key, None)
@@ -7,7 +7,9 @@ The `ConfigAttributes` class acts as a proxy for the `Config` class, allowing it
 from typing import Any
 
 from fastcfg.config.base import AbstractConfigUnit
+from fastcfg.config.batch import batch_for
 from fastcfg.config.items import AbstractConfigItem, BuiltInConfigItem
+from fastcfg.config.journal import MISSING, record_attribute_change
 from fastcfg.config.utils import create_config_dict
 
 # Types that are classified as built-in rather than custom objects
@@ -126,7 +128,7 @@ class ConfigAttributes(AbstractConfigUnit):
         config_item = self._convert_value_to_item(value)
 
         # Set the parent of the config item to this Config
-        config_item.set_parent(self._config)
+        config_item.set_parent(self._config, name)
       
         self.__attributes[name] = config_item
 
@@ -149,10 +151,12 @@ class ConfigAttributes(AbstractConfigUnit):
             # Convert dict to nested Config object
             value = create_config_dict(value)
 
+        previous_item = self.__attributes.get(name)
+
         if (
-            name in self.__attributes
+            previous_item is not None
         ):  # Existing attribute that we're overriding
-            config_item = self.__attributes[name]
+            config_item = previous_item
 
             # Only support value overriding for BuiltInConfigItems
             # For LiveConfigItems, we just want to replace it with the new value
@@ -163,8 +167,41 @@ class ConfigAttributes(AbstractConfigUnit):
         else:  # New attribute entirely
             config_item = self._add_attribute(name, value)
 
-        # Trigger validation at the end
-        config_item.validate()
+        batch = batch_for(self._config)
+
+        if batch is None:
+            if previous_item is None:
+                record_attribute_change(
+                    self._config, name, config_item, MISSING, value
+                )
+            # Trigger validation at the end
+            config_item.validate()
+            return
+
+        if previous_item is None:
+            batch.record_attribute_change(
+                self._config, name, config_item, MISSING, value
+            )
+
+        # Inside a batch, validation runs once at commit
+        if config_item is not previous_item:
+            batch.record_undo(
+                lambda: self._restore_attribute(name, previous_item)
+            )
+        batch.defer_validation(config_item)
+
+    def _restore_attribute(self, name: str, item: Any) -> None:
+        """
+        Puts back the item an attribute held before it was added or replaced.
+
+        Args:
+            name (str): The name of the attribute.
+            item (Any): The previous item, or None if the attribute didn't exist.
+        """
+        if item is None:
+            self.__attributes.pop(name, None)
+        else:
+            self.__attributes[name] = item
 
     def remove_attribute(self, name: str) -> None:
         """
@@ -178,4 +215,16 @@ class ConfigAttributes(AbstractConfigUnit):
         """
         if name not in self.__attributes:
             raise AttributeError(f"Attribute `{name}` does not exist.")
-        del self.__attributes[name]
+        item = self.__attributes.pop(name)
+
+        # Journaled with the value it would be added back with
+        value = item._value if isinstance(item, BuiltInConfigItem) else item
+
+        batch = batch_for(self._config)
+        if batch is None:
+            record_attribute_change(self._config, name, item, value, MISSING)
+        else:
+            batch.record_attribute_change(
+                self._config, name, item, value, MISSING
+            )
+            batch.record_undo(lambda: self._restore_attribute(name, item))
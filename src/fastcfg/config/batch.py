@@ -0,0 +1,289 @@
+"""
+Batched configuration changes, committed with one aggregated event per config.
+
+Outside a batch, every changed item is validated on assignment and fires a
+`ChangeEvent` that propagates up through every parent config. Inside a batch,
+validation and events are deferred to the commit:
+
+    - Each changed item is validated once, after every change was applied.
+    - Each changed item's listeners receive one `ChangeEvent` holding its net
+      change, from its value before the batch to its value after it.
+    - Each config above a changed item receives one `ChangeSet` aggregating the
+      net changes made under it, and its path subscriptions matching the item
+      receive the item's `ChangeEvent`.
+
+If the block raises, or a deferred validation fails, the changes made to the
+batched config are rolled back and no event is fired.
+
+Batches are tracked per thread: changes made by other threads while a batch is
+open are applied and notified as usual. Nested batches over the same config
+join the outermost one.
+
+Classes:
+    ConfigBatch: The changes recorded under a config until they are committed.
+
+Functions:
+    batched(config): Open a batch over a config, or join the batch already covering it.
+    batch_for(config): Get the open batch covering a config, if any.
+
+Usage Example:
+    with config.batch():
+        config.database.host = "db.internal"
+        config.database.port = 6432
+    # Validators run and listeners are notified here
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from fastcfg.config.events import ChangeEvent, ChangeSet
+from fastcfg.config.journal import MISSING, record_attribute_change
+
+if TYPE_CHECKING:
+    from fastcfg.config.cfg import Config
+    from fastcfg.config.items import AbstractConfigItem
+
+_local = threading.local()
+
+
+def _lineage(config: Optional["Config"]) -> Iterator["Config"]:
+    """Yield a config and every config above it."""
+    while config is not None:
+        yield config
+        config = config.__dict__["__interface"]._parent
+
+
+def batch_for(config: Optional["Config"]) -> Optional["ConfigBatch"]:
+    """
+    Get the batch open on this thread that covers a config, if any.
+
+    Args:
+        config (Optional[Config]): The config, or the parent of a changed item.
+
+    Returns:
+        Optional[ConfigBatch]: The innermost covering batch, or None.
+    """
+    batches = getattr(_local, "batches", None)
+    if not batches:
+        return None
+
+    for batch in reversed(batches):
+        if batch.covers(config):
+            return batch
+    return None
+
+
+class ConfigBatch:
+    """
+    The changes recorded under a config until they are committed.
+
+    Attributes:
+        root (Config): The batched config.
+
+    Methods:
+        covers(config): Whether a config is the batched config or lies under it.
+        record_change(item, old_value, new_value): Record an item's change instead of notifying it.
+        record_attribute_change(config, name, item, old_value, new_value): Record an
+            attribute added to or removed from a config.
+        record_undo(undo): Record how to revert a change on rollback.
+        defer_validation(item): Validate an item at commit instead of now.
+        commit(): Run the deferred validations and fire the aggregated events.
+        rollback(): Revert the recorded changes without firing events.
+    """
+
+    def __init__(self, root: "Config"):
+        """
+        Initialize the batch.
+
+        Args:
+            root (Config): The batched config.
+        """
+        self.root = root
+        # Net changes by item identity: [item, value before the batch, latest value]
+        self._changes: Dict[int, List[Any]] = {}
+        self._pending_validation: Dict[int, Any] = {}
+        self._undo: List[Callable[[], None]] = []
+        # Added and removed attributes, journaled at commit:
+        # (config, name, item, old value, new value)
+        self._attribute_changes: List[Tuple[Any, str, Any, Any, Any]] = []
+
+    def covers(self, config: Optional["Config"]) -> bool:
+        """Whether a config is the batched config or lies under it."""
+        return any(node is self.root for node in _lineage(config))
+
+    def record_change(
+        self, item: "AbstractConfigItem", old_value: Any, new_value: Any
+    ) -> None:
+        """
+        Record an item's change instead of notifying it.
+
+        Args:
+            item (AbstractConfigItem): The changed item.
+            old_value (Any): The previous value.
+            new_value (Any): The new value.
+        """
+        entry = self._changes.get(id(item))
+        if entry is None:
+            self._changes[id(item)] = [item, old_value, new_value]
+        else:
+            entry[2] = new_value
+
+        # Imported here, items depend on this module
+        from fastcfg.config.items import BuiltInConfigItem
+
+        if isinstance(item, BuiltInConfigItem):
+            self.record_undo(lambda: setattr(item, "_value", old_value))
+
+    def record_attribute_change(
+        self,
+        config: "Config",
+        name: str,
+        item: Any,
+        old_value: Any,
+        new_value: Any,
+    ) -> None:
+        """
+        Record an attribute added to or removed from a config, to journal it at commit.
+
+        Args:
+            config (Config): The config the attribute was added to or removed from.
+            name (str): The name of the attribute.
+            item (Any): The added or removed item.
+            old_value (Any): The value it was removed with, or `MISSING`.
+            new_value (Any): The value it was added with, or `MISSING`.
+        """
+        self._attribute_changes.append(
+            (config, name, item, old_value, new_value)
+        )
+
+    def record_undo(self, undo: Callable[[], None]) -> None:
+        """Record how to revert a change on rollback."""
+        self._undo.append(undo)
+
+    def defer_validation(self, item: Any) -> None:
+        """Validate an item at commit instead of now."""
+        self._pending_validation.setdefault(id(item), item)
+
+    def rollback(self) -> None:
+        """Revert the recorded changes, most recent first, without firing events."""
+        for undo in reversed(self._undo):
+            undo()
+        self._undo.clear()
+        self._changes.clear()
+        self._pending_validation.clear()
+        self._attribute_changes.clear()
+
+    def commit(self) -> None:
+        """
+        Run the deferred validations and fire the aggregated events.
+
+        Raises:
+            ConfigItemValidationError: If a deferred validation fails, after rolling back.
+        """
+        try:
+            for item in self._pending_validation.values():
+                item.validate()
+        except Exception:
+            self.rollback()
+            raise
+
+        changes = list(self._changes.values())
+        attribute_changes = self._attribute_changes
+        self._changes.clear()
+        self._pending_validation.clear()
+        self._undo.clear()
+        self._attribute_changes = []
+
+        # Additions precede the changes of the added items
+        for change in attribute_changes:
+            if change[3] is MISSING:
+                record_attribute_change(*change)
+
+        # Changes aggregated by the config they were made under, at any depth
+        change_sets: Dict[int, List[Any]] = {}
+
+        for item, old_value, new_value in changes:
+            if old_value == new_value:
+                continue  # Changed back during the batch
+
+            event = ChangeEvent(
+                item=item, old_value=old_value, new_value=new_value
+            )
+            item._deliver(event)
+
+            # The item's path relative to each config above it
+            path = (item._name,)
+            parent = item._parent
+
+            # Key items of dict-valued items notify the items holding them first
+            while parent is not None and "__interface" not in parent.__dict__:
+                parent._deliver(event)
+                path = (parent._name,) + path
+                parent = parent._parent
+
+            for config in _lineage(parent):
+                change_sets.setdefault(id(config), [config, []])[1].append(
+                    event
+                )
+
+                interface = config.__dict__["__interface"]
+                if interface._journal is not None:
+                    interface._journal.record(".".join(path), event)
+                if interface._subscriptions:
+                    interface._deliver_matches(event, path)
+                path = (interface._name,) + path
+
+        # And removals follow the changes of the removed items
+        for change in attribute_changes:
+            if change[3] is not MISSING:
+                record_attribute_change(*change)
+
+        for config, events in change_sets.values():
+            interface = config.__dict__["__interface"]
+            if interface._event_listeners:
+                interface._deliver(ChangeSet(changes=events))
+
+    def __enter__(self) -> "ConfigBatch":
+        if not hasattr(_local, "batches"):
+            _local.batches = []
+        _local.batches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        _local.batches.remove(self)
+        if exc_type is not None:
+            self.rollback()
+        else:
+            self.commit()
+        return False
+
+
+@contextmanager
+def batched(config: "Config") -> Iterator[ConfigBatch]:
+    """
+    Open a batch over a config, or join the batch already covering it.
+
+    Args:
+        config (Config): The config to batch.
+
+    Yields:
+        ConfigBatch: The batch recording the changes.
+    """
+    existing = batch_for(config)
+    if existing is not None:
+        # The outermost batch commits or rolls back every change
+        yield existing
+        return
+
+    with ConfigBatch(config) as batch:
+        yield batch
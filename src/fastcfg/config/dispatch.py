@@ -0,0 +1,400 @@
+"""
+Dispatchers that deliver change events to listeners off the notifying thread.
+
+By default listeners are called synchronously inside the setter or the live
+read that detected the change, so a slow listener stalls the code that merely
+read a value. A dispatcher given to `on_change` moves those calls to a worker
+thread or an asyncio task, consuming a bounded queue of pending events.
+
+Events are delivered by a single consumer in the order they were queued, so
+the events of any one configuration item always reach a listener in order.
+
+Backpressure policies, applied when the queue is full:
+    block: The notifying thread waits until the queue has room.
+    drop_oldest: The oldest pending event is discarded.
+    coalesce: A pending event for the same listener and item is merged with the
+        new one, keeping its position and original `old_value`. If no such event
+        is pending, the notifying thread waits as with `block`.
+
+Classes:
+    AbstractEventDispatcher: Base class for event dispatchers.
+    SynchronousDispatcher: Calls listeners inline, the default behaviour.
+    QueuedDispatcher: Calls listeners from a worker thread.
+    AsyncioDispatcher: Calls listeners, including coroutine functions, from an asyncio task.
+
+Usage Example:
+    from fastcfg.config.dispatch import QueuedDispatcher
+
+    dispatcher = QueuedDispatcher(maxsize=1000, backpressure="coalesce")
+
+    @config.database.host.on_change(dispatcher=dispatcher)
+    def rebuild_pool(event):
+        ...
+"""
+
+import asyncio
+import inspect
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from fastcfg.config.events import (
+    ChangeEvent,
+    call_listener,
+    report_listener_error,
+)
+
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "coalesce")
+
+
+class AbstractEventDispatcher(ABC):
+    """
+    Base class for event dispatchers.
+
+    Methods:
+        dispatch(listener, event): Deliver an event to a listener.
+        flush(timeout): Wait until every queued event was delivered.
+        close(): Stop accepting events and end the consumer.
+    """
+
+    @abstractmethod
+    def dispatch(
+        self, listener: Callable[[ChangeEvent], Any], event: ChangeEvent
+    ) -> None:
+        """
+        Deliver an event to a listener.
+
+        Args:
+            listener (Callable[[ChangeEvent], Any]): The listener to call.
+            event (ChangeEvent): The event to deliver.
+        """
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event was delivered.
+
+        Args:
+            timeout (Optional[float]): The longest wait in seconds. Defaults to no limit.
+
+        Returns:
+            bool: True if the queue was drained, False if the wait timed out.
+        """
+        return True
+
+    def close(self) -> None:
+        """Stop accepting events and end the consumer."""
+
+
+class SynchronousDispatcher(AbstractEventDispatcher):
+    """
+    Calls listeners inline, on the thread that detected the change.
+
+    This is the behaviour of listeners registered without a dispatcher.
+    """
+
+    def dispatch(
+        self, listener: Callable[[ChangeEvent], Any], event: ChangeEvent
+    ) -> None:
+        call_listener(listener, event)
+
+
+class _EventQueue:
+    """
+    A bounded, thread-safe queue of `(listener, event)` entries with backpressure.
+
+    Attributes:
+        dropped (int): The number of events discarded by `drop_oldest`.
+        coalesced (int): The number of events merged by `coalesce`.
+    """
+
+    def __init__(self, maxsize: int, backpressure: str):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"backpressure must be one of {BACKPRESSURE_POLICIES}, got {backpressure!r}."
+            )
+
+        self.maxsize = maxsize
+        self.backpressure = backpressure
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+
+        self._entries: Deque[List[Any]] = deque()
+        # Pending entries by (listener, item) identity, for coalescing
+        self._pending: Dict[Tuple[int, int], List[Any]] = {}
+        # The number of entries taken but not yet delivered
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def _key(listener: Callable, event: ChangeEvent) -> Tuple[int, int]:
+        # Change sets have no item and are never coalesced
+        return (id(listener), id(getattr(event, "item", event)))
+
+    def put(
+        self, listener: Callable, event: ChangeEvent, can_block: bool = True
+    ) -> None:
+        with self._condition:
+            if self.closed:
+                raise RuntimeError(
+                    "Cannot dispatch events after the dispatcher was closed."
+                )
+
+            key = self._key(listener, event)
+
+            if (
+                self.backpressure == "coalesce"
+                and len(self._entries) >= self.maxsize
+            ):
+                entry = self._pending.get(key)
+                if entry is not None:
+                    # Keep the pending event's position and its old value
+                    entry[1] = ChangeEvent(
+                        event.item,
+                        entry[1].old_value,
+                        event.new_value,
+                        monotonic_ns=event.monotonic_ns,
+                    )
+                    self.coalesced += 1
+                    return
+
+            if self.backpressure == "drop_oldest":
+                while len(self._entries) >= self.maxsize:
+                    dropped = self._entries.popleft()
+                    self._forget(dropped)
+                    self.dropped += 1
+            elif can_block:
+                while len(self._entries) >= self.maxsize and not self.closed:
+                    self._condition.wait()
+
+            entry = [listener, event, key]
+            self._entries.append(entry)
+            self._pending[key] = entry
+            self._condition.notify_all()
+
+    def _forget(self, entry: List[Any]) -> None:
+        if self._pending.get(entry[2]) is entry:
+            del self._pending[entry[2]]
+
+    def get(
+        self, block: bool = True
+    ) -> Optional[Tuple[Callable, ChangeEvent]]:
+        """Take the oldest entry, or None once closed and drained, or when empty and not blocking."""
+        with self._condition:
+            while not self._entries:
+                if self.closed or not block:
+                    return None
+                self._condition.wait()
+
+            entry = self._entries.popleft()
+            self._forget(entry)
+            self._in_flight += 1
+            self._condition.notify_all()
+            return entry[0], entry[1]
+
+    def task_done(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def join(self, timeout: Optional[float]) -> bool:
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._entries and not self._in_flight, timeout
+            )
+
+    def close(self) -> None:
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _QueueingDispatcher(AbstractEventDispatcher):
+    """Shared state of the dispatchers consuming an `_EventQueue`."""
+
+    _queue: _EventQueue
+
+    @property
+    def maxsize(self) -> int:
+        return self._queue.maxsize
+
+    @property
+    def backpressure(self) -> str:
+        return self._queue.backpressure
+
+    @property
+    def dropped(self) -> int:
+        return self._queue.dropped
+
+    @property
+    def coalesced(self) -> int:
+        return self._queue.coalesced
+
+    def pending(self) -> int:
+        """The number of events waiting to be delivered."""
+        return len(self._queue)
+
+
+class QueuedDispatcher(_QueueingDispatcher):
+    """
+    Calls listeners from a worker thread, consuming a bounded queue of events.
+
+    Attributes:
+        maxsize (int): The largest number of pending events.
+        backpressure (str): The policy applied when the queue is full.
+        dropped (int): The number of events discarded by `drop_oldest`.
+        coalesced (int): The number of events merged by `coalesce`.
+
+    Methods:
+        dispatch(listener, event): Queue an event for a listener.
+        pending(): The number of events waiting to be delivered.
+        flush(timeout): Wait until every queued event was delivered.
+        close(): Stop accepting events and end the worker once the queue is drained.
+    """
+
+    def __init__(self, maxsize: int = 1024, backpressure: str = "block"):
+        """
+        Initialize the dispatcher and start its worker thread.
+
+        Args:
+            maxsize (int): The largest number of pending events. Defaults to 1024.
+            backpressure (str): One of "block", "drop_oldest" or "coalesce". Defaults to "block".
+
+        Raises:
+            ValueError: If maxsize is not positive or the policy is unknown.
+        """
+        self._queue = _EventQueue(maxsize, backpressure)
+        self._thread = threading.Thread(
+            target=self._run, name="fastcfg-event-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            try:
+                call_listener(*entry)
+            finally:
+                self._queue.task_done()
+
+    def dispatch(
+        self, listener: Callable[[ChangeEvent], Any], event: ChangeEvent
+    ) -> None:
+        # A listener that changes a value from the worker must not wait on itself
+        can_block = threading.current_thread() is not self._thread
+        self._queue.put(listener, event, can_block=can_block)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self._queue.join(timeout)
+
+    def close(self) -> None:
+        self._queue.close()
+
+
+class AsyncioDispatcher(_QueueingDispatcher):
+    """
+    Calls listeners from a task on an asyncio event loop.
+
+    Events may be dispatched from any thread. Listeners that are coroutine
+    functions are awaited, one event at a time, before the next one is delivered.
+
+    Attributes:
+        loop (asyncio.AbstractEventLoop): The loop running the consumer task.
+        maxsize (int): The largest number of pending events.
+        backpressure (str): The policy applied when the queue is full.
+        dropped (int): The number of events discarded by `drop_oldest`.
+        coalesced (int): The number of events merged by `coalesce`.
+
+    Methods:
+        dispatch(listener, event): Queue an event for a listener.
+        pending(): The number of events waiting to be delivered.
+        flush(timeout): Wait until every queued event was delivered, from another thread.
+        close(): Stop accepting events and end the task once the queue is drained.
+    """
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        maxsize: int = 1024,
+        backpressure: str = "block",
+    ):
+        """
+        Initialize the dispatcher and schedule its consumer task.
+
+        Args:
+            loop (Optional[asyncio.AbstractEventLoop]): The loop running the listeners.
+                Defaults to the running loop.
+            maxsize (int): The largest number of pending events. Defaults to 1024.
+            backpressure (str): One of "block", "drop_oldest" or "coalesce". Defaults to "block".
+
+        Raises:
+            RuntimeError: If no loop is given and none is running.
+            ValueError: If maxsize is not positive or the policy is unknown.
+        """
+        self.loop = loop if loop is not None else asyncio.get_running_loop()
+        self._queue = _EventQueue(maxsize, backpressure)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.loop.call_soon_threadsafe(self._start)
+
+    def _start(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._task = self.loop.create_task(self._run())
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            entry = self._queue.get(block=False)
+            if entry is None:
+                if self._queue.closed:
+                    return
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            try:
+                result = call_listener(*entry)
+                if inspect.isawaitable(result):
+                    try:
+                        await result
+                    except Exception as e:
+                        report_listener_error(entry[0], entry[1], e)
+            finally:
+                self._queue.task_done()
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def dispatch(
+        self, listener: Callable[[ChangeEvent], Any], event: ChangeEvent
+    ) -> None:
+        # The loop can't wait for its own consumer, so it never blocks and the
+        # queue briefly exceeds maxsize instead
+        self._queue.put(listener, event, can_block=not self._on_loop_thread())
+        self.loop.call_soon_threadsafe(self._wake)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        if self._on_loop_thread():
+            raise RuntimeError(
+                "flush would deadlock when called from the dispatcher's loop."
+            )
+        return self._queue.join(timeout)
+
+    def close(self) -> None:
+        self._queue.close()
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._wake)
@@ -0,0 +1,159 @@
+"""
+Sinks receiving the errors raised by change listeners.
+
+A failing listener never breaks the notification: its error is handed to the
+listener error sink instead. The default sink logs to the `fastcfg.events`
+logger and rate limits repeated failures, so a listener failing on every tick
+of a high-frequency source costs a dictionary lookup per failure instead of a
+formatted traceback.
+
+Any callable taking `(listener, event, error)` can be installed as the sink
+with `set_listener_error_sink`.
+
+Classes:
+    LoggingErrorSink: Logs listener errors, aggregating repeated failures.
+
+Functions:
+    set_listener_error_sink(sink): Install the sink receiving listener errors.
+    get_listener_error_sink(): Get the sink receiving listener errors.
+
+Usage Example:
+    import logging
+    from fastcfg.config.error_sinks import LoggingErrorSink, set_listener_error_sink
+
+    # Log each kind of failure at most once every 5 minutes
+    set_listener_error_sink(
+        LoggingErrorSink(logging.getLogger("myapp.config"), interval=300)
+    )
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ListenerErrorSink = Callable[[Callable, Any, Exception], None]
+
+
+def describe_listener(listener: Callable) -> str:
+    """
+    A readable name for a listener, looking through debounce and throttle wrappers.
+
+    Args:
+        listener (Callable): The listener.
+
+    Returns:
+        str: The listener's module and qualified name, or its repr.
+    """
+    listener = getattr(listener, "callback", listener)
+    name = getattr(listener, "__qualname__", None)
+    if name is None:
+        return repr(listener)
+    module = getattr(listener, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class LoggingErrorSink:
+    """
+    Logs listener errors, aggregating repeated failures.
+
+    The first failure of a listener with a given error type is logged with its
+    traceback. Further failures of the same kind are only counted until
+    `interval` seconds have passed, and the next one is logged with that count.
+
+    Attributes:
+        logger (logging.Logger): The logger receiving the records.
+        interval (float): The shortest time between two records for the same failure, in seconds.
+        suppressed (int): The total number of failures counted but not logged.
+
+    Methods:
+        flush(): Log the counts of failures suppressed since their last record.
+    """
+
+    def __init__(
+        self, logger: Optional[logging.Logger] = None, interval: float = 60.0
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            logger (Optional[logging.Logger]): The logger. Defaults to the `fastcfg.events` logger.
+            interval (float): The shortest time between two records for the same
+                failure, in seconds. Defaults to 60.
+        """
+        self.logger = (
+            logger
+            if logger is not None
+            else logging.getLogger("fastcfg.events")
+        )
+        self.interval = interval
+        self.suppressed = 0
+        # By (listener, error type): [time of the last record, failures suppressed since]
+        self._failures: Dict[Tuple[str, type], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, listener: Callable, event: Any, error: Exception
+    ) -> None:
+        name = describe_listener(listener)
+        key = (name, type(error))
+        now = time.monotonic()
+
+        with self._lock:
+            failure = self._failures.get(key)
+            if failure is not None and now - failure[0] < self.interval:
+                failure[1] += 1
+                self.suppressed += 1
+                return
+
+            suppressed = failure[1] if failure is not None else 0
+            self._failures[key] = [now, 0]
+
+        message = "Error in event listener %s: %s"
+        args: Tuple[Any, ...] = (name, error)
+        if suppressed:
+            message += " (%d similar failures suppressed)"
+            args += (suppressed,)
+
+        self.logger.error(
+            message, *args, exc_info=(type(error), error, error.__traceback__)
+        )
+
+    def flush(self) -> None:
+        """Log the counts of failures suppressed since their last record."""
+        with self._lock:
+            pending = [
+                (name, error_type, failure[1])
+                for (name, error_type), failure in self._failures.items()
+                if failure[1]
+            ]
+            for failure in self._failures.values():
+                failure[1] = 0
+
+        for name, error_type, count in pending:
+            self.logger.error(
+                "Event listener %s failed %d more times with %s",
+                name,
+                count,
+                error_type.__name__,
+            )
+
+
+_listener_error_sink: ListenerErrorSink = LoggingErrorSink()
+
+
+def set_listener_error_sink(sink: Optional[ListenerErrorSink]) -> None:
+    """
+    Install the sink receiving listener errors.
+
+    Args:
+        sink (Optional[ListenerErrorSink]): A callable taking `(listener, event, error)`,
+            or None to restore the default `LoggingErrorSink`.
+    """
+    global _listener_error_sink
+    _listener_error_sink = sink if sink is not None else LoggingErrorSink()
+
+
+def get_listener_error_sink() -> ListenerErrorSink:
+    """Get the sink receiving listener errors."""
+    return _listener_error_sink
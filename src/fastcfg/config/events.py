@@ -5,37 +5,147 @@ This module provides the event classes and listener management for
 configuration change events.
 """
 
+import time
 from datetime import datetime
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
-import traceback
+
+from fastcfg.config import listener_stats
+from fastcfg.config.error_sinks import get_listener_error_sink
+from fastcfg.config.subscriptions import PathTrie, path_of
 
 if TYPE_CHECKING:
+    from fastcfg.config.dispatch import AbstractEventDispatcher
+    from fastcfg.config.journal import ChangeJournal
     from fastcfg.config.items import LiveConfigItem
 else:
     LiveConfigItem = None
 
-@dataclass
 class ChangeEvent:
     """
     Event object that contains information about a configuration change.
-    
+
+    Events are created for every change seen by a listener, so they are kept
+    small: the creation time is recorded as a monotonic nanosecond count, and
+    the wall clock `timestamp` is only computed when first read. A single event
+    is shared by every level of the parent chain.
+
     Attributes:
         item: The configuration item that changed
         old_value: The previous value
         new_value: The new value
-        timestamp: When the change occurred
+        monotonic_ns: When the change occurred, as returned by `time.monotonic_ns()`
+        timestamp: When the change occurred, as a `datetime`
     """
-    item: 'LiveConfigItem'
-    old_value: Any
-    new_value: Any
+
+    __slots__ = ("item", "old_value", "new_value", "monotonic_ns", "_timestamp")
+
+    def __init__(
+        self,
+        item: 'LiveConfigItem',
+        old_value: Any,
+        new_value: Any,
+        timestamp: datetime | None = None,
+        monotonic_ns: int | None = None,
+    ):
+        self.item = item
+        self.old_value = old_value
+        self.new_value = new_value
+        self.monotonic_ns = time.monotonic_ns() if monotonic_ns is None else monotonic_ns
+        self._timestamp = timestamp
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the change occurred, derived from `monotonic_ns` on first read."""
+        if self._timestamp is None:
+            elapsed_ns = time.monotonic_ns() - self.monotonic_ns
+            self._timestamp = datetime.fromtimestamp(
+                (time.time_ns() - elapsed_ns) / 1e9
+            )
+        return self._timestamp
+
+    @property
+    def path(self) -> Optional[str]:
+        """The dotted path of the changed item from its topmost config."""
+        return path_of(self.item)
+
+    def __eq__(self, other):
+        if not isinstance(other, ChangeEvent):
+            return NotImplemented
+        return (
+            self.item is other.item
+            and self.old_value == other.old_value
+            and self.new_value == other.new_value
+            and self.monotonic_ns == other.monotonic_ns
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"ChangeEvent(item={self.item!r}, old_value={self.old_value!r}, "
+            f"new_value={self.new_value!r}, monotonic_ns={self.monotonic_ns})"
+        )
+
+
+@dataclass
+class ChangeSet:
+    """
+    Event object that aggregates the changes made under a config during a batch.
+
+    Delivered once per affected `Config` when a batch commits, instead of one
+    `ChangeEvent` per changed item.
+
+    Attributes:
+        changes: The net change of every item that changed, in order of first change
+        timestamp: When the batch committed
+    """
+    changes: List[ChangeEvent]
     timestamp: datetime = None
-    
+
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self):
+        return len(self.changes)
+
+
+def report_listener_error(listener: Callable, event: ChangeEvent, error: Exception):
+    """Report an error raised by a listener to the listener error sink."""
+    get_listener_error_sink()(listener, event, error)
+
+
+def dispatch_listener(dispatcher: 'AbstractEventDispatcher', listener: Callable[[ChangeEvent], Any], event: ChangeEvent) -> None:
+    """Hand an event to a dispatcher, reporting its errors instead of raising them, such as once it was closed."""
+    try:
+        dispatcher.dispatch(listener, event)
+    except Exception as e:
+        report_listener_error(listener, event, e)
+
+
+def call_listener(listener: Callable[[ChangeEvent], Any], event: ChangeEvent) -> Any:
+    """Call a listener, timing it if listener stats are enabled, and reporting its errors instead of raising them."""
+    stats = listener_stats._listener_stats
+    try:
+        # Wrappers delivering later are timed when they call the listener
+        if stats is None or getattr(listener, "_untimed", False):
+            return listener(event)
+
+        start = time.perf_counter()
+        try:
+            return listener(event)
+        finally:
+            stats.record(listener, time.perf_counter() - start)
+    except Exception as e:
+        # Log the error but don't let it break other listeners
+        report_listener_error(listener, event, e)
+        return None
+
 
 class EventListenerMixin:
     """
@@ -44,8 +154,20 @@ class EventListenerMixin:
 
     def __init__(self):
         self._event_listeners: List[Callable[[ChangeEvent], None]] = []
+        # Listeners delivered through a dispatcher, the others are called inline
+        self._listener_dispatchers: Dict[Callable, 'AbstractEventDispatcher'] = {}
+        # Path-pattern subscriptions, created on the first `subscribe`
+        self._subscriptions: Optional[PathTrie] = None
+        # The change journal, created by `enable_journal`
+        self._journal: Optional['ChangeJournal'] = None
 
-    def on_change(self, callback: Callable[[ChangeEvent], None] | None = None):
+    def on_change(
+        self,
+        callback: Callable[[ChangeEvent], None] | None = None,
+        dispatcher: 'AbstractEventDispatcher | None' = None,
+        debounce: float | None = None,
+        throttle: float | None = None,
+    ):
         """
         Register a change-event listener.
 
@@ -57,20 +179,58 @@ class EventListenerMixin:
             item.on_change(handler)           # direct call
 
             item.on_change(handler).attr ...  # method-chaining
+
+            # Delivered from a worker thread instead of the notifying one
+            item.on_change(handler, dispatcher=QueuedDispatcher())
+
+            # Bursts of changes coalesced into their final value
+            item.on_change(handler, debounce=0.5)
+            item.on_change(handler, throttle=1.0)
         """
 
         # Decorator form ─ caller used @item.on_change()
         if callback is None:
 
             def decorator(fn):
-                self.on_change(fn)
+                self.on_change(
+                    fn, dispatcher=dispatcher, debounce=debounce, throttle=throttle
+                )
                 return fn
 
             return decorator
 
-        # Direct call form
-        if callback not in self._event_listeners:
-            self._event_listeners.append(callback)
+        stats = listener_stats._listener_stats
+        if stats is not None:
+            stats.register(callback, listener_stats.registration_site())
+
+        if debounce is not None or throttle is not None:
+            from fastcfg.config.timers import DebouncedListener, ThrottledListener
+
+            if debounce is not None and throttle is not None:
+                raise ValueError("Use either debounce or throttle, not both.")
+
+            # The wrapper is called inline and hands the coalesced events to
+            # the dispatcher itself
+            if debounce is not None:
+                listener = DebouncedListener(callback, debounce, dispatcher)
+            else:
+                listener = ThrottledListener(callback, throttle, dispatcher)
+            dispatcher = None
+        else:
+            listener = callback
+
+        # Direct call form, re-registering replaces the listener in place
+        try:
+            index = self._event_listeners.index(callback)
+        except ValueError:
+            self._event_listeners.append(listener)
+        else:
+            self._event_listeners[index] = listener
+
+        if dispatcher is not None:
+            self._listener_dispatchers[callback] = dispatcher
+        else:
+            self._listener_dispatchers.pop(callback, None)
 
         return callback  # allow method chaining
 
@@ -78,42 +238,70 @@ class EventListenerMixin:
     def remove_change_listener(self, callback: Callable[[ChangeEvent], None]):
         if callback in self._event_listeners:
             self._event_listeners.remove(callback)
+        self._listener_dispatchers.pop(callback, None)
 
-    def notify_change(self, item: 'LiveConfigItem', old_value: Any, new_value: Any):
-        """Notify all listeners of a change event."""
+    def notify_change(
+        self,
+        item: 'LiveConfigItem',
+        old_value: Any,
+        new_value: Any,
+        path: Tuple[str, ...] = (),
+        event: ChangeEvent | None = None,
+    ):
+        """
+        Notify all listeners of a change event, then propagate it to the parents.
 
-        def notify_parents(item: 'LiveConfigItem', old_value: Any, new_value: Any):
-            # Propagate the change event to the parent config
-            # Use is not None to avoid recursive calls to .value
-            if self._parent is not None:
-                self._parent.notify_change(item, old_value, new_value)
+        Args:
+            item: The configuration item that changed
+            old_value: The previous value
+            new_value: The new value
+            path: The item's path relative to this object, extended at each level
+            event: The event built by a lower level, shared by the whole chain
+        """
+        subscriptions = self._subscriptions
+        journal = self._journal
 
-        # If there are no listeners, do nothing to save on overhead
-        if len(self._event_listeners) == 0:
+        # If there are no listeners, skip building the event to save on overhead
+        if self._event_listeners or subscriptions or journal is not None:
+            if event is None:
+                event = ChangeEvent(item, old_value, new_value)
 
-            # Even if there are no listeners, the parents might have listeners
-            # so we need to notify them
-            notify_parents(item, old_value, new_value)
-            return
+            if journal is not None:
+                journal.record(".".join(path), event)
 
-        event = ChangeEvent(
-            item=item,
-            old_value=old_value,
-            new_value=new_value,
-            timestamp=datetime.now()
-        )
+            self._deliver(event)
 
-        for listener in self._event_listeners:
-            try:
-                listener(event)
-            except Exception as e:
-                traceback.print_exc()
-                # Log the error but don't let it break other listeners
-                print(f"Error in event listener: {e}")
+            if subscriptions:
+                self._deliver_matches(event, path)
 
         # Recursively notify parents of the change upwards
-        notify_parents(item, old_value, new_value)
+        # Use is not None to avoid recursive calls to .value
+        if self._parent is not None:
+            self._parent.notify_change(
+                item, old_value, new_value, (self._name,) + path, event
+            )
+
+    def _deliver(self, event: 'ChangeEvent | ChangeSet'):
+        """Deliver an event to this object's listeners only, without propagating it."""
+        dispatchers = self._listener_dispatchers
+
+        for listener in self._event_listeners:
+            dispatcher = dispatchers.get(listener) if dispatchers else None
+            if dispatcher is None:
+                call_listener(listener, event)
+            else:
+                dispatch_listener(dispatcher, listener, event)
+
+    def _deliver_matches(self, event: ChangeEvent, path: Tuple[str, ...]):
+        """Deliver an event to the subscriptions whose pattern matches its path."""
+        for listener, dispatcher in self._subscriptions.match(path):
+            if dispatcher is None:
+                call_listener(listener, event)
+            else:
+                dispatch_listener(dispatcher, listener, event)
 
     def clear_all_on_change(self):
-        """Remove all listeners."""
-        self._event_listeners.clear()
\ No newline at end of file
+        """Remove all listeners and subscriptions."""
+        self._event_listeners.clear()
+        self._listener_dispatchers.clear()
+        self._subscriptions = None
\ No newline at end of file
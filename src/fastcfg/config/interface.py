@@ -10,7 +10,13 @@ from fastcfg.config.items import AbstractConfigItem
 from fastcfg.config.base import AbstractConfigUnit
 from fastcfg.config.utils import potentially_has_children, deep_merge_config
 from fastcfg.validation.validatable import ValidatableMixin
+from fastcfg.exceptions import InvalidOperationError
 from fastcfg.config.events import EventListenerMixin
+from fastcfg.config import listener_stats
+from fastcfg.config.batch import batched
+from fastcfg.config.journal import MISSING, ChangeJournal
+from fastcfg.config.subscriptions import PathTrie
+from fastcfg.config.watch import ConfigWatch
 import pickle
 
 class ConfigInterface(ValidatableMixin, EventListenerMixin, AbstractConfigUnit):
@@ -28,6 +34,14 @@ class ConfigInterface(ValidatableMixin, EventListenerMixin, AbstractConfigUnit):
         __init__(config_attributes, **kwargs): Initializes the `ConfigInterface` object.
         set_environment(env): Sets the current environment.
         get_environment(): Retrieves the current environment.
+        batch(): Batches the changes made inside a `with` block.
+        subscribe(pattern, callback): Subscribes a listener to the items matching a path pattern.
+        unsubscribe(pattern, callback): Removes a path-pattern subscription.
+        watch(path, maxsize): Iterates over the changes under a path asynchronously.
+        enable_journal(capacity): Starts recording the changes made under this config.
+        disable_journal(): Stops recording changes and discards the journal.
+        get_journal(): Retrieves the change journal, if enabled.
+        rollback(to_seq): Reverts the changes recorded after a sequence number.
         to_dict(): Returns the configuration attributes as a dictionary.
         value: Property that gets the configuration attributes as a dictionary.
     """
@@ -43,13 +57,90 @@ class ConfigInterface(ValidatableMixin, EventListenerMixin, AbstractConfigUnit):
         super().__init__()
         self._config = config
         self._parent = None
+        self._name = None
         self._config_attributes = config_attributes
         self._current_env = None
 
-    def set_parent(self, parent: 'Config'):
-        """Set the parent Config object."""
+    def set_parent(self, parent: 'Config', name: str | None = None):
+        """Set the parent Config object and this config's attribute name in it."""
 
         self._parent = parent
+        self._name = name
+
+    def subscribe(self, pattern: str, callback=None, dispatcher=None):
+        """
+        Subscribes a listener to the changes of every item matching a path pattern.
+
+        The pattern is a dotted path relative to this config, where `*` matches
+        exactly one segment and `**` any number of segments. Matching listeners
+        receive the item's `ChangeEvent`, including within batches.
+
+        Usage:
+            @config.subscribe("database.*.host")
+            def handler(event): ...
+
+            config.subscribe("**.timeout", handler, dispatcher=QueuedDispatcher())
+
+        Args:
+            pattern (str): The path pattern.
+            callback: The listener. If omitted, returns a decorator.
+            dispatcher: The dispatcher delivering its events. Defaults to calling it inline.
+
+        Returns:
+            The listener, or a decorator registering it.
+
+        Raises:
+            ValueError: If the pattern is empty or has an empty segment.
+        """
+        if callback is None:
+
+            def decorator(fn):
+                self.subscribe(pattern, fn, dispatcher=dispatcher)
+                return fn
+
+            return decorator
+
+        stats = listener_stats._listener_stats
+        if stats is not None:
+            stats.register(callback, listener_stats.registration_site())
+
+        if self._subscriptions is None:
+            self._subscriptions = PathTrie()
+        self._subscriptions.add(pattern, callback, dispatcher)
+
+        return callback
+
+    def unsubscribe(self, pattern: str, callback) -> bool:
+        """
+        Removes a listener subscribed to a path pattern.
+
+        Returns:
+            bool: Whether the subscription existed.
+        """
+        if self._subscriptions is None:
+            return False
+        return self._subscriptions.remove(pattern, callback)
+
+    def watch(self, path: str | None = None, maxsize: int = 0) -> ConfigWatch:
+        """
+        Watches the changes of an item or subtree as an async iterator.
+
+        Must be called with an event loop running. Changes notified from any
+        thread are queued on that loop, without polling.
+
+        Usage:
+            async with config.watch("feature_flags") as changes:
+                async for change in changes:
+                    ...
+
+        Args:
+            path (str | None): The dotted path of the watched item or subtree. Defaults to this config.
+            maxsize (int): The largest number of queued events before dropping the oldest, 0 for no limit.
+
+        Returns:
+            ConfigWatch: The async iterator, to close once done.
+        """
+        return ConfigWatch(self, path, maxsize)
 
     def update(self, other=None, **kwargs) -> "ConfigInterface":
         """
@@ -59,6 +150,10 @@ class ConfigInterface(ValidatableMixin, EventListenerMixin, AbstractConfigUnit):
         If an environment is currently active, updates will only affect that environment.
         Dictionaries are automatically converted to Config objects.
 
+        The update runs as a batch: validators run once the whole update is applied,
+        and each config above the changed items receives a single `ChangeSet`.
+        If validation fails, the update is rolled back.
+
         Args:
             other: A dict-like object or iterable of key-value pairs.
             **kwargs: Additional keyword arguments.
@@ -68,23 +163,119 @@ class ConfigInterface(ValidatableMixin, EventListenerMixin, AbstractConfigUnit):
             target = getattr(self._config, self._current_env)
         else:
             target = self._config
-        
-        # Process the main data
-        if other is not None:
-            if hasattr(other, 'items'):
-                # Handle dict-like objects
-                deep_merge_config(target, other)
-            else:
-                # Handle sequence of pairs
-                deep_merge_config(target, dict(other))
-        
-        # Handle keyword arguments
-        if kwargs:
-            deep_merge_config(target, kwargs)
+
+        # Validate and notify once for the whole update
+        with batched(self._config):
+            # Process the main data
+            if other is not None:
+                if hasattr(other, 'items'):
+                    # Handle dict-like objects
+                    deep_merge_config(target, other)
+                else:
+                    # Handle sequence of pairs
+                    deep_merge_config(target, dict(other))
+
+            # Handle keyword arguments
+            if kwargs:
+                deep_merge_config(target, kwargs)
 
         # Allows for method chaining
         return self
     
+    def batch(self):
+        """
+        Batches the changes made inside a `with` block.
+
+        Validation is deferred to the end of the block. Each changed item then
+        receives one `ChangeEvent` with its net change, and each config above the
+        changed items receives one `ChangeSet` aggregating the changes under it.
+        If the block raises or validation fails, the changes are rolled back.
+
+        Usage:
+            with config.batch():
+                config.database.host = "db.internal"
+                config.database.port = 6432
+
+        Returns:
+            A context manager yielding the `ConfigBatch`.
+        """
+        return batched(self._config)
+
+    def enable_journal(self, capacity: int = 10_000) -> ChangeJournal:
+        """
+        Starts recording the changes made under this config in a bounded journal.
+
+        Args:
+            capacity (int): The largest number of retained changes. Defaults to 10,000.
+
+        Returns:
+            ChangeJournal: The journal, or the existing one if already enabled.
+        """
+        if self._journal is None:
+            self._journal = ChangeJournal(capacity)
+        return self._journal
+
+    def disable_journal(self) -> "ConfigInterface":
+        """
+        Stops recording changes and discards the journal.
+        """
+        self._journal = None
+
+        # Allows for method chaining
+        return self
+
+    def get_journal(self) -> ChangeJournal | None:
+        """
+        Retrieves the change journal, or None if it isn't enabled.
+        """
+        return self._journal
+
+    def rollback(self, to_seq: int) -> "ConfigInterface":
+        """
+        Reverts the changes recorded after a sequence number, most recent first.
+
+        The rollback runs as a batch and is itself journaled as new changes.
+        Changes of live items come from their source and are not reverted.
+        Attributes added after `to_seq` are removed, and attributes removed after
+        it are added back.
+
+        Args:
+            to_seq (int): The sequence number to return to.
+
+        Raises:
+            InvalidOperationError: If the journal isn't enabled.
+            JournalTruncatedError: If changes after `to_seq` were already evicted.
+        """
+        if self._journal is None:
+            raise InvalidOperationError("Enable the journal before rolling back.")
+
+        entries = self._journal.changes_since(to_seq)
+
+        with self.batch():
+            for entry in reversed(entries):
+                # Added and removed live items are reverted like any other attribute
+                if (
+                    entry.live
+                    and entry.old_value is not MISSING
+                    and entry.new_value is not MISSING
+                ):
+                    continue
+
+                *parents, name = entry.path.split(".")
+                target = self._config
+                for parent in parents:
+                    target = getattr(target, parent)
+
+                if entry.old_value is MISSING:
+                    # Unless it was removed since
+                    if target.__dict__["__attributes"].has_attribute(name):
+                        delattr(target, name)
+                else:
+                    setattr(target, name, entry.old_value)
+
+        # Allows for method chaining
+        return self
+
     def save(self, file_path: str):
         """
         Saves the full configuration state to a file.
@@ -109,6 +300,7 @@ class ConfigInterface(ValidatableMixin, EventListenerMixin, AbstractConfigUnit):
     def import_values(self, file_path: str):
         """
         Imports the current configuration values from a file using deep merge.
+        Like `update`, the import runs as a single batch.
         
         If an environment is currently active, the import will only affect that environment.
         If no environment is active, the import will affect the root configuration.
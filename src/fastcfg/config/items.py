@@ -34,6 +34,7 @@ from fastcfg.config.value_wrapper import ValueWrapper
 from fastcfg.exceptions import InvalidOperationError
 from fastcfg.validation.validatable import ValidatableMixin
 from fastcfg.config.events import EventListenerMixin
+from fastcfg.config.batch import batch_for
 
 from typing import TYPE_CHECKING
 
@@ -42,6 +43,14 @@ if TYPE_CHECKING:
 else:
     Config = None
 
+def _config_of(config_item) -> 'Config':
+    """The config holding an item, looking through the dict-valued items holding key items."""
+    parent = config_item._parent
+    while isinstance(parent, AbstractConfigItem):
+        parent = parent._parent
+    return parent
+
+
 def _notify_if_changed(config_item, old_value, new_value):
     """
     Helper function to notify listeners if a configuration value has changed.
@@ -55,7 +64,12 @@ def _notify_if_changed(config_item, old_value, new_value):
         new_value: The current value
     """
     if old_value != new_value:
-        config_item.notify_change(config_item, old_value, new_value)
+        batch = batch_for(_config_of(config_item))
+        if batch is not None:
+            # Notified once, when the batch commits
+            batch.record_change(config_item, old_value, new_value)
+        else:
+            config_item.notify_change(config_item, old_value, new_value)
 
 
 class AbstractConfigItem(ValidatableMixin, EventListenerMixin, ABC):
@@ -92,9 +106,12 @@ class AbstractConfigItem(ValidatableMixin, EventListenerMixin, ABC):
         self._wrapped_dict_items: Dict[str, AbstractConfigItem] = {}
 
         self._parent: 'Config' = None
+        # The attribute name of the item in its parent
+        self._name: str | None = None
 
-    def set_parent(self, parent: 'Config'):
+    def set_parent(self, parent: 'Config', name: str | None = None):
         self._parent = parent
+        self._name = name
 
     @property
     def value(self) -> Any:
@@ -114,22 +131,61 @@ class AbstractConfigItem(ValidatableMixin, EventListenerMixin, ABC):
 
         val = self._get_value()
 
-        return_item = val
-
         if isinstance(val, dict):
-            # Iterate over each key-value pair in the dictionary
-            for k, v in val.items():
+            return self._sync_dict_items(val)
+
+        return val
 
-                # If the key is not already wrapped, wrap it in a ValueWrapper
-                if k not in self._wrapped_dict_items:
-                    self._wrapped_dict_items[k] = ValueWrapper.factory(
-                        BuiltInConfigItem(v)
-                    )
+    def _sync_dict_items(self, val: dict, changes: list | None = None) -> Dict[str, Any]:
+        """
+        Updates the wrapped dictionary items to match a dictionary value.
 
-            # Set the return item to the wrapped dictionary items
-            return_item = self._wrapped_dict_items
+        Each key keeps its item across updates, so listeners registered on a key
+        stay attached. Keys holding nested dictionaries are synced recursively.
 
-        return return_item
+        Args:
+            val (dict): The current dictionary value.
+            changes (list | None): Receives an `(item, old_value, new_value)` tuple per added,
+                removed or changed key. Added keys have an old value of None, removed keys
+                a new value of None.
+
+        Returns:
+            Dict[str, Any]: The wrapped dictionary items.
+        """
+        wrapped = self._wrapped_dict_items
+
+        for k, v in val.items():
+            wrapper = wrapped.get(k)
+
+            if wrapper is None:
+                item = BuiltInConfigItem(v)
+                item.set_parent(self, k)
+                wrapped[k] = ValueWrapper.factory(item)
+                if changes is not None:
+                    changes.append((item, None, v))
+                continue
+
+            item = wrapper._item
+            old = item._value
+            if old == v:
+                continue
+
+            item._value = v
+            if isinstance(old, dict) and isinstance(v, dict):
+                # Diff nested keys instead of reporting the whole dictionary
+                if not item._wrapped_dict_items:
+                    item._sync_dict_items(old)
+                item._sync_dict_items(v, changes)
+            elif changes is not None:
+                changes.append((item, old, v))
+
+        if len(wrapped) > len(val):
+            for k in [k for k in wrapped if k not in val]:
+                item = wrapped.pop(k)._item
+                if changes is not None:
+                    changes.append((item, item._value, None))
+
+        return wrapped
 
     @abstractmethod
     def _get_value(self) -> Any:
@@ -289,23 +345,39 @@ class LiveConfigItem(AbstractConfigItem):
         This property retrieves the current state from the state tracker by calling the `_get_value` method.
         It also triggers validation to ensure the state is valid.
 
+        If the state is a dictionary, such as a JSON document, it is diffed against the previous one
+        and each added, removed or changed key notifies its own item. The events propagate through
+        this item, so its listeners receive every key change, while listeners on a key only receive
+        that key's changes.
+
         Returns:
             Any: The current state of the configuration item.
         """
-        val = super().value
+        val = self._get_value()
 
+        # Trigger validation, on the state already fetched
+        self._validate_state(val)
 
-        # Trigger validation
-        self.validate()
+        if isinstance(val, dict):
+            # Notify each added, removed or changed key instead of the whole dictionary
+            changes = []
+            return_item = self._sync_dict_items(val, changes)
+            for item, old_value, new_value in changes:
+                _notify_if_changed(item, old_value, new_value)
+        else:
+            # Keys of a previous dictionary are added again if it comes back
+            if self._wrapped_dict_items:
+                self._wrapped_dict_items = {}
+
+            # Check for changes from external sources and notify if changed
+            _notify_if_changed(self, self._previous_value, val)
+            return_item = val
 
-        # Check for changes from external sources and notify if changed
-        _notify_if_changed(self, self._previous_value, val)
-        
         # Always update previous value after potential notification
         self._previous_value = val
 
         # Return the value
-        return val
+        return return_item
     
     def as_callable(self):
         """
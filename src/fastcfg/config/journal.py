@@ -0,0 +1,232 @@
+"""
+A bounded journal of the changes made under a config.
+
+Once enabled with `config.enable_journal()`, every change notified under the
+config is appended to a ring buffer with a sequence number. Consumers catch up
+by replaying the changes since the last sequence number they saw, instead of
+diffing full `to_dict()` dumps, and `config.rollback(seq)` reverts the config to
+its state at a sequence number.
+
+Classes:
+    JournalEntry: One recorded change.
+    ChangeJournal: A ring buffer of the most recent changes.
+
+Functions:
+    record_attribute_change(config, name, item, old_value, new_value): Journal an
+        attribute added to or removed from a config.
+
+Usage Example:
+    journal = config.enable_journal(capacity=10_000)
+    seq = journal.last_seq
+
+    config.database.host = "db.internal"
+
+    for entry in journal.changes_since(seq):
+        print(entry.seq, entry.path, entry.old_value, entry.new_value)
+
+    config.rollback(seq)
+
+Attributes added to a config are journaled with `MISSING` as their old value,
+so rolling back past their addition removes them. Removed attributes are
+journaled with `MISSING` as their new value, so rolling back past their removal
+restores them.
+"""
+
+import threading
+from collections import deque
+from itertools import islice
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Deque, List
+
+from fastcfg.config.events import ChangeEvent
+from fastcfg.exceptions import JournalTruncatedError
+
+if TYPE_CHECKING:
+    from fastcfg.config.cfg import Config
+
+
+class _Missing:
+    """The value of an attribute that didn't exist before or after a change."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self) -> str:
+        # Unpickles as the module's singleton, so `is MISSING` keeps working
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """
+    One recorded change.
+
+    Attributes:
+        seq (int): The sequence number, increasing by one per change.
+        path (str): The dotted path of the changed item, relative to the journaled config.
+        old_value (Any): The previous value, or `MISSING` if the change added the attribute.
+        new_value (Any): The new value, or `MISSING` if the change removed the attribute.
+        monotonic_ns (int): When the change occurred, as returned by `time.monotonic_ns()`.
+        live (bool): Whether the item is a live item, or a key of one, whose changes come
+            from its source.
+    """
+
+    seq: int
+    path: str
+    old_value: Any
+    new_value: Any
+    monotonic_ns: int
+    live: bool = False
+
+
+def _is_live(item: Any) -> bool:
+    """Whether an item is a live item, or the key item of a dict-valued live item."""
+    # Imported here, items depend on the event system that feeds the journal
+    from fastcfg.config.items import AbstractConfigItem, LiveConfigItem
+
+    while isinstance(item, AbstractConfigItem):
+        if isinstance(item, LiveConfigItem):
+            return True
+        item = item._parent
+    return False
+
+
+class ChangeJournal:
+    """
+    A ring buffer of the most recent changes, with O(1) appends.
+
+    Once `capacity` changes are retained, each new change evicts the oldest one.
+
+    Attributes:
+        capacity (int): The largest number of retained changes.
+        last_seq (int): The sequence number of the latest change, 0 before any.
+        first_seq (int): The sequence number of the oldest retained change.
+
+    Methods:
+        record(path, event): Append a change.
+        changes_since(seq): The retained changes after a sequence number.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        """
+        Initialize the journal.
+
+        Args:
+            capacity (int): The largest number of retained changes. Defaults to 10,000.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+
+        self.capacity = capacity
+        self._entries: Deque[JournalEntry] = deque(maxlen=capacity)
+        self._last_seq = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        """The sequence number of the latest change, 0 before any."""
+        return self._last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """The sequence number of the oldest retained change."""
+        with self._lock:
+            return self._first_seq()
+
+    def _first_seq(self) -> int:
+        return self._last_seq - len(self._entries) + 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, path: str, event: Any) -> JournalEntry:
+        """
+        Append a change.
+
+        Args:
+            path (str): The dotted path of the changed item.
+            event (ChangeEvent): The change.
+
+        Returns:
+            JournalEntry: The recorded entry.
+        """
+        live = _is_live(event.item)
+
+        with self._lock:
+            self._last_seq += 1
+            entry = JournalEntry(
+                self._last_seq,
+                path,
+                event.old_value,
+                event.new_value,
+                event.monotonic_ns,
+                live,
+            )
+            self._entries.append(entry)
+        return entry
+
+    def changes_since(self, seq: int) -> List[JournalEntry]:
+        """
+        The retained changes after a sequence number, oldest first.
+
+        Args:
+            seq (int): The last sequence number the caller has seen.
+
+        Returns:
+            List[JournalEntry]: The changes with a greater sequence number.
+
+        Raises:
+            JournalTruncatedError: If some of those changes were already evicted.
+        """
+        with self._lock:
+            first_seq = self._first_seq()
+            if seq < first_seq - 1:
+                raise JournalTruncatedError(seq, first_seq)
+
+            start = max(seq - first_seq + 1, 0)
+            return list(islice(self._entries, start, None))
+
+
+def record_attribute_change(
+    config: "Config", name: str, item: Any, old_value: Any, new_value: Any
+) -> None:
+    """
+    Journal an attribute added to or removed from a config, in the journals of
+    every config above it.
+
+    Additions and removals fire no change event, so they are recorded here with
+    `MISSING` as the old value of an addition and the new value of a removal.
+
+    Args:
+        config (Config): The config the attribute was added to or removed from.
+        name (str): The name of the attribute.
+        item (Any): The added or removed item.
+        old_value (Any): The value it was removed with, or `MISSING`.
+        new_value (Any): The value it was added with, or `MISSING`.
+    """
+    event = None
+    path = (name,)
+
+    while config is not None:
+        interface = config.__dict__["__interface"]
+        if interface._journal is not None:
+            if event is None:
+                event = ChangeEvent(item, old_value, new_value)
+            interface._journal.record(".".join(path), event)
+        path = (interface._name,) + path
+        config = interface._parent
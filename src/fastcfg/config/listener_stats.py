@@ -0,0 +1,279 @@
+"""
+Latency statistics for change listeners, and slow-listener detection.
+
+Once enabled with `enable_listener_stats`, every listener call is timed into a
+per-listener `LatencyHistogram`, so expensive `on_change` callbacks can be found
+from the running process. With a `slow_threshold`, calls taking longer are
+reported along with the place the listener was registered.
+
+Each listener is timed separately, even when several share a qualified name,
+like lambdas; the name only labels their timings. Registration sites are only
+captured for listeners registered while the statistics are enabled. Coroutine
+listeners are timed until they return their coroutine, not until it completes.
+
+Classes:
+    ListenerTiming: The timings of one listener.
+    ListenerStats: The timings of every listener, with slow-call reporting.
+
+Functions:
+    enable_listener_stats(slow_threshold, on_slow): Start timing listener calls.
+    disable_listener_stats(): Stop timing listener calls.
+    get_listener_stats(): Get the statistics being collected, if enabled.
+
+Usage Example:
+    from fastcfg.config.listener_stats import enable_listener_stats
+
+    stats = enable_listener_stats(slow_threshold=0.05)
+    ...
+    for timing in stats.slowest(5):
+        print(timing.name, timing.quantile(0.99), timing.registration_site)
+"""
+
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+from fastcfg.config.error_sinks import describe_listener
+from fastcfg.hedging import LatencyHistogram
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def registration_site() -> Optional[str]:
+    """The first caller outside of fastcfg on the current stack, as "file:line in function"."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not os.path.abspath(filename).startswith(_PACKAGE_DIR + os.sep):
+            return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _listener_key(listener: Callable) -> Any:
+    """A key identifying a listener, holding it weakly when it can be."""
+    listener = getattr(listener, "callback", listener)
+    try:
+        # Bound methods are created on each access, so they're held by their parts
+        if inspect.ismethod(listener):
+            return weakref.WeakMethod(listener)
+        return weakref.ref(listener)
+    except TypeError:
+        return listener
+
+
+class ListenerTiming:
+    """
+    The timings of one listener.
+
+    Attributes:
+        name (str): The listener's qualified name, labelling the timings.
+        registration_site (Optional[str]): Where the listener was registered, if captured.
+        calls (int): The number of timed calls.
+        total_seconds (float): The time spent in the listener.
+        max_seconds (float): The longest call.
+        histogram (LatencyHistogram): The recent call latencies.
+
+    Methods:
+        mean(): The mean call latency.
+        quantile(q): Estimate a call latency quantile.
+    """
+
+    def __init__(self, name: str, registration_site: Optional[str] = None):
+        self.name = name
+        self.registration_site = registration_site
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = LatencyHistogram()
+
+    def record(self, seconds: float) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.histogram.record(seconds)
+
+    def mean(self) -> float:
+        """The mean call latency in seconds, 0 before any call."""
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a call latency quantile in seconds, within about 20%."""
+        return self.histogram.quantile(q)
+
+    def __repr__(self) -> str:
+        return (
+            f"ListenerTiming(name={self.name!r}, calls={self.calls}, "
+            f"mean={self.mean():.6f}s, max={self.max_seconds:.6f}s)"
+        )
+
+
+def _log_slow_call(timing: ListenerTiming, seconds: float) -> None:
+    logging.getLogger("fastcfg.events").warning(
+        "Slow event listener %s took %.1f ms (registered at %s)",
+        timing.name,
+        seconds * 1000,
+        timing.registration_site or "an unknown site",
+    )
+
+
+class ListenerStats:
+    """
+    The timings of every listener, with slow-call reporting.
+
+    Attributes:
+        slow_threshold (Optional[float]): Calls taking at least this many seconds are reported.
+        on_slow (Callable[[ListenerTiming, float], None]): Receives each slow call. Defaults to
+            logging a warning to the `fastcfg.events` logger.
+        report_interval (float): The shortest time between two reports for the same listener.
+
+    Methods:
+        record(listener, seconds): Record one listener call.
+        register(listener, site): Record where a listener was registered.
+        get(listener): The timings of a listener, or of the first one with a name.
+        timings(): The timings of every listener.
+        slowest(n): The listeners with the highest mean latency.
+        reset(): Discard every timing.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: Optional[float] = None,
+        on_slow: Optional[Callable[[ListenerTiming, float], None]] = None,
+        report_interval: float = 60.0,
+    ):
+        """
+        Initialize the statistics.
+
+        Args:
+            slow_threshold (Optional[float]): Report calls taking at least this many seconds.
+                Defaults to no reporting.
+            on_slow (Optional[Callable[[ListenerTiming, float], None]]): Receives each slow call.
+                Defaults to logging a warning.
+            report_interval (float): The shortest time between two reports for the same
+                listener, in seconds. Defaults to 60.
+        """
+        self.slow_threshold = slow_threshold
+        self.on_slow = on_slow if on_slow is not None else _log_slow_call
+        self.report_interval = report_interval
+        # Keyed by `_listener_key`
+        self._timings: Dict[Any, ListenerTiming] = {}
+        self._sites: Dict[Any, str] = {}
+        self._last_reports: Dict[Any, float] = {}
+        self._lock = threading.Lock()
+
+    def _timing(self, key: Any, listener: Callable) -> ListenerTiming:
+        timing = self._timings.get(key)
+        if timing is None:
+            timing = self._timings[key] = ListenerTiming(
+                describe_listener(listener), self._sites.get(key)
+            )
+        return timing
+
+    def register(self, listener: Callable, site: Optional[str]) -> None:
+        """Record where a listener was registered."""
+        if site is None:
+            return
+        key = _listener_key(listener)
+        with self._lock:
+            self._sites[key] = site
+            timing = self._timings.get(key)
+            if timing is not None:
+                timing.registration_site = site
+
+    def record(self, listener: Callable, seconds: float) -> None:
+        """Record one listener call, reporting it if it was slow."""
+        key = _listener_key(listener)
+        with self._lock:
+            timing = self._timing(key, listener)
+            timing.record(seconds)
+
+            if self.slow_threshold is None or seconds < self.slow_threshold:
+                return
+
+            now = time.monotonic()
+            last_report = self._last_reports.get(key)
+            if (
+                last_report is not None
+                and now - last_report < self.report_interval
+            ):
+                return
+            self._last_reports[key] = now
+
+        self.on_slow(timing, seconds)
+
+    def get(self, listener: Any) -> Optional[ListenerTiming]:
+        """
+        The timings of a listener.
+
+        Args:
+            listener (Any): The listener, or a qualified name to get the first
+                listener timed under it.
+
+        Returns:
+            Optional[ListenerTiming]: The timings, or None if it was never timed.
+        """
+        if isinstance(listener, str):
+            for timing in self.timings():
+                if timing.name == listener:
+                    return timing
+            return None
+        return self._timings.get(_listener_key(listener))
+
+    def timings(self) -> List[ListenerTiming]:
+        """The timings of every listener."""
+        with self._lock:
+            return list(self._timings.values())
+
+    def slowest(self, n: int = 10) -> List[ListenerTiming]:
+        """The `n` listeners with the highest mean latency."""
+        return sorted(self.timings(), key=ListenerTiming.mean, reverse=True)[
+            :n
+        ]
+
+    def reset(self) -> None:
+        """Discard every timing, keeping the registration sites."""
+        with self._lock:
+            self._timings.clear()
+            self._last_reports.clear()
+
+
+_listener_stats: Optional[ListenerStats] = None
+
+
+def enable_listener_stats(
+    slow_threshold: Optional[float] = None,
+    on_slow: Optional[Callable[[ListenerTiming, float], None]] = None,
+    report_interval: float = 60.0,
+) -> ListenerStats:
+    """
+    Start timing listener calls.
+
+    Args:
+        slow_threshold (Optional[float]): Report calls taking at least this many seconds.
+        on_slow (Optional[Callable[[ListenerTiming, float], None]]): Receives each slow call.
+        report_interval (float): The shortest time between two reports for the same listener.
+
+    Returns:
+        ListenerStats: The statistics being collected.
+    """
+    global _listener_stats
+    _listener_stats = ListenerStats(slow_threshold, on_slow, report_interval)
+    return _listener_stats
+
+
+def disable_listener_stats() -> None:
+    """Stop timing listener calls."""
+    global _listener_stats
+    _listener_stats = None
+
+
+def get_listener_stats() -> Optional[ListenerStats]:
+    """Get the statistics being collected, or None if they aren't enabled."""
+    return _listener_stats
@@ -1,12 +1,23 @@
+import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
-
-from fastcfg.backoff import exponential_backoff
+from typing import Any, Callable, Iterable, Optional, Set, Tuple
+
+from fastcfg.backoff import (
+    BackoffMetrics,
+    backoff_delay,
+    call_with_backoff,
+    record_success,
+    report_metrics,
+    should_retry,
+    try_acquire_retry,
+)
 from fastcfg.backoff.policies import BackoffPolicy
 from fastcfg.cache import Cache
 from fastcfg.default import defaults
 from fastcfg.exceptions import MissingCacheKeyError
+from fastcfg.hedging import Hedger, HedgingPolicy
 
 
 
@@ -52,6 +63,66 @@ class AbstractStateTracker(ABC):
         """
 
 
+class RetryState:
+    """
+    The retry progress of a tracker, kept across reads.
+
+    Attributes:
+        has_value (bool): Whether a fetch ever succeeded.
+        last_value (Any): The value of the last successful fetch.
+        last_error (Exception): The error of the last failed fetch, if any.
+        attempt (int): The number of background retries made in the current round,
+            after the failed read that started it.
+        retrying (bool): Whether a round of background retries is in progress.
+    """
+
+    def __init__(self):
+        self.has_value = False
+        self.last_value: Any = None
+        self.last_error: Optional[Exception] = None
+        self.attempt = 0
+        self.retrying = False
+        self.lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Retries in progress don't survive the process
+        del state["lock"]
+        state["retrying"] = False
+        state["attempt"] = 0
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def succeeded(self, value: Any) -> None:
+        """Record a successful fetch."""
+        self.has_value = True
+        self.last_value = value
+        self.last_error = None
+
+
+def _report_attempts(
+    policy: BackoffPolicy,
+    start: float,
+    attempts: int,
+    total_time_slept: float,
+    error: Optional[Exception] = None,
+) -> None:
+    """Report a read's attempts to the policy's metrics hook, as `call_with_backoff` does."""
+    report_metrics(
+        policy,
+        BackoffMetrics(
+            attempts=attempts,
+            total_time_slept=total_time_slept,
+            elapsed=time.monotonic() - start,
+            succeeded=error is None,
+            error=error,
+        ),
+    )
+
+
 class RetriableMixin:
     """
     Mixin providing retry logic.
@@ -59,17 +130,26 @@ class RetriableMixin:
     Purpose:
         - This mixin adds retry capabilities to state tracker classes that need to handle transient failures.
         - It uses an exponential backoff strategy to retry operations.
+        - With `retry_in_background`, a failed read returns the last good value
+          right away and the retries continue on a background thread, following
+          the backoff schedule. Reads made meanwhile don't call the source.
 
     Attributes:
         _retry (bool): Whether to enable retry logic.
-        _backoff_policy (BackoffPolicy): The backoff policy to use.
+        _retry_in_background (bool): Whether to retry in the background and serve the last good value.
+        _backoff_policy (BackoffPolicy): The backoff policy to use, `None` for `defaults.backoff_policy`.
+        _retry_state (RetryState): The retry progress, kept across reads.
 
     Methods:
         _call_retriable_function(func, *args, **kwargs): Calls a function with optional backoff.
+        _on_retry_success(value): Called when a background retry succeeds, override in child classes.
     """
 
     def __init__(
-        self, retry: bool = False, backoff_policy: BackoffPolicy = None
+        self,
+        retry: bool = False,
+        backoff_policy: BackoffPolicy = None,
+        retry_in_background: bool = False,
     ):
         """
         Initializes the RetriableMixin.
@@ -78,9 +158,15 @@ class RetriableMixin:
             retry (bool): Whether to enable retry logic.
             backoff_policy (BackoffPolicy, optional): The backoff policy to use. Defaults to `defaults.backoff_policy`.
             See `fastcfg.default` package for more details.
+            retry_in_background (bool): Whether failed reads return the last good value while
+            retrying in the background. Reads without a previous good value still retry inline.
         """
         self._retry = retry
-        self._backoff_policy = backoff_policy or defaults.backoff_policy
+        self._retry_in_background = retry_in_background
+        # Resolved on use, so the tracker follows changes to the defaults
+        # and stays picklable
+        self._backoff_policy = backoff_policy
+        self._retry_state = RetryState()
 
     def _call_retriable_function(
         self, func: Callable[..., Any], *args, **kwargs
@@ -94,19 +180,167 @@ class RetriableMixin:
             **kwargs: Keyword arguments for the function.
 
         Returns:
-            Any: The result of the function call.
+            Any: The result of the function call, or the last good value while
+            retrying in the background.
         """
-        if self._retry:
-            wrapped = exponential_backoff(self._backoff_policy)(func)
-            return wrapped(*args, **kwargs)
-        else:
+        if not self._retry:
             return func(*args, **kwargs)
 
+        policy = self._backoff_policy or defaults.backoff_policy
+        state = self._retry_state
+
+        if not self._retry_in_background:
+            return call_with_backoff(policy, func, *args, **kwargs)
+
+        if state.retrying:
+            # Leave the failing source alone until the retries are done
+            return state.last_value
+
+        if not state.has_value:
+            # Nothing to serve yet, retry on the caller's thread
+            value = call_with_backoff(policy, func, *args, **kwargs)
+            state.succeeded(value)
+            return value
+
+        start = time.monotonic()
+        try:
+            value = func(*args, **kwargs)
+        except Exception as exc:
+            state.last_error = exc
+            if not should_retry(policy, exc):
+                _report_attempts(policy, start, 1, 0, exc)
+                raise
+            self._retry_in_background_thread(
+                policy, start, func, *args, **kwargs
+            )
+            return state.last_value
+
+        record_success()
+        _report_attempts(policy, start, 1, 0)
+        state.succeeded(value)
+        return value
+
+    def _retry_in_background_thread(
+        self,
+        policy: BackoffPolicy,
+        start: float,
+        func: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        Retries a failed function on a background thread, following the backoff schedule.
+
+        The failed call on the reader's thread counts as the first of the
+        policy's `max_retries` attempts, as with `call_with_backoff`, and the
+        round is reported to the policy's metrics hook once it ends.
+
+        Args:
+            policy (BackoffPolicy): The backoff policy.
+            start (float): When the failed call started, as returned by `time.monotonic()`.
+            func (Callable[..., Any]): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+        """
+        state = self._retry_state
+
+        with state.lock:
+            if state.retrying:
+                return
+            state.retrying = True
+            state.attempt = 0
+
+        def retry():
+            attempts = 1
+            total_time_slept = 0.0
+            error = state.last_error
+            delay = None
+            try:
+                for attempt in range(1, policy.max_retries):
+                    delay = backoff_delay(policy, attempt - 1, delay)
+                    if (
+                        policy.deadline is not None
+                        and time.monotonic() - start + delay > policy.deadline
+                    ):
+                        return
+
+                    if not try_acquire_retry():
+                        # The retry budget is spent, give up this round
+                        return
+
+                    time.sleep(delay)
+                    total_time_slept += delay
+
+                    state.attempt = attempt
+                    attempts += 1
+                    try:
+                        value = func(*args, **kwargs)
+                    except Exception as exc:
+                        state.last_error = error = exc
+                        if not should_retry(policy, exc):
+                            return
+                        continue
+
+                    error = None
+                    record_success()
+                    state.succeeded(value)
+                    self._on_retry_success(value)
+                    return
+            finally:
+                try:
+                    _report_attempts(
+                        policy, start, attempts, total_time_slept, error
+                    )
+                finally:
+                    # Once the retries are exhausted, the next read tries again
+                    with state.lock:
+                        state.retrying = False
+
+        threading.Thread(target=retry, daemon=True).start()
+
+    def _on_retry_success(self, value: Any) -> None:
+        """
+        Called when a background retry succeeds.
+
+        Args:
+            value (Any): The fetched value.
+        """
+
 
 class CacheMixin:
-    """Mixin providing caching logic."""
+    """
+    Mixin providing caching logic.
 
-    def __init__(self, use_cache: bool = False, cache: Optional[Cache] = None):
+    Purpose:
+        - Serves values from the cache while they are valid.
+        - Lets a single caller fetch a missing entry while the others wait for
+          it, across processes when the cache backend is shared between them.
+        - Refreshes entries flagged by the cache strategy in the background, so
+          the caller keeps getting the cached value meanwhile.
+        - Falls back to a stale value when refetching an expired entry fails and
+          the cache strategy still allows serving it (stale-if-error).
+        - Optionally remembers misses and failed fetches for `negative_ttl`
+          seconds (negative caching), so a missing optional value or an
+          unreachable source is not fetched again on every read.
+
+    Attributes:
+        _cache (Cache): The cache instance, or `None` if caching is disabled.
+        _negative_cache (Cache): The cache holding negative entries, or `None` if negative caching is disabled.
+        _negative_ttl (float): How long misses and failed fetches are remembered.
+        _refreshing (Set[str]): Keys with a background refresh in flight.
+
+    Methods:
+        _call_cached_function(key, func, *args, **kwargs): Calls a function with optional caching.
+        _is_negative_value(value): Whether a fetched value is a miss, override in child classes.
+        _cache_tags(): The tags cached entries are stored with, override in child classes.
+    """
+
+    def __init__(
+        self,
+        use_cache: bool = False,
+        cache: Optional[Cache] = None,
+        negative_ttl: Optional[float] = None,
+    ):
         """
         Initializes the CacheMixin.
 
@@ -114,12 +348,35 @@ class CacheMixin:
             use_cache (bool): Whether to enable caching.
             cache (Cache, optional): The cache instance to use. Defaults to `None`.
                 If `None` and `use_cache` is True, a new cache instance is created with the default cache policy.
+            negative_ttl (float, optional): How long, in seconds, misses and failed fetches are
+                remembered. Defaults to `None`, which disables negative caching. It works
+                without `use_cache`, in which case only the negative entries are cached.
         """
         if cache is None and use_cache:
             self._cache = Cache(defaults.cache_policy)
         else:
             self._cache = cache
 
+        self._negative_ttl = negative_ttl
+        if negative_ttl is None:
+            self._negative_cache = None
+        else:
+            self._negative_cache = self._cache or Cache(defaults.cache_policy)
+
+        self._refreshing: Set[str] = set()
+        self._refresh_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Locks can't be pickled and refreshes don't survive the process
+        del state["_refreshing"], state["_refresh_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+
     def _call_cached_function(
         self, key: str, func: Callable[..., Any], *args, **kwargs
     ) -> Any:
@@ -137,14 +394,161 @@ class CacheMixin:
         """
         if self._cache:
             try:
-                return self._cache.get_value(key)
+                value = self._cache.get_value(key)
             except MissingCacheKeyError:
-                value = func(*args, **kwargs)
-                self._cache.set_value(key, value)
-                return value
+                with self._cache.fill_lock(key):
+                    # Another caller may have filled the entry while we waited
+                    try:
+                        return self._cache.get_value(key)
+                    except MissingCacheKeyError:
+                        return self._fetch_missing(key, func, *args, **kwargs)
+
+            if self._cache.needs_refresh(key):
+                self._refresh_in_background(key, func, *args, **kwargs)
+
+            return value
+        elif self._negative_cache is not None:
+            return self._fetch_missing(key, func, *args, **kwargs)
         else:
             return func(*args, **kwargs)
 
+    def _fetch_missing(
+        self, key: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """
+        Serves a remembered miss or failed fetch if there is one, fetches otherwise.
+
+        Args:
+            key (str): The cache key.
+            func (Callable[..., Any]): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Any: The negative value or the result of the function call.
+        """
+        if self._negative_cache is not None:
+            try:
+                value, error = self._negative_cache.get_negative(key)
+            except MissingCacheKeyError:
+                pass
+            else:
+                if error is not None:
+                    # Drop the previous traceback so it doesn't keep growing
+                    raise error.with_traceback(None)
+                return value
+
+        return self._fetch_and_cache(key, func, *args, **kwargs)
+
+    def _cache_tags(self) -> Tuple[str, ...]:
+        """
+        The tags cached entries are stored with.
+
+        Tags let related entries be dropped together through
+        `cache_store.invalidate(tag=...)`. Child classes extend them with
+        their source type, host, and so on.
+
+        Returns:
+            Tuple[str, ...]: The tags.
+        """
+        return ()
+
+    def _is_negative_value(self, value: Any) -> bool:
+        """
+        Whether a fetched value is a miss that should be negatively cached.
+
+        Fetches that raise are always treated as misses. Child classes override
+        this for sources that report misses through their return value, such as
+        a not found response.
+
+        Args:
+            value (Any): The fetched value.
+
+        Returns:
+            bool: True if the value is a miss, False otherwise.
+        """
+        return False
+
+    def _fetch_and_cache(
+        self, key: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """
+        Calls a function and caches its result, serving a stale value on error.
+
+        Misses and errors are remembered as negative entries when negative
+        caching is enabled and no stale value can be served.
+
+        Args:
+            key (str): The cache key.
+            func (Callable[..., Any]): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Any: The result of the function call, or the stale cached value if
+            the call failed and the cache strategy allows serving it.
+        """
+        # Record how long the fetch took so cost-aware strategies can
+        # keep expensive values around longer
+        start = time.perf_counter()
+
+        try:
+            value = func(*args, **kwargs)
+        except Exception as exc:
+            if self._cache:
+                try:
+                    return self._cache.get_stale_value(key)
+                except MissingCacheKeyError:
+                    pass
+            if self._negative_cache is not None:
+                self._negative_cache.set_negative(
+                    key, self._negative_ttl, error=exc, tags=self._cache_tags()
+                )
+            raise
+
+        if self._negative_cache is not None and self._is_negative_value(value):
+            self._negative_cache.set_negative(
+                key, self._negative_ttl, value=value, tags=self._cache_tags()
+            )
+        elif self._cache:
+            self._cache.set_value(
+                key,
+                value,
+                cost=time.perf_counter() - start,
+                tags=self._cache_tags(),
+            )
+        return value
+
+    def _refresh_in_background(
+        self, key: str, func: Callable[..., Any], *args, **kwargs
+    ) -> None:
+        """
+        Refreshes a cache entry on a background thread, at most once per key at a time.
+
+        Args:
+            key (str): The cache key.
+            func (Callable[..., Any]): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+        """
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch_and_cache(key, func, *args, **kwargs)
+            except Exception:
+                # The entry stays flagged and is refetched inline once it
+                # expires, where the error reaches the caller
+                pass
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
 
 class AbstractLiveStateTracker(
     AbstractStateTracker, RetriableMixin, CacheMixin, ABC
@@ -160,9 +564,11 @@ class AbstractLiveStateTracker(
 
     Attributes:
         _cache_uuid_key (str): The cache key for the state.
+        _extra_cache_tags (Tuple[str, ...]): Tags given by the user, such as the config path.
+        _hedger (Hedger): Hedges slow fetches, or `None` if hedging is disabled.
 
     Methods:
-        __init__(retry, use_cache, backoff_policy, cache): Initializes the ILiveTracker.
+        __init__(retry, use_cache, backoff_policy, cache, cache_key, negative_ttl, cache_tags, retry_in_background, hedging_policy): Initializes the ILiveTracker.
         get_state(): Fetches the state with retry and caching support.
     """
 
@@ -172,6 +578,11 @@ class AbstractLiveStateTracker(
         use_cache: bool = False,
         backoff_policy: Optional[BackoffPolicy] = None,
         cache: Optional[Cache] = None,
+        cache_key: Optional[str] = None,
+        negative_ttl: Optional[float] = None,
+        cache_tags: Iterable[str] = (),
+        retry_in_background: bool = False,
+        hedging_policy: Optional[HedgingPolicy] = None,
     ):
         """
         Initializes the ILiveTracker.
@@ -182,16 +593,43 @@ class AbstractLiveStateTracker(
             backoff_policy (BackoffPolicy, optional): The backoff policy to use. Defaults to `None`.
             cache (Cache, optional): The cache instance to use. Defaults to `None` and
             if `use_cache` is True, a new cache instance is created with the default cache policy.
+            cache_key (str, optional): The key the state is cached under. Defaults to a random
+            key; pass a stable one so a persistent cache backend finds the entry after a restart.
+            negative_ttl (float, optional): How long, in seconds, misses and failed fetches are
+            remembered. Defaults to `None`, which disables negative caching.
+            cache_tags (Iterable[str]): Extra tags to store the cached state with, in addition
+            to the ones derived from the source.
+            retry_in_background (bool): Whether failed reads return the last good value while
+            retrying in the background, see `RetriableMixin`.
+            hedging_policy (HedgingPolicy, optional): Start a second identical fetch when the first
+            one is slower than usual, see `fastcfg.hedging`. Defaults to `None`, which disables hedging.
         """
-        if use_cache:
+        self._extra_cache_tags = tuple(cache_tags)
+        self._hedger = Hedger(hedging_policy) if hedging_policy else None
+
+        if cache_key is not None:
+            self._cache_uuid_key = cache_key
+        elif use_cache or cache is not None or negative_ttl is not None:
             # Generate cache key
             self._cache_uuid_key = str(uuid.uuid4())
         else:
             self._cache_uuid_key = None
 
         AbstractStateTracker.__init__(self)
-        RetriableMixin.__init__(self, retry, backoff_policy)
-        CacheMixin.__init__(self, use_cache, cache)
+        RetriableMixin.__init__(
+            self, retry, backoff_policy, retry_in_background
+        )
+        CacheMixin.__init__(self, use_cache, cache, negative_ttl)
+
+    def _cache_tags(self) -> Tuple[str, ...]:
+        return self._extra_cache_tags
+
+    def _on_retry_success(self, value: Any) -> None:
+        # Replace the last good value the cache kept serving meanwhile
+        if self._cache:
+            self._cache.set_value(
+                self._cache_uuid_key, value, tags=self._cache_tags()
+            )
 
     def get_state(self) -> Any:
         """
@@ -203,5 +641,11 @@ class AbstractLiveStateTracker(
         return self._call_cached_function(
             self._cache_uuid_key,
             self._call_retriable_function,
-            self.get_state_value,
+            self._fetch_state_value,
         )
+
+    def _fetch_state_value(self) -> Any:
+        """Fetches the internal state, hedging the fetch if a hedging policy is set."""
+        if self._hedger is None:
+            return self.get_state_value()
+        return self._hedger.call(self.get_state_value)
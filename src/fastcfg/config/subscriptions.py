@@ -0,0 +1,183 @@
+"""
+Path-pattern subscriptions to configuration changes.
+
+`Config.subscribe` registers a listener for every item whose path, relative to
+the config, matches a dotted pattern:
+
+    - A plain segment matches an attribute name exactly.
+    - `*` matches exactly one segment.
+    - `**` matches any number of segments, including none.
+
+Patterns are indexed in a `PathTrie`, so a change is matched against every
+subscription of a config in time proportional to its path depth, instead of
+calling every listener and filtering in Python.
+
+Classes:
+    PathTrie: A trie of path patterns, matched against concrete paths.
+
+Functions:
+    path_of(item): The dotted path of an item from its topmost config.
+
+Usage Example:
+    @config.subscribe("database.*.host")
+    def on_host_change(event):
+        print(event.path, event.new_value)
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "**"
+
+
+def split_pattern(pattern: str) -> Tuple[str, ...]:
+    """
+    Split a dotted pattern into its segments.
+
+    Raises:
+        ValueError: If the pattern is empty or has an empty segment.
+    """
+    segments = tuple(pattern.split("."))
+    if not pattern or "" in segments:
+        raise ValueError(f"Invalid subscription pattern: {pattern!r}")
+    return segments
+
+
+def path_of(item: Any) -> Optional[str]:
+    """
+    The dotted path of an item from its topmost config.
+
+    Args:
+        item (Any): A configuration item, or a config's interface.
+
+    Returns:
+        Optional[str]: The path, or None if the item is not attached to a config.
+    """
+    names: List[str] = []
+    node = item
+    while node is not None and node._name is not None:
+        names.append(node._name)
+        parent = node._parent
+        # Key items of dict-valued items have that item as their parent
+        node = (
+            parent.__dict__.get("__interface", parent)
+            if parent is not None
+            else None
+        )
+    return ".".join(reversed(names)) if names else None
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries", "multi")
+
+    def __init__(self, multi: bool = False):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Whether the node stands for `**`, which may consume more segments
+        self.multi = multi
+        # Subscriptions whose pattern ends at this node: (callback, dispatcher)
+        self.entries: List[Tuple[Any, Any]] = []
+
+
+class PathTrie:
+    """
+    A trie of path patterns, matched against concrete paths.
+
+    Methods:
+        add(pattern, callback, dispatcher): Add a subscription.
+        remove(pattern, callback): Remove a subscription.
+        match(path): The subscriptions whose pattern matches a path.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, callback: Any, dispatcher: Any = None) -> None:
+        """
+        Add a subscription, replacing the dispatcher of an existing one.
+
+        Args:
+            pattern (str): The dotted path pattern.
+            callback (Any): The listener.
+            dispatcher (Any): The dispatcher delivering its events, or None to call it inline.
+        """
+        node = self._root
+        for segment in split_pattern(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode(
+                    segment == MULTI_WILDCARD
+                )
+            node = child
+
+        for index, (existing, _) in enumerate(node.entries):
+            if existing == callback:
+                node.entries[index] = (callback, dispatcher)
+                return
+
+        node.entries.append((callback, dispatcher))
+        self._size += 1
+
+    def remove(self, pattern: str, callback: Any) -> bool:
+        """
+        Remove a subscription.
+
+        Returns:
+            bool: Whether the subscription existed.
+        """
+        node = self._root
+        for segment in split_pattern(pattern):
+            node = node.children.get(segment)
+            if node is None:
+                return False
+
+        for index, (existing, _) in enumerate(node.entries):
+            if existing == callback:
+                del node.entries[index]
+                self._size -= 1
+                return True
+        return False
+
+    def _expand(self, node: _TrieNode) -> Iterator[_TrieNode]:
+        # A node followed by `**` also stands for the path ending here
+        yield node
+        multi = node.children.get(MULTI_WILDCARD)
+        if multi is not None:
+            yield from self._expand(multi)
+
+    def match(self, path: Sequence[str]) -> List[Tuple[Any, Any]]:
+        """
+        The subscriptions whose pattern matches a path.
+
+        Args:
+            path (Sequence[str]): The path segments.
+
+        Returns:
+            List[Tuple[Any, Any]]: The matching (callback, dispatcher) pairs,
+            grouped by pattern.
+        """
+        states = list(self._expand(self._root))
+
+        for segment in path:
+            next_states: Dict[int, _TrieNode] = {}
+            for node in states:
+                if node.multi:
+                    next_states[id(node)] = node
+                if not node.children:
+                    continue
+                for key in (segment, SINGLE_WILDCARD):
+                    child = node.children.get(key)
+                    if child is not None:
+                        for state in self._expand(child):
+                            next_states[id(state)] = state
+            if not next_states:
+                return []
+            states = list(next_states.values())
+
+        matches: List[Tuple[Any, Any]] = []
+        for node in {id(node): node for node in states}.values():
+            matches.extend(node.entries)
+        return matches
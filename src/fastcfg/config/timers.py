@@ -0,0 +1,298 @@
+"""
+Debounced and throttled change listeners, run from a shared timer thread.
+
+A live item read in a tight loop can flap, and every flip fires its listeners.
+`on_change(debounce=...)` and `on_change(throttle=...)` wrap a listener so bursts
+of changes are coalesced: the events of each item are merged into one, from the
+value before the burst to the final value, and dropped if the value flipped back.
+
+    debounce: Deliver once no change was seen for `debounce` seconds.
+    throttle: Deliver at most once every `throttle` seconds. The first change
+        is delivered immediately, later ones at the end of the interval.
+
+Every delayed delivery is scheduled on a single timer thread shared by all
+listeners. Deliveries run on that thread unless the listener was also given a
+dispatcher, which slow listeners should be, so they don't delay other timers.
+
+Classes:
+    TimerThread: Runs scheduled callbacks in deadline order on one daemon thread.
+    DebouncedListener: Delivers coalesced events once a burst of changes settled.
+    ThrottledListener: Delivers coalesced events at most once per interval.
+
+Usage Example:
+    @config.feature_flags.on_change(debounce=0.5)
+    def reload_flags(event):
+        ...
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastcfg.config.events import (
+    ChangeEvent,
+    call_listener,
+    dispatch_listener,
+    report_listener_error,
+)
+
+
+class TimerThread:
+    """
+    Runs scheduled callbacks in deadline order on one daemon thread.
+
+    The thread is started on the first `schedule` call and restarted in forked
+    child processes. Callbacks should be quick: they run one after the other.
+    Their errors are reported to the listener error sink, without an event.
+
+    Methods:
+        schedule(delay, func): Run a function after a delay.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, func: Callable[[], None]) -> None:
+        """
+        Run a function after a delay.
+
+        Args:
+            delay (float): The delay in seconds.
+            func (Callable[[], None]): The function to run on the timer thread.
+        """
+        deadline = time.monotonic() + delay
+        with self._condition:
+            heapq.heappush(self._heap, (deadline, next(self._counter), func))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="fastcfg-timers", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    remaining = self._heap[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                _, _, func = heapq.heappop(self._heap)
+
+            try:
+                func()
+            except Exception as exc:
+                # Report the listener owning a bound `_fire`, not the method
+                report_listener_error(
+                    getattr(func, "__self__", func), None, exc
+                )
+
+    def _after_fork(self) -> None:
+        self._reset()
+        if self._heap:
+            # Pending timers still fire in the child
+            self.schedule(0, lambda: None)
+
+
+_timer_thread = TimerThread()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_timer_thread._after_fork)
+
+
+def get_timer_thread() -> TimerThread:
+    """Get the timer thread shared by every debounced and throttled listener."""
+    return _timer_thread
+
+
+class _CoalescingListener:
+    """
+    Base class for listeners that merge events and deliver them later.
+
+    Compares and hashes like the wrapped callback, so the callback can be used
+    to remove it.
+    """
+
+    # Listener stats time the wrapped callback, not the wrapper
+    _untimed = True
+
+    # Scheduling state reset when pickled, as pending timers don't survive the process
+    _timer_state: Dict[str, Any] = {}
+
+    def __init__(
+        self, callback: Callable[[ChangeEvent], Any], dispatcher: Any = None
+    ):
+        self.callback = callback
+        self.dispatcher = dispatcher
+        # Merged events by item identity, in order of first change
+        self._pending: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_pending"] = {}
+        state.update(self._timer_state)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _merge(self, event: Any) -> None:
+        key = id(getattr(event, "item", event))
+        pending = self._pending.get(key)
+        if pending is None or not isinstance(event, ChangeEvent):
+            self._pending[key] = event
+        else:
+            self._pending[key] = ChangeEvent(
+                event.item,
+                pending.old_value,
+                event.new_value,
+                monotonic_ns=event.monotonic_ns,
+            )
+
+    def _take_pending(self) -> List[Any]:
+        events = list(self._pending.values())
+        self._pending.clear()
+        return events
+
+    def _deliver(self, events: List[Any]) -> None:
+        for event in events:
+            if (
+                isinstance(event, ChangeEvent)
+                and event.old_value == event.new_value
+            ):
+                continue  # Flipped back to where the burst started
+            if self.dispatcher is None:
+                call_listener(self.callback, event)
+            else:
+                dispatch_listener(self.dispatcher, self.callback, event)
+
+    def __eq__(self, other):
+        if isinstance(other, _CoalescingListener):
+            return self.callback == other.callback
+        return self.callback == other
+
+    def __hash__(self):
+        return hash(self.callback)
+
+
+class DebouncedListener(_CoalescingListener):
+    """
+    Delivers coalesced events once no change was seen for `wait` seconds.
+
+    Attributes:
+        callback (Callable[[ChangeEvent], Any]): The wrapped listener.
+        wait (float): The quiet period in seconds.
+        dispatcher: The dispatcher delivering the events, or None to call the listener
+            on the timer thread.
+    """
+
+    _timer_state = {"_deadline": None}
+
+    def __init__(
+        self,
+        callback: Callable[[ChangeEvent], Any],
+        wait: float,
+        dispatcher: Any = None,
+    ):
+        if wait <= 0:
+            raise ValueError("debounce must be positive.")
+        super().__init__(callback, dispatcher)
+        self.wait = wait
+        self._deadline: Optional[float] = None
+
+    def __call__(self, event: Any) -> None:
+        with self._lock:
+            self._merge(event)
+            scheduled = self._deadline is not None
+            # Each change pushes the delivery back, the scheduled timer catches up
+            self._deadline = time.monotonic() + self.wait
+
+        if not scheduled:
+            _timer_thread.schedule(self.wait, self._fire)
+
+    def _fire(self) -> None:
+        with self._lock:
+            remaining = self._deadline - time.monotonic()
+            if remaining > 0:
+                _timer_thread.schedule(remaining, self._fire)
+                return
+            self._deadline = None
+            events = self._take_pending()
+
+        self._deliver(events)
+
+
+class ThrottledListener(_CoalescingListener):
+    """
+    Delivers coalesced events at most once every `interval` seconds.
+
+    The first change is delivered immediately. Changes made during the
+    following interval are delivered together at its end.
+
+    Attributes:
+        callback (Callable[[ChangeEvent], Any]): The wrapped listener.
+        interval (float): The shortest time between two deliveries, in seconds.
+        dispatcher: The dispatcher delivering the events, or None to call the listener
+            inline for the first change and on the timer thread afterwards.
+    """
+
+    _timer_state = {"_last_delivery": None, "_scheduled": False}
+
+    def __init__(
+        self,
+        callback: Callable[[ChangeEvent], Any],
+        interval: float,
+        dispatcher: Any = None,
+    ):
+        if interval <= 0:
+            raise ValueError("throttle must be positive.")
+        super().__init__(callback, dispatcher)
+        self.interval = interval
+        self._last_delivery: Optional[float] = None
+        self._scheduled = False
+
+    def __call__(self, event: Any) -> None:
+        with self._lock:
+            self._merge(event)
+            if self._scheduled:
+                return
+
+            now = time.monotonic()
+            if (
+                self._last_delivery is None
+                or now - self._last_delivery >= self.interval
+            ):
+                self._last_delivery = now
+                events = self._take_pending()
+            else:
+                self._scheduled = True
+                _timer_thread.schedule(
+                    self._last_delivery + self.interval - now, self._fire
+                )
+                return
+
+        self._deliver(events)
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._scheduled = False
+            self._last_delivery = time.monotonic()
+            events = self._take_pending()
+
+        self._deliver(events)
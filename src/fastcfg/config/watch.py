@@ -0,0 +1,138 @@
+"""
+Async iteration over configuration changes.
+
+`config.watch(path)` subscribes to every item under a path and hands their
+change events to an asyncio queue, from whichever thread notified them. An
+asyncio service consumes them with `async for` on its own loop, instead of
+registering callbacks that run on arbitrary threads.
+
+Classes:
+    ConfigWatch: An async iterator over the change events under a path.
+
+Usage Example:
+    async with config.watch("feature_flags") as changes:
+        async for change in changes:
+            print(change.path, change.new_value)
+"""
+
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Any, Optional
+
+from fastcfg.config.events import ChangeEvent
+
+if TYPE_CHECKING:
+    from fastcfg.config.interface import ConfigInterface
+
+# Queued by `close` to end the iteration
+_CLOSED = object()
+
+
+class _WatchListener:
+    """
+    The subscribed listener, holding its watch weakly.
+
+    A watch that was dropped without being closed is unsubscribed on the next
+    change instead of being kept alive by its subscription.
+    """
+
+    def __init__(self, watch: "ConfigWatch"):
+        self._watch = weakref.ref(watch)
+        self._interface = watch._interface
+        self._pattern = watch.pattern
+
+    def __call__(self, event: ChangeEvent) -> None:
+        watch = self._watch()
+        if watch is None:
+            self._interface.unsubscribe(self._pattern, self)
+            return
+        watch._enqueue(event)
+
+
+class ConfigWatch:
+    """
+    An async iterator over the change events under a path.
+
+    Events are queued on the event loop that created the watch, in the order
+    they were notified. If `maxsize` events are already waiting, the oldest one
+    is dropped, since the notifying thread can't wait for the consumer.
+
+    Attributes:
+        pattern (str): The subscription pattern covering the path.
+        loop (asyncio.AbstractEventLoop): The loop consuming the events.
+        maxsize (int): The largest number of queued events, 0 for no limit.
+        dropped (int): The number of events dropped because the queue was full.
+
+    Methods:
+        close(): Stop watching, ending the iteration once the queued events are consumed.
+    """
+
+    def __init__(
+        self,
+        interface: "ConfigInterface",
+        path: Optional[str] = None,
+        maxsize: int = 0,
+    ):
+        """
+        Initialize the watch and subscribe it.
+
+        Args:
+            interface (ConfigInterface): The interface of the watched config.
+            path (Optional[str]): The dotted path of the watched subtree or item,
+                relative to the config. Defaults to the whole config.
+            maxsize (int): The largest number of queued events, 0 for no limit.
+
+        Raises:
+            RuntimeError: If no event loop is running.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.pattern = f"{path}.**" if path else "**"
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._interface = interface
+        # Unbounded, so closing never drops an event
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed = False
+        self._listener = _WatchListener(self)
+        interface.subscribe(self.pattern, self._listener)
+
+    def _enqueue(self, item: Any) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self._put, item)
+        except RuntimeError:
+            # The loop was closed without closing the watch
+            self._unsubscribe()
+
+    def _put(self, item: Any) -> None:
+        if item is not _CLOSED and 0 < self.maxsize <= self._queue.qsize():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(item)
+
+    def _unsubscribe(self) -> None:
+        self._interface.unsubscribe(self.pattern, self._listener)
+
+    def close(self) -> None:
+        """Stop watching, ending the iteration once the queued events are consumed."""
+        if self._closed:
+            return
+        self._closed = True
+        self._unsubscribe()
+        self._enqueue(_CLOSED)
+
+    def __aiter__(self) -> "ConfigWatch":
+        return self
+
+    async def __anext__(self) -> ChangeEvent:
+        item = await self._queue.get()
+        if item is _CLOSED:
+            # Keep ending any later iteration
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+        return item
+
+    async def __aenter__(self) -> "ConfigWatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -43,6 +43,20 @@ class MaxRetriesExceededError(Exception):
         )
 
 
+class BackoffDeadlineExceededError(MaxRetriesExceededError):
+    """Exception raised when the next retry would end past the backoff policy's deadline."""
+
+
+class RetryBudgetExhaustedError(Exception):
+    """Exception raised when a retry is denied because the process-wide retry budget is spent."""
+
+    def __init__(self, retry_budget):
+        self._retry_budget = retry_budget
+        super().__init__(
+            f"Retry budget exhausted, failing without retrying. Budget details: {str(self._retry_budget)}"
+        )
+
+
 class MissingConfigKeyError(Exception):
     """Exception raised when a config key doesn't exist."""
 
@@ -69,3 +83,15 @@ class MissingEnvironmentVariableError(Exception):
         super().__init__(
             f"Environment variable '{key}' doesn't exist. Please ensure that it's set in your environment."
         )
+
+
+class JournalTruncatedError(Exception):
+    """Exception raised when the changes after a sequence number were evicted from the change journal."""
+
+    def __init__(self, seq: int, first_seq: int):
+        self.seq = seq
+        self.first_seq = first_seq
+        super().__init__(
+            f"Changes after sequence number {seq} are no longer in the journal, "
+            f"the oldest retained change is {first_seq}. Resynchronize from a full snapshot."
+        )
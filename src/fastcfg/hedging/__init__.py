@@ -0,0 +1,259 @@
+"""
+This module provides hedged requests to cut the tail latency of slow sources.
+
+A hedged call starts the fetch and, if it hasn't completed once the source's
+observed p95 latency (by default) has elapsed, starts a second identical fetch.
+Whichever completes first wins. Latencies are tracked per tracker in a
+`LatencyHistogram`, and the share of hedged calls is capped so a slow source
+never sees its load doubled.
+
+Classes:
+    HedgingPolicy: Configuration class for hedged requests.
+    LatencyHistogram: A bounded, log-bucketed histogram of recent latencies.
+    Hedger: Makes hedged calls to a single source, following a `HedgingPolicy`.
+
+Usage Example:
+    from fastcfg.hedging import HedgingPolicy
+    from fastcfg.sources.remote import from_requests
+
+    config.flags = from_requests(
+        "https://flags.internal/v1", "get", hedging_policy=HedgingPolicy()
+    )
+"""
+
+import bisect
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+
+@dataclass
+class HedgingPolicy:
+    """
+    Configuration for hedged requests.
+
+    Attributes:
+        quantile (float): The latency quantile after which a hedge is started.
+        min_delay (float): The shortest hedge delay in seconds.
+        max_delay (float): The longest hedge delay in seconds.
+        max_hedge_ratio (float): The largest share of calls that may be hedged.
+        min_samples (int): The number of latencies observed before hedging starts.
+    """
+
+    quantile: float = 0.95
+    min_delay: float = 0.005
+    max_delay: float = 5.0
+    max_hedge_ratio: float = 0.1
+    min_samples: int = 20
+
+
+class LatencyHistogram:
+    """
+    A bounded, log-bucketed histogram of recent latencies.
+
+    Purpose:
+        - Estimates latency quantiles in constant memory: bucket boundaries grow
+          geometrically, so every estimate is within about 10% of the true value.
+        - Halves every count once `window` samples were recorded, so estimates
+          follow the source's recent behaviour.
+
+    Methods:
+        record(seconds): Record one latency.
+        quantile(q): Estimate a latency quantile.
+        count(): The number of latencies currently weighing in the estimates.
+    """
+
+    # Bucket upper bounds, from 100 microseconds to about 100 seconds
+    _BOUNDS: List[float] = [1e-4 * 1.2**i for i in range(77)]
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize the histogram.
+
+        Args:
+            window (int): The number of samples after which counts are halved. Defaults to 1000.
+        """
+        self._window = window
+        self._counts = [0] * (len(self._BOUNDS) + 1)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one latency.
+
+        Args:
+            seconds (float): The latency in seconds.
+        """
+        index = bisect.bisect_left(self._BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += 1
+            if self._total >= self._window:
+                self._counts = [count // 2 for count in self._counts]
+                self._total = sum(self._counts)
+
+    def count(self) -> int:
+        """The number of latencies currently weighing in the estimates."""
+        return self._total
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a latency quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            Optional[float]: The upper bound of the bucket holding the quantile,
+            or `None` if nothing was recorded.
+        """
+        with self._lock:
+            if not self._total:
+                return None
+
+            rank = math.ceil(q * self._total)
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    break
+
+        if index < len(self._BOUNDS):
+            return self._BOUNDS[index]
+        return self._BOUNDS[-1]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by every hedged call, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=32, thread_name_prefix="fastcfg-hedge"
+            )
+        return _executor
+
+
+class Hedger:
+    """
+    Makes hedged calls to a single source, following a `HedgingPolicy`.
+
+    Attributes:
+        policy (HedgingPolicy): The hedging policy.
+        histogram (LatencyHistogram): The latencies observed for the source.
+        calls (int): The number of calls made.
+        hedges (int): The number of calls that were hedged.
+
+    Methods:
+        hedge_delay(): The current delay after which a call is hedged.
+        call(func, *args, **kwargs): Call a function, hedging it if it is slow.
+    """
+
+    def __init__(self, policy: HedgingPolicy):
+        """
+        Initialize the hedger.
+
+        Args:
+            policy (HedgingPolicy): The hedging policy.
+        """
+        self.policy = policy
+        self.histogram = LatencyHistogram()
+        self.calls = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        The current delay after which a call is hedged.
+
+        Returns:
+            Optional[float]: The delay in seconds, or `None` while too few
+            latencies were observed to hedge.
+        """
+        if self.histogram.count() < self.policy.min_samples:
+            return None
+
+        delay = self.histogram.quantile(self.policy.quantile)
+        return min(max(delay, self.policy.min_delay), self.policy.max_delay)
+
+    def _reserve_hedge(self) -> bool:
+        """Count a hedge if the hedge ratio allows one more."""
+        with self._lock:
+            if self.hedges >= self.policy.max_hedge_ratio * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def _timed(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        self.histogram.record(time.perf_counter() - start)
+        return value
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a function, hedging it if it is slow.
+
+        Args:
+            func (Callable[..., Any]): The function to call, safe to call twice concurrently.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Any: The result of the first call to succeed.
+
+        Raises:
+            Exception: The error of the first call if every call failed.
+        """
+        with self._lock:
+            self.calls += 1
+        delay = self.hedge_delay()
+
+        if delay is None:
+            # Not enough samples yet, call inline to learn the latency
+            return self._timed(func, *args, **kwargs)
+
+        executor = _get_executor()
+        primary = executor.submit(self._timed, func, *args, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+
+        if done or not self._reserve_hedge():
+            return primary.result()
+
+        hedge = executor.submit(self._timed, func, *args, **kwargs)
+        pending = {primary, hedge}
+
+        # The first call to succeed wins, the other one finishes unobserved
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+
+        return primary.result()
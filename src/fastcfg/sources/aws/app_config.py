@@ -1,5 +1,6 @@
 import json
 
+from fastcfg.hedging import HedgingPolicy
 from fastcfg.sources.aws.boto3_live_tracker import IBoto3LiveTracker
 
 
@@ -13,9 +14,10 @@ class AppConfigLiveTracker(IBoto3LiveTracker):
         configuration: str,
         client_id: str,
         *args,
-        **kwargs
+        hedging_policy: HedgingPolicy = None,
+        **kwargs,
     ):
-        super().__init__("appconfig")
+        super().__init__("appconfig", hedging_policy=hedging_policy)
         self._application = application
         self._environment = environment
         self._configuration = configuration
@@ -24,6 +26,12 @@ class AppConfigLiveTracker(IBoto3LiveTracker):
         self._args = args
         self._kwargs = kwargs
 
+    def _cache_tags(self):
+        return super()._cache_tags() + (
+            "appconfig",
+            f"appconfig:{self._application}",
+        )
+
     def execute_aws(self):
 
         print("executing aws!")
@@ -34,7 +42,7 @@ class AppConfigLiveTracker(IBoto3LiveTracker):
             Configuration=self._configuration,
             ClientId=self._client_id,
             *self._args,
-            **self._kwargs
+            **self._kwargs,
         )
 
         return response["Content"].read().decode("utf-8")
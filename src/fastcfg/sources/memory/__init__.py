@@ -1,13 +1,15 @@
 import sys
-from typing import Callable
+from typing import Callable, Optional
 
 from fastcfg.config.items import LiveConfigItem
 from fastcfg.sources.memory.callable import CallableTracker
 from fastcfg.sources.memory.environment import EnvironmentLiveTracker
 
 
-def from_os_environ(key: str) -> LiveConfigItem:
-    return LiveConfigItem(EnvironmentLiveTracker(key))
+def from_os_environ(
+    key: str, negative_ttl: Optional[float] = None
+) -> LiveConfigItem:
+    return LiveConfigItem(EnvironmentLiveTracker(key, negative_ttl))
 
 
 def from_callable(callable: Callable, *args, **kwargs) -> LiveConfigItem:
@@ -1,14 +1,19 @@
 import os
+from typing import Optional
 
-from fastcfg.config.state import AbstractStateTracker
+from fastcfg.config.state import AbstractLiveStateTracker
 from fastcfg.exceptions import MissingEnvironmentVariableError
 
 
-class EnvironmentLiveTracker(AbstractStateTracker):
+class EnvironmentLiveTracker(AbstractLiveStateTracker):
 
-    def __init__(self, key: str):
+    def __init__(self, key: str, negative_ttl: Optional[float] = None):
+        super().__init__(negative_ttl=negative_ttl)
         self._key = key
 
+    def _cache_tags(self):
+        return super()._cache_tags() + ("environment",)
+
     def get_state_value(self):
 
         try:
@@ -1,8 +1,11 @@
+from urllib.parse import urlparse
+
 import requests
 
 from fastcfg.cache import Cache
 from fastcfg.config.state import AbstractLiveStateTracker
 from fastcfg.exceptions import NetworkError
+from fastcfg.hedging import HedgingPolicy
 
 
 class RequestsLiveTracker(AbstractLiveStateTracker):
@@ -17,16 +20,32 @@ class RequestsLiveTracker(AbstractLiveStateTracker):
         backoff_policy=None,
         cache: Cache = None,
         *args,
+        negative_ttl: float = None,
+        hedging_policy: HedgingPolicy = None,
         **kwargs
     ):
 
-        super().__init__(retry, use_cache, backoff_policy, cache)
+        super().__init__(
+            retry,
+            use_cache,
+            backoff_policy,
+            cache,
+            negative_ttl=negative_ttl,
+            hedging_policy=hedging_policy,
+        )
 
         self._url = url
         self._method = method
         self._args = args
         self._kwargs = kwargs
 
+    def _is_negative_value(self, value) -> bool:
+        """Client and server error responses, such as a 404, are misses."""
+        return getattr(value, "status_code", 200) >= 400
+
+    def _cache_tags(self):
+        return super()._cache_tags() + ("requests", urlparse(self._url).netloc)
+
     def get_state_value(self):
         """Network request function implementation."""
         try:
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, Optional
 
 
 class IConfigValidator(ABC):
 
+    # The relative cost of a check, cheaper checks run first
+    cost: float = 10
+
     def __init__(self, validate_immediately: bool = True):
         self.validate_immediately = validate_immediately
 
@@ -16,3 +19,19 @@ class IConfigValidator(ABC):
     def error_message(self) -> str:
         """Return the error message if validation fails."""
         pass
+
+    def _expression(
+        self, name: str, namespace: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        An expression equivalent to `validate`, inlined into compiled pipelines.
+
+        Args:
+            name (str): The name this validator is bound to in the namespace, to prefix
+                any other name added to it.
+            namespace (Dict[str, Any]): The globals of the compiled pipeline.
+
+        Returns:
+            Optional[str]: An expression testing `value`, or None to call `validate`.
+        """
+        return None
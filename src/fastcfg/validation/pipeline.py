@@ -0,0 +1,158 @@
+"""
+Validator chains compiled into a single check function.
+
+Instead of looping over its validators on every validation, an item compiles
+them into one generated function when a validator is added. The built-in type,
+range, length and regex checks are inlined into that function, with their
+patterns precompiled, and every other validator is called from it. Validating a
+value then costs one function call when it passes.
+
+Checks run cheapest first, using each validator's `cost`. As failures are
+counted, validators that fail often move ahead of cheaper ones that rarely do,
+so failing values are rejected early. Once a value failed, `first_failure`
+reruns the validators one by one in the order they were added, to report the
+same validator as without compilation. If an inlined check raises, `check`
+falls back to that order too.
+
+Validators are compiled with their settings at the time they are added: a
+validator changed afterwards is only seen by the next compilation.
+
+Classes:
+    ValidatorPipeline: The compiled validators of one item.
+
+Usage Example:
+    pipeline = ValidatorPipeline([TypeValidator(int), RangeValidator(1, 65535)])
+
+    failed = pipeline.check(8080)  # None
+    failed = pipeline.check(0)  # The RangeValidator
+    if failed is not None:
+        failed = pipeline.first_failure(0)  # The first one added that fails
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from fastcfg.validation import IConfigValidator
+
+
+def _inlinable(validator: Any) -> bool:
+    """Whether a validator's `_expression` describes its `validate`, not overridden by a subclass."""
+    cls = type(validator)
+    for klass in cls.__mro__:
+        if "_expression" in klass.__dict__:
+            return cls.validate is klass.__dict__.get("validate")
+    return False
+
+
+def _cost(validator: Any) -> float:
+    if isinstance(validator, IConfigValidator):
+        return validator.cost
+    return IConfigValidator.cost
+
+
+def _first_failure(validators: List[Any], value: Any) -> Optional[Any]:
+    """Run the validators one by one, returning the first one failing."""
+    for validator in validators:
+        if not validator.validate(value):
+            return validator
+    return None
+
+
+class ValidatorPipeline:
+    """
+    The compiled validators of one item.
+
+    Attributes:
+        validators (List[IConfigValidator]): The validators, in the order they were added.
+        check (Callable[[Any], Optional[IConfigValidator]]): Validate a value, returning the
+            first failing validator, or None if the value passes.
+
+    Methods:
+        order(): The validators in the order their checks run.
+        first_failure(value): The first validator failing, in the order they were added.
+        record_failure(validator): Count a failure, reordering the checks as failures add up.
+    """
+
+    def __init__(self, validators: List[IConfigValidator]):
+        """
+        Compile the validators.
+
+        Args:
+            validators (List[IConfigValidator]): The validators, in the order they were added.
+        """
+        self.validators = list(validators)
+        self._failures: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._compile()
+
+    def __len__(self) -> int:
+        return len(self.validators)
+
+    def order(self) -> List[IConfigValidator]:
+        """The validators in the order their checks run."""
+        # Stable, so validators of equal rank keep the order they were added in
+        return sorted(
+            self.validators,
+            key=lambda v: _cost(v) / (1 + self._failures.get(id(v), 0)),
+        )
+
+    def first_failure(self, value: Any) -> Optional[IConfigValidator]:
+        """
+        The first validator failing a value, in the order they were added.
+
+        Slower than `check`, for reporting a value it rejected.
+
+        Args:
+            value (Any): The value.
+
+        Returns:
+            Optional[IConfigValidator]: The failing validator, or None if the value passes.
+        """
+        return _first_failure(self.validators, value)
+
+    def _compile(self) -> None:
+        namespace: Dict[str, Any] = {
+            "_validators": self.validators,
+            "_first_failure": _first_failure,
+        }
+        lines = ["def check(value):", "    try:"]
+
+        for index, validator in enumerate(self.order()):
+            name = f"_v{index}"
+            namespace[name] = validator
+
+            expression = None
+            if _inlinable(validator):
+                expression = validator._expression(name, namespace)
+            if expression is None:
+                expression = f"{name}.validate(value)"
+
+            lines.append(f"        if not ({expression}):")
+            lines.append(f"            return {name}")
+
+        lines += [
+            "    except Exception:",
+            "        return _first_failure(_validators, value)",
+            "    return None",
+        ]
+
+        exec("\n".join(lines), namespace)
+        self.check: Callable[[Any], Optional[IConfigValidator]] = namespace[
+            "check"
+        ]
+
+    def record_failure(self, validator: IConfigValidator) -> None:
+        """
+        Count a failure of a validator.
+
+        The checks are recompiled each time its failure count reaches a power of
+        two, so the order adapts quickly at first and rarely once it settled.
+
+        Args:
+            validator (IConfigValidator): The failing validator.
+        """
+        with self._lock:
+            count = self._failures.get(id(validator), 0) + 1
+            self._failures[id(validator)] = count
+            if count & (count - 1) == 0:
+                self._compile()
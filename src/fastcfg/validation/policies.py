@@ -12,6 +12,8 @@ except ImportError:
 
 
 class RangeValidator(IConfigValidator):
+    cost = 2
+
     def __init__(
         self, min_value: int, max_value: int, validate_immediately: bool = True
     ):
@@ -27,11 +29,18 @@ class RangeValidator(IConfigValidator):
         except TypeError:
             return False
 
+    def _expression(self, name: str, namespace: dict) -> str:
+        namespace[f"{name}_min"] = self.min_value
+        namespace[f"{name}_max"] = self.max_value
+        return f"{name}_min <= value <= {name}_max"
+
     def error_message(self) -> str:
         return f"Value must support <= operator and be between {self.min_value} and {self.max_value}."
 
 
 class TypeValidator(IConfigValidator):
+    cost = 1
+
     def __init__(self, expected_type: type, validate_immediately: bool = True):
         super().__init__(validate_immediately=validate_immediately)
         self.expected_type = expected_type
@@ -39,11 +48,17 @@ class TypeValidator(IConfigValidator):
     def validate(self, value: Any) -> bool:
         return isinstance(value, self.expected_type)
 
+    def _expression(self, name: str, namespace: dict) -> str:
+        namespace[f"{name}_type"] = self.expected_type
+        return f"isinstance(value, {name}_type)"
+
     def error_message(self) -> str:
         return f"Value must be of type {self.expected_type.__name__}."
     
 
 class LengthValidator(IConfigValidator):
+    cost = 2
+
     def __init__(self, length: int, validate_immediately: bool = True):
         super().__init__(validate_immediately=validate_immediately)
         self.length = length
@@ -51,11 +66,17 @@ class LengthValidator(IConfigValidator):
     def validate(self, value: Any) -> bool:
         return len(value) == self.length
 
+    def _expression(self, name: str, namespace: dict) -> str:
+        namespace[f"{name}_length"] = self.length
+        return f"len(value) == {name}_length"
+
     def error_message(self) -> str:
         return f"Value must be of length {self.length}."
     
 
 class RegexValidator(IConfigValidator):
+    cost = 5
+
     def __init__(self, pattern: str, validate_immediately: bool = True):
         super().__init__(validate_immediately=validate_immediately)
 
@@ -64,6 +85,11 @@ class RegexValidator(IConfigValidator):
     def validate(self, value: Any) -> bool:
         return bool(re.match(self.pattern, value))
 
+    def _expression(self, name: str, namespace: dict) -> str:
+        # Precompiled, instead of looked up in the re module's cache on every call
+        namespace[f"{name}_match"] = re.compile(self.pattern).match
+        return f"{name}_match(value)"
+
     def error_message(self) -> str:
         return f"Value must match the pattern {self.pattern}."
 
@@ -79,6 +105,8 @@ class URLValidator(RegexValidator):
 
 
 class PydanticValidator(IConfigValidator):
+    cost = 50
+
     def __init__(self, model: BaseModel, validate_immediately: bool = True, transform: bool = False):
         super().__init__(validate_immediately=validate_immediately)
         self.model = model
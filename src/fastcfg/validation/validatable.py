@@ -1,11 +1,15 @@
 import hashlib
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 
 from fastcfg.config import items
 from fastcfg.config.utils import potentially_has_children, resolve_all_values
 from fastcfg.exceptions import ConfigItemValidationError
 from fastcfg.validation import IConfigValidator
+from fastcfg.validation.pipeline import ValidatorPipeline
+
+# Live states compared by value instead of by the hash of their string
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
 
 
 def md5_hash_state(input_obj: Any) -> str:
@@ -33,10 +37,21 @@ class ValidatableMixin(ABC):
 
         self._last_state_hash = None  # Used for LiveConfigItem state tracking
         self._validators: List[IConfigValidator] = []
+        # Compiled from the validators on the next validation
+        self._pipeline: Optional[ValidatorPipeline] = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The compiled checks can't be pickled, they're compiled again when needed
+        state["_pipeline"] = None
+        return state
 
     def add_validator(self, validator: IConfigValidator) -> "ValidatableMixin":
         self._validators.append(validator)
 
+        # The whole chain is compiled again into a single check
+        self._pipeline = None
+
         if validator.validate_immediately:
             # Validate immediately when a new validator is added
             self.validate(force_live=True)
@@ -53,9 +68,10 @@ class ValidatableMixin(ABC):
         Validate the current configuration item and its children.
 
         This method performs validation on the current configuration item and its
-        children. If the item is an instance of LiveConfigItem, it uses an MD5 hash
-        to track the state of the item's value. Validation is only performed if the
-        state has changed or if the `force_live` parameter is set to True.
+        children. If the item is an instance of LiveConfigItem, it tracks the state
+        of the item's value, comparing scalars directly and other values by the MD5
+        hash of their string. Validation is only performed if the state has changed
+        or if the `force_live` parameter is set to True.
 
         Parameters:
         force_live (bool): If True, forces validation for LiveConfigItem instances
@@ -71,18 +87,29 @@ class ValidatableMixin(ABC):
             return
 
         if isinstance(self, items.LiveConfigItem):
+            self._validate_state(self._get_value(), force_live)
+            return
+
+        current_value = self.value
 
-            current_value = self._get_value()
+        self._validate_self(current_value)
+        self._validate_children(current_value)
 
-            state_hash = md5_hash_state(current_value)
+    def _validate_state(self, current_value, force_live: bool = False):
+        """Validate a live state already fetched, unless it was validated last."""
+        if not self._validators:
+            return
 
-            # Check if state has changed and we need to re-validate
-            if not force_live and state_hash == self._last_state_hash:
-                return  # We don't need to validate self or children
-            else:
-                self._last_state_hash = state_hash
+        if type(current_value) in _SCALAR_TYPES:
+            # The type is part of the state, as 1 == True
+            state = (type(current_value), current_value)
         else:
-            current_value = self.value
+            state = md5_hash_state(current_value)
+
+        # Check if state has changed and we need to re-validate
+        if not force_live and state == self._last_state_hash:
+            return  # We don't need to validate self or children
+        self._last_state_hash = state
 
         self._validate_self(current_value)
         self._validate_children(current_value)
@@ -94,10 +121,16 @@ class ValidatableMixin(ABC):
         if potentially_has_children(value):
             validate_value = resolve_all_values(validate_value)
 
-        for validator in self._validators:
+        pipeline = self._pipeline
+        if pipeline is None:
+            pipeline = self._pipeline = ValidatorPipeline(self._validators)
 
-            if not validator.validate(validate_value):
-                raise ConfigItemValidationError(validator.error_message())
+        failed = pipeline.check(validate_value)
+        if failed is not None:
+            pipeline.record_failure(failed)
+            # Report the same validator whatever order the checks run in
+            failed = pipeline.first_failure(validate_value) or failed
+            raise ConfigItemValidationError(failed.error_message())
 
     def _validate_children(self, value):
         if isinstance(value, dict):
@@ -1,9 +1,22 @@
+import time
 import unittest
 from unittest.mock import call, patch
 
-from fastcfg.backoff import exponential_backoff
+from fastcfg.backoff import (
+    BackoffMetrics,
+    RetryBudget,
+    backoff_delay,
+    call_with_backoff,
+    exponential_backoff,
+    set_retry_budget,
+)
 from fastcfg.backoff.policies import BackoffPolicy
-from fastcfg.exceptions import MaxRetriesExceededError
+from fastcfg.config.state import AbstractLiveStateTracker
+from fastcfg.exceptions import (
+    BackoffDeadlineExceededError,
+    MaxRetriesExceededError,
+    RetryBudgetExhaustedError,
+)
 
 DEFAULT_BACKOFF_POLICY = BackoffPolicy(
     max_retries=3, base_delay=1, max_delay=10, factor=2, jitter=False
@@ -91,5 +104,336 @@ class TestExponentialBackoff(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 2)
 
 
+    def test_backoff_delay(self):
+        """Delays should grow by the factor and stop at the maximum delay."""
+        delays = [backoff_delay(DEFAULT_BACKOFF_POLICY, n) for n in range(5)]
+        self.assertEqual(delays, [1, 2, 4, 8, 10])
+
+    @patch("time.sleep", return_value=None)
+    def test_call_with_backoff(self, mock_sleep):
+        """Functions should be retried without being wrapped first."""
+        attempts = []
+
+        def sometimes_failing_function(value):
+            attempts.append(value)
+            if len(attempts) < 3:
+                raise ValueError("Failure")
+            return value
+
+        result = call_with_backoff(
+            DEFAULT_BACKOFF_POLICY, sometimes_failing_function, "Success"
+        )
+        self.assertEqual(result, "Success")
+        self.assertEqual(mock_sleep.call_args_list, [call(1), call(2)])
+
+
+    @patch("time.sleep", return_value=None)
+    def test_attempts_match_max_retries(self, mock_sleep):
+        """A failing function should be called exactly max_retries times."""
+        calls = []
+
+        def failing_function():
+            calls.append(1)
+            raise ValueError("Failure")
+
+        with self.assertRaises(MaxRetriesExceededError):
+            call_with_backoff(DEFAULT_BACKOFF_POLICY, failing_function)
+        self.assertEqual(len(calls), DEFAULT_BACKOFF_POLICY.max_retries)
+
+    def test_zero_retries_calls_once(self):
+        """A policy without retries should still call the function once."""
+        policy = BackoffPolicy(
+            max_retries=0, base_delay=1, max_delay=1, factor=2, jitter=False
+        )
+        self.assertEqual(call_with_backoff(policy, lambda: "Success"), "Success")
+
+
+class TestBackoffPolicyOptions(unittest.TestCase):
+
+    def _policy(self, **kwargs):
+        options = dict(
+            max_retries=5, base_delay=1, max_delay=10, factor=2, jitter=False
+        )
+        options.update(kwargs)
+        return BackoffPolicy(**options)
+
+    def test_invalid_jitter_mode(self):
+        with self.assertRaises(ValueError):
+            self._policy(jitter_mode="none")
+
+    def test_full_jitter(self):
+        """Full jitter should pick delays anywhere below the exponential delay."""
+        policy = self._policy(jitter=True, jitter_mode="full")
+        delays = [backoff_delay(policy, 2) for _ in range(200)]
+
+        self.assertTrue(all(0 <= delay <= 4 for delay in delays))
+        self.assertLess(min(delays), 1)
+
+    def test_decorrelated_jitter(self):
+        """Decorrelated jitter should stay between the base and three times the previous delay."""
+        policy = self._policy(jitter=True, jitter_mode="decorrelated")
+
+        for _ in range(200):
+            delay = backoff_delay(policy, 3, previous_delay=2)
+            self.assertTrue(1 <= delay <= 6)
+        self.assertLessEqual(backoff_delay(policy, 3, previous_delay=9), 10)
+
+    @patch("time.sleep", return_value=None)
+    def test_deadline(self, mock_sleep):
+        """No retry should be started past the deadline."""
+        policy = self._policy(deadline=3.5)
+
+        def failing_function():
+            raise ValueError("Failure")
+
+        with patch("time.monotonic", return_value=0):
+            with self.assertRaises(BackoffDeadlineExceededError):
+                call_with_backoff(policy, failing_function)
+
+        # Delays of 1 and 2 fit in the deadline, the next one (4) does not
+        self.assertEqual(mock_sleep.call_args_list, [call(1), call(2)])
+
+    @patch("time.sleep", return_value=None)
+    def test_retry_on(self, mock_sleep):
+        """Errors rejected by the predicate should be raised without retrying."""
+        policy = self._policy(
+            retry_on=lambda exc: isinstance(exc, ConnectionError)
+        )
+
+        def failing_function():
+            raise KeyError("not transient")
+
+        with self.assertRaises(KeyError):
+            call_with_backoff(policy, failing_function)
+        mock_sleep.assert_not_called()
+
+    @patch("time.sleep", return_value=None)
+    def test_metrics_hook(self, mock_sleep):
+        """The hook should receive the attempts and the total sleep of each call."""
+        reports = []
+        policy = self._policy(metrics_hook=reports.append)
+
+        outcomes = [ValueError("Failure"), ValueError("Failure"), "Success"]
+
+        def sometimes_failing_function():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        call_with_backoff(policy, sometimes_failing_function)
+
+        (report,) = reports
+        self.assertIsInstance(report, BackoffMetrics)
+        self.assertEqual(report.attempts, 3)
+        self.assertEqual(report.total_time_slept, 3)
+        self.assertTrue(report.succeeded)
+        self.assertIsNone(report.error)
+
+
+FAST_BACKOFF_POLICY = BackoffPolicy(
+    max_retries=3, base_delay=0.01, max_delay=0.01, factor=1, jitter=False
+)
+
+
+class OutageTracker(AbstractLiveStateTracker):
+    """A live tracker whose source can be switched into an outage."""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            retry=True,
+            backoff_policy=FAST_BACKOFF_POLICY,
+            retry_in_background=True,
+            **kwargs
+        )
+        self.calls = 0
+        self.failures_left = 0
+
+    def get_state_value(self):
+        self.calls += 1
+        if self.failures_left:
+            self.failures_left -= 1
+            raise ConnectionError("source is down")
+        return self.calls
+
+
+def _wait_for_retries(tracker, timeout=2.0):
+    """Wait until the background retries are done."""
+    deadline = time.monotonic() + timeout
+    while tracker._retry_state.retrying and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestBackgroundRetries(unittest.TestCase):
+
+    def test_serves_last_value_while_retrying(self):
+        """A failed read should return the last good value without blocking."""
+        tracker = OutageTracker()
+        self.assertEqual(tracker.get_state(), 1)
+
+        tracker.failures_left = 2
+        self.assertEqual(tracker.get_state(), 1)
+        self.assertTrue(tracker._retry_state.retrying)
+
+        # Reads during the retries don't reach the source
+        calls = tracker.calls
+        self.assertEqual(tracker.get_state(), 1)
+        self.assertEqual(tracker.calls, calls)
+
+        _wait_for_retries(tracker)
+        self.assertEqual(tracker._retry_state.last_value, 4)
+        self.assertEqual(tracker.get_state(), 5)
+
+    def test_first_read_retries_inline(self):
+        """Without a previous value the read should retry on the caller's thread."""
+        tracker = OutageTracker()
+        tracker.failures_left = 2
+
+        self.assertEqual(tracker.get_state(), 3)
+        self.assertFalse(tracker._retry_state.retrying)
+
+    def test_exhausted_retries(self):
+        """After the retries are exhausted the next read tries again."""
+        tracker = OutageTracker()
+        tracker.get_state()
+
+        tracker.failures_left = 10
+        self.assertEqual(tracker.get_state(), 1)
+        _wait_for_retries(tracker)
+
+        self.assertIsInstance(tracker._retry_state.last_error, ConnectionError)
+        calls = tracker.calls
+        self.assertEqual(tracker.get_state(), 1)
+        self.assertEqual(tracker.calls, calls + 1)
+
+    def test_attempts_match_max_retries(self):
+        """The failed read should count as the first of the policy's attempts."""
+        tracker = OutageTracker()
+        tracker.get_state()
+        calls = tracker.calls
+
+        tracker.failures_left = 10
+        tracker.get_state()
+        _wait_for_retries(tracker)
+
+        self.assertEqual(tracker.calls, calls + FAST_BACKOFF_POLICY.max_retries)
+
+    def test_rounds_are_reported(self):
+        """Each background round should reach the policy's metrics hook."""
+        reports = []
+        policy = BackoffPolicy(
+            max_retries=3,
+            base_delay=0.01,
+            max_delay=0.01,
+            factor=1,
+            jitter=False,
+            metrics_hook=reports.append,
+        )
+        tracker = OutageTracker()
+        tracker._backoff_policy = policy
+        tracker.get_state()
+
+        tracker.failures_left = 1
+        tracker.get_state()
+        _wait_for_retries(tracker)
+
+        first, round_ = reports
+        self.assertEqual((first.attempts, first.succeeded), (1, True))
+        self.assertEqual((round_.attempts, round_.succeeded), (2, True))
+        self.assertAlmostEqual(round_.total_time_slept, 0.01)
+
+    def test_spent_budget_ends_round_without_sleeping(self):
+        """A denied retry should end the round before waiting for its delay."""
+        set_retry_budget(
+            RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=0)
+        )
+        self.addCleanup(set_retry_budget, None)
+
+        tracker = OutageTracker()
+        tracker._backoff_policy = BackoffPolicy(
+            max_retries=3, base_delay=10, max_delay=10, factor=1, jitter=False
+        )
+        tracker.get_state()
+
+        tracker.failures_left = 10
+        tracker.get_state()
+        _wait_for_retries(tracker, timeout=1.0)
+
+        self.assertFalse(tracker._retry_state.retrying)
+
+    def test_cache_is_updated(self):
+        """A successful background retry should replace the cached value."""
+        tracker = OutageTracker(use_cache=True)
+        tracker.get_state()
+        tracker._cache.evict(tracker._cache_uuid_key)
+
+        tracker.failures_left = 1
+        self.assertEqual(tracker.get_state(), 1)
+        _wait_for_retries(tracker)
+
+        self.assertEqual(tracker.get_state(), 3)
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch("time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.budget = RetryBudget(
+            ratio=0.5, min_retries_per_second=0.1, max_tokens=2
+        )
+        set_retry_budget(self.budget)
+        self.addCleanup(set_retry_budget, None)
+
+    def test_tokens(self):
+        """Retries should spend tokens that successes and time earn back."""
+        self.assertTrue(self.budget.try_acquire())
+        self.assertTrue(self.budget.try_acquire())
+        self.assertFalse(self.budget.try_acquire())
+        self.assertEqual(self.budget.denied, 1)
+
+        self.budget.record_success()
+        self.budget.record_success()
+        self.assertTrue(self.budget.try_acquire())
+
+        self.now += 10
+        self.assertAlmostEqual(self.budget.tokens(), 1)
+
+    @patch("time.sleep", return_value=None)
+    def test_exhausted_budget_fails_immediately(self, mock_sleep):
+        """Once the budget is spent, failures should not be retried."""
+
+        @exponential_backoff(backoff_policy=DEFAULT_BACKOFF_POLICY)
+        def failing_function():
+            raise ValueError("Failure")
+
+        # Two tokens: the first call retries twice before giving up
+        with self.assertRaises(MaxRetriesExceededError):
+            failing_function()
+
+        with self.assertRaises(RetryBudgetExhaustedError) as raised:
+            failing_function()
+        self.assertIsInstance(raised.exception.__cause__, ValueError)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("time.sleep", return_value=None)
+    def test_successes_earn_retries(self, mock_sleep):
+        """Successful calls should refill the budget."""
+
+        @exponential_backoff(backoff_policy=DEFAULT_BACKOFF_POLICY)
+        def successful_function():
+            return "Success"
+
+        self.budget.try_acquire()
+        self.budget.try_acquire()
+        successful_function()
+        successful_function()
+
+        self.assertAlmostEqual(self.budget.tokens(), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
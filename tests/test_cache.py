@@ -0,0 +1,966 @@
+import gc
+import multiprocessing
+import os
+import pickle
+import random
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from unittest.mock import patch
+
+from fastcfg.cache import Cache
+from fastcfg.cache.backends import (
+    SharedMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from fastcfg.cache.policies import LRU_POLICY
+from fastcfg.cache.sketch import CountMinSketch
+from fastcfg.cache.store import cache_store
+from fastcfg.cache.strategies import (
+    AdaptiveTTLCacheStrategy,
+    ARCCacheStrategy,
+    ByteBudgetCacheStrategy,
+    JitteredTTLCacheStrategy,
+    CostAwareWTinyLFUCacheStrategy,
+    LRUCacheStrategy,
+    SoftTTLCacheStrategy,
+    TTLCacheStrategy,
+    WTinyLFUCacheStrategy,
+    approximate_size,
+)
+from fastcfg.config.state import AbstractLiveStateTracker
+from fastcfg.exceptions import MissingCacheKeyError
+
+
+class FlakyTracker(AbstractLiveStateTracker):
+    """A live tracker whose source can be switched into an outage."""
+
+    def __init__(self, **kwargs):
+        super().__init__(use_cache=True, **kwargs)
+        self.calls = 0
+        self.fail = False
+
+    def get_state_value(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("source is down")
+        return self.calls
+
+
+class SlowSharedTracker(AbstractLiveStateTracker):
+    """A live tracker counting its fetches in a counter shared between processes."""
+
+    def __init__(self, counter, **kwargs):
+        super().__init__(**kwargs)
+        self.counter = counter
+
+    def get_state_value(self):
+        with self.counter.get_lock():
+            self.counter.value += 1
+        time.sleep(0.05)
+        return "document"
+
+
+def _shared_worker(name, lock_path, counter, results):
+    """Read a shared cached value from a forked worker."""
+    backend = SharedMemoryCacheBackend(name, lock_path=lock_path)
+    tracker = SlowSharedTracker(
+        counter,
+        cache=Cache(TTLCacheStrategy(60), backend=backend),
+        cache_key="doc",
+    )
+    results.put(tracker.get_state())
+
+
+def _preforked_worker(backend, counter, results):
+    """Read a shared cached value through a backend created before the fork."""
+    tracker = SlowSharedTracker(
+        counter,
+        cache=Cache(TTLCacheStrategy(60), backend=backend),
+        cache_key="doc",
+    )
+    results.put(tracker.get_state())
+
+
+def _wait_for_refresh(tracker, timeout=2.0):
+    """Wait until no background refresh is in flight."""
+    deadline = time.monotonic() + timeout
+    while tracker._refreshing and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestCacheEvictionState(unittest.TestCase):
+    """
+    Test cases for per-cache eviction state.
+    """
+
+    def test_shared_policy_does_not_share_order(self):
+        """Two caches built from the same policy should evict independently."""
+        first = Cache(LRU_POLICY)
+        second = Cache(LRU_POLICY)
+
+        for i in range(100):
+            first.set_value(f"key{i}", i)
+
+        second.set_value("other", "value")
+
+        # Inserting into the second cache must not evict from the first one
+        self.assertEqual(len(first._cache), 100)
+        self.assertEqual(first.get_value("key0"), 0)
+        self.assertEqual(second.get_value("other"), "value")
+
+        # The template policy itself never accumulates state
+        self.assertEqual(len(LRU_POLICY._order), 0)
+
+    def test_lru_eviction_removes_value(self):
+        """Evicted entries should be removed along with their metadata."""
+        cache = Cache(LRUCacheStrategy(capacity=2))
+
+        cache.set_value("a", 1)
+        cache.set_value("b", 2)
+        cache.get_value("a")  # "b" becomes least recently used
+        cache.set_value("c", 3)
+
+        self.assertEqual(len(cache._cache), 2)
+        self.assertEqual(cache.get_value("a"), 1)
+        self.assertEqual(cache.get_value("c"), 3)
+
+        with self.assertRaises(MissingCacheKeyError):
+            cache.get_value("b")
+
+    def test_cached_tracker_fetches_once(self):
+        """An empty cache must still be used, not mistaken for no cache."""
+        tracker = FlakyTracker()
+
+        self.assertEqual([tracker.get_state() for _ in range(3)], [1, 1, 1])
+        self.assertEqual(tracker.calls, 1)
+
+    def test_clear_resets_strategy(self):
+        """Clearing a cache should drop entries and eviction state."""
+        cache = Cache(LRUCacheStrategy(capacity=2))
+        cache.set_value("a", 1)
+        cache.clear()
+
+        self.assertEqual(len(cache._cache), 0)
+        self.assertEqual(len(cache._cache_strategy._order), 0)
+
+
+class TestByteBudgetCacheStrategy(unittest.TestCase):
+    """
+    Test cases for the ByteBudgetCacheStrategy class.
+    """
+
+    def test_evicts_by_size(self):
+        """Entries should be evicted once the byte budget is exceeded."""
+        cache = Cache(ByteBudgetCacheStrategy(max_bytes=100, sizeof=len))
+
+        cache.set_value("small", b"x" * 20)
+        cache.set_value("medium", b"x" * 50)
+        cache.set_value("large", b"x" * 60)
+
+        # "small" and "medium" had to make room for "large"
+        self.assertEqual(len(cache._cache), 1)
+        self.assertEqual(cache._cache_strategy.total_bytes, 60)
+        self.assertEqual(cache.get_value("large"), b"x" * 60)
+
+    def test_replacing_value_updates_size(self):
+        """Overwriting a key should replace its accounted size."""
+        cache = Cache(ByteBudgetCacheStrategy(max_bytes=100, sizeof=len))
+
+        cache.set_value("doc", b"x" * 80)
+        cache.set_value("doc", b"x" * 10)
+
+        self.assertEqual(cache._cache_strategy.total_bytes, 10)
+
+    def test_oversized_value_is_not_cached(self):
+        """A value larger than the whole budget should be evicted immediately."""
+        cache = Cache(ByteBudgetCacheStrategy(max_bytes=10, sizeof=len))
+        cache.set_value("huge", b"x" * 11)
+
+        self.assertEqual(len(cache._cache), 0)
+        self.assertFalse(cache.is_valid("huge"))
+
+    def test_approximate_size_walks_containers(self):
+        """Nested containers should count towards the approximate size."""
+        payload = {"data": "x" * 1000}
+        self.assertGreater(approximate_size(payload), 1000)
+
+
+def _fill_hot_set(cache, hot_keys, reads=5):
+    """Insert the hot keys and read them repeatedly."""
+    for key in hot_keys:
+        cache.set_value(key, key)
+    for _ in range(reads):
+        for key in hot_keys:
+            cache.get_value(key)
+
+
+def _scan(cache, count):
+    """Insert `count` keys that are never read again."""
+    for i in range(count):
+        cache.set_value(f"scan{i}", i)
+
+
+class TestScanResistantStrategies(unittest.TestCase):
+    """
+    Test cases for the W-TinyLFU and ARC cache strategies.
+    """
+
+    def test_count_min_sketch(self):
+        """The sketch should estimate frequencies and age them."""
+        sketch = CountMinSketch(width=64, sample_size=1000)
+        for _ in range(5):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        self.assertEqual(sketch.frequency("hot"), 5)
+        self.assertGreaterEqual(sketch.frequency("cold"), 1)
+
+        sketch._age()
+        self.assertEqual(sketch.frequency("hot"), 2)
+
+    def test_lru_is_flushed_by_scan(self):
+        """Baseline: a scan evicts every hot entry from an LRU cache."""
+        hot_keys = [f"hot{i}" for i in range(5)]
+        cache = Cache(LRUCacheStrategy(capacity=10))
+        _fill_hot_set(cache, hot_keys)
+        _scan(cache, 50)
+
+        self.assertFalse(any(cache.is_valid(key) for key in hot_keys))
+
+    def test_tiny_lfu_survives_scan(self):
+        """Hot entries should survive a scan under W-TinyLFU."""
+        hot_keys = [f"hot{i}" for i in range(5)]
+        cache = Cache(WTinyLFUCacheStrategy(capacity=10))
+        _fill_hot_set(cache, hot_keys)
+        _scan(cache, 50)
+
+        self.assertTrue(all(cache.is_valid(key) for key in hot_keys))
+        self.assertLessEqual(len(cache._cache), 10)
+
+    def test_arc_survives_scan(self):
+        """Hot entries should survive a scan under ARC."""
+        hot_keys = [f"hot{i}" for i in range(5)]
+        cache = Cache(ARCCacheStrategy(capacity=10))
+        _fill_hot_set(cache, hot_keys)
+        _scan(cache, 50)
+
+        self.assertTrue(all(cache.is_valid(key) for key in hot_keys))
+        self.assertLessEqual(len(cache._cache), 10)
+
+    def test_arc_respects_capacity(self):
+        """ARC should never hold more entries than its capacity."""
+        cache = Cache(ARCCacheStrategy(capacity=4))
+        for i in range(20):
+            cache.set_value(f"key{i % 7}", i)
+            self.assertLessEqual(len(cache._cache), 4)
+
+    def test_cost_aware_keeps_expensive_entries(self):
+        """Expensive entries should win admission over cheap ones."""
+        cache = Cache(CostAwareWTinyLFUCacheStrategy(capacity=3))
+
+        cache.set_value("expensive", "remote", cost=2.0)
+        cache.set_value("cheap0", "local", cost=0.001)
+        cache.set_value("cheap1", "local", cost=0.001)
+
+        for i in range(20):
+            cache.set_value(f"scan{i}", i, cost=0.001)
+
+        self.assertTrue(cache.is_valid("expensive"))
+
+    def test_cost_aware_evicts_cheap_victims(self):
+        """A popular candidate should displace a cheap entry, not the expensive LRU one."""
+        cache = Cache(CostAwareWTinyLFUCacheStrategy(capacity=10))
+
+        cache.set_value("expensive", "remote", cost=2.0)
+        for i in range(9):
+            cache.set_value(f"cheap{i}", "local", cost=0.001)
+
+        # Seen often enough to beat a cheap entry, but not the expensive one
+        for _ in range(3):
+            cache._cache_strategy._sketch.increment("popular")
+        cache.set_value("popular", "local", cost=0.001)
+        cache.set_value("next", "local", cost=0.001)
+
+        self.assertTrue(cache.is_valid("expensive"))
+        self.assertTrue(cache.is_valid("popular"))
+
+
+class TestSoftTTLCacheStrategy(unittest.TestCase):
+    """
+    Test cases for the SoftTTLCacheStrategy class.
+    """
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch("time.time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tracker = FlakyTracker(
+            cache=Cache(
+                SoftTTLCacheStrategy(
+                    soft_seconds=10, hard_seconds=20, max_stale_seconds=30
+                )
+            )
+        )
+
+    def test_fresh_value_is_served(self):
+        """Before the soft TTL the cached value is served without refreshing."""
+        self.assertEqual(self.tracker.get_state(), 1)
+        self.now += 5
+        self.assertEqual(self.tracker.get_state(), 1)
+        self.assertEqual(self.tracker.calls, 1)
+
+    def test_soft_expiry_refreshes_in_background(self):
+        """After the soft TTL the stale value is served and refreshed."""
+        self.tracker.get_state()
+        self.now += 15
+
+        # Still served from cache while the refresh runs
+        self.assertEqual(self.tracker.get_state(), 1)
+        _wait_for_refresh(self.tracker)
+
+        self.assertEqual(self.tracker.calls, 2)
+        self.assertEqual(self.tracker.get_state(), 2)
+
+    def test_hard_expiry_refetches(self):
+        """After the hard TTL the value is refetched inline."""
+        self.tracker.get_state()
+        self.now += 25
+        self.assertEqual(self.tracker.get_state(), 2)
+
+    def test_stale_if_error(self):
+        """A failing refetch serves the stale value until the maximum staleness."""
+        self.tracker.get_state()
+        self.tracker.fail = True
+
+        self.now += 25
+        self.assertEqual(self.tracker.get_state(), 1)
+
+        self.now += 30
+        with self.assertRaises(ConnectionError):
+            self.tracker.get_state()
+
+    def test_plain_cache_drops_stale_entries(self):
+        """Strategies without a stale window still drop expired entries."""
+        cache = Cache(SoftTTLCacheStrategy(soft_seconds=1, hard_seconds=1))
+        cache.set_value("key", "value")
+        self.now += 2
+
+        with self.assertRaises(MissingCacheKeyError):
+            cache.get_value("key")
+        with self.assertRaises(MissingCacheKeyError):
+            cache.get_stale_value("key")
+
+
+class TestJitteredTTLCacheStrategy(unittest.TestCase):
+    """
+    Test cases for the JitteredTTLCacheStrategy class.
+    """
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch("time.time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.strategy = JitteredTTLCacheStrategy(
+            seconds=100, jitter=0.2, rng=random.Random(7)
+        )
+
+    def test_expirations_are_spread(self):
+        """Entries inserted together should expire at different times."""
+        cache = Cache(self.strategy)
+        for i in range(50):
+            cache.set_value(f"key{i}", i)
+
+        expiries = {cache.get_metadata(f"key{i}")[0] for i in range(50)}
+        self.assertGreater(len(expiries), 45)
+        self.assertTrue(all(1080 <= expiry <= 1120 for expiry in expiries))
+
+    def test_early_refresh_probability(self):
+        """Refreshes should be rare long before expiry and likely close to it."""
+        cache = Cache(self.strategy)
+        cache.set_value("key", "value", cost=1.0)
+        expiry = cache.get_metadata("key")[0]
+
+        self.assertFalse(any(cache.needs_refresh("key") for _ in range(100)))
+
+        self.now = expiry - 0.5
+        refreshes = sum(cache.needs_refresh("key") for _ in range(1000))
+        # P(-log(u) >= 0.5) = exp(-0.5), about 61%
+        self.assertGreater(refreshes, 500)
+        self.assertLess(refreshes, 700)
+
+    def test_unknown_cost_never_refreshes_early(self):
+        """Without a recorded fetch duration the entry simply expires."""
+        cache = Cache(self.strategy)
+        cache.set_value("key", "value")
+        self.now = cache.get_metadata("key")[0] - 0.001
+        self.assertFalse(cache.needs_refresh("key"))
+
+    def test_tracker_refreshes_in_background(self):
+        """A hot entry close to expiry should be refreshed while being served."""
+        tracker = FlakyTracker(cache=Cache(self.strategy))
+        self.assertEqual(tracker.get_state(), 1)
+
+        # Pretend the fetch was slow so the refresh window is wide
+        tracker._cache.set_value(tracker._cache_uuid_key, 1, cost=10.0)
+        self.now = (
+            tracker._cache.get_metadata(tracker._cache_uuid_key)[0] - 0.01
+        )
+
+        self.assertEqual(tracker.get_state(), 1)
+        _wait_for_refresh(tracker)
+        self.assertEqual(tracker.get_state(), 2)
+
+
+class NotFoundTracker(FlakyTracker):
+    """A live tracker whose source reports misses through its return value."""
+
+    def get_state_value(self):
+        super().get_state_value()
+        return "not found"
+
+    def _is_negative_value(self, value):
+        return value == "not found"
+
+
+class TestAdaptiveTTLCacheStrategy(unittest.TestCase):
+    """
+    Test cases for the AdaptiveTTLCacheStrategy class.
+    """
+
+    def setUp(self):
+        self.cache = Cache(
+            AdaptiveTTLCacheStrategy(
+                min_seconds=10, max_seconds=100, initial_seconds=20
+            )
+        )
+
+    def test_stable_values_grow_ttl(self):
+        """Unchanged values should double the TTL up to the maximum."""
+        for _ in range(4):
+            self.cache.set_value("stable", {"flag": True})
+
+        self.assertEqual(self.cache._cache_strategy.current_ttl("stable"), 100)
+
+    def test_changing_values_shrink_ttl(self):
+        """Changed values should shrink the TTL down to the minimum."""
+        self.cache.set_value("volatile", 1)
+        self.cache.set_value("volatile", 1)
+        self.assertEqual(
+            self.cache._cache_strategy.current_ttl("volatile"), 40
+        )
+
+        self.cache.set_value("volatile", 2)
+        self.assertEqual(
+            self.cache._cache_strategy.current_ttl("volatile"), 10
+        )
+
+    def test_ttl_outlives_expiry(self):
+        """The learned TTL should carry over once the entry expires."""
+        self.cache.set_value("key", "value")
+        self.cache.set_value("key", "value")
+
+        with patch("time.time", return_value=time.time() + 50):
+            with self.assertRaises(MissingCacheKeyError):
+                self.cache.get_value("key")
+            self.cache.set_value("key", "value")
+
+        self.assertEqual(self.cache._cache_strategy.current_ttl("key"), 80)
+
+    def test_learned_ttls_are_bounded(self):
+        """Only the most recently inserted keys should keep their TTL."""
+        cache = Cache(
+            AdaptiveTTLCacheStrategy(
+                min_seconds=10, max_seconds=100, initial_seconds=20, max_keys=2
+            )
+        )
+        for key in ("a", "b", "a", "c"):
+            cache.set_value(key, "value")
+
+        strategy = cache._cache_strategy
+        self.assertEqual(list(strategy._learned), ["a", "c"])
+        self.assertEqual(strategy.current_ttl("a"), 40)
+        self.assertEqual(strategy.current_ttl("b"), 20)
+
+    def test_unpicklable_values(self):
+        """Values that can't be pickled should be compared by their repr."""
+
+        class Local:
+            def __repr__(self):
+                return "Local()"
+
+        self.cache.set_value("key", Local())
+        self.cache.set_value("key", Local())
+        self.assertEqual(self.cache._cache_strategy.current_ttl("key"), 40)
+
+
+class TestNegativeCaching(unittest.TestCase):
+    """
+    Test cases for negative caching in Cache and CacheMixin.
+    """
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch("time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_negative_entries_expire(self):
+        """Negative entries should only be served for their own TTL."""
+        cache = Cache(TTLCacheStrategy(seconds=60))
+        error = KeyError("missing")
+        cache.set_negative("key", 5, error=error)
+
+        self.assertEqual(cache.get_negative("key"), (None, error))
+        self.assertFalse(cache.is_valid("key"))
+
+        self.now += 5
+        with self.assertRaises(MissingCacheKeyError):
+            cache.get_negative("key")
+
+    def test_positive_value_replaces_negative_entry(self):
+        """Caching a value should forget the previous miss."""
+        cache = Cache(TTLCacheStrategy(seconds=60))
+        cache.set_negative("key", 5, value="not found")
+        cache.set_value("key", "found")
+
+        with self.assertRaises(MissingCacheKeyError):
+            cache.get_negative("key")
+
+    def test_failed_fetch_is_not_repeated(self):
+        """Errors should be raised again without refetching until they expire."""
+        tracker = FlakyTracker(negative_ttl=5)
+        tracker.fail = True
+
+        for _ in range(3):
+            with self.assertRaises(ConnectionError):
+                tracker.get_state()
+        self.assertEqual(tracker.calls, 1)
+
+        tracker.fail = False
+        self.now += 5
+        self.assertEqual(tracker.get_state(), 2)
+
+    def test_negative_value_is_cached_separately(self):
+        """Misses reported as values should use the negative TTL."""
+        tracker = NotFoundTracker(
+            cache=Cache(TTLCacheStrategy(seconds=60)), negative_ttl=5
+        )
+
+        self.assertEqual(tracker.get_state(), "not found")
+        self.assertEqual(tracker.get_state(), "not found")
+        self.assertEqual(tracker.calls, 1)
+        self.assertFalse(tracker._cache.is_valid(tracker._cache_uuid_key))
+
+        self.now += 5
+        tracker.get_state()
+        self.assertEqual(tracker.calls, 2)
+
+    def test_stale_value_is_preferred(self):
+        """A stale value that may still be served wins over caching the error."""
+        with patch("time.time", return_value=0):
+            tracker = FlakyTracker(
+                cache=Cache(
+                    SoftTTLCacheStrategy(
+                        soft_seconds=10, hard_seconds=10, max_stale_seconds=60
+                    )
+                ),
+                negative_ttl=5,
+            )
+            tracker.get_state()
+
+        tracker.fail = True
+        with patch("time.time", return_value=20):
+            self.assertEqual(tracker.get_state(), 1)
+            self.assertEqual(tracker.get_state(), 1)
+        self.assertEqual(tracker.calls, 3)
+
+
+class TestCacheStore(unittest.TestCase):
+    """
+    Test cases for the weak, tagged cache store.
+    """
+
+    def test_unused_caches_are_released(self):
+        """A cache should leave the store once nothing references it."""
+        tracker = FlakyTracker()
+        tracker.get_state()
+        name = tracker._cache.name
+        self.assertIs(cache_store.get_cache(name), tracker._cache)
+
+        del tracker
+        gc.collect()
+        self.assertIsNone(cache_store.get_cache(name))
+
+        # A new cache may reuse the released name
+        Cache(LRU_POLICY, name=name)
+
+    def test_invalidate_by_tag(self):
+        """Only entries carrying the tag should be dropped, in every cache."""
+        first = Cache(LRU_POLICY)
+        second = Cache(LRU_POLICY)
+        first.set_value("a", 1, tags=("appconfig", "host:a"))
+        first.set_value("b", 2, tags=("requests",))
+        second.set_value("c", 3, tags=("appconfig",))
+
+        self.assertEqual(cache_store.invalidate(tag="appconfig"), 2)
+
+        self.assertFalse(first.is_valid("a"))
+        self.assertFalse(second.is_valid("c"))
+        self.assertEqual(first.get_value("b"), 2)
+        self.assertEqual(cache_store.invalidate(tag="appconfig"), 0)
+
+        # Evicted entries no longer count for their other tags
+        self.assertEqual(cache_store.invalidate(tag="host:a"), 0)
+
+    def test_retagging_replaces_tags(self):
+        """Setting a key again should drop the tags of its previous entry."""
+        cache = Cache(LRU_POLICY)
+        cache.set_value("a", 1, tags=("old",))
+        cache.set_value("a", 2, tags=("new",))
+
+        self.assertEqual(cache.invalidate_tag("old"), 0)
+        self.assertEqual(cache.get_value("a"), 2)
+        self.assertEqual(cache.invalidate_tag("new"), 1)
+
+    def test_expired_entries_drop_their_tags(self):
+        """Reading an expired entry should evict it like any other removal."""
+        cache = Cache(TTLCacheStrategy(0.01))
+        cache.set_value("a", 1, tags=("t",))
+        time.sleep(0.02)
+
+        with patch.object(cache._cache_strategy, "on_eviction") as on_eviction:
+            with self.assertRaises(MissingCacheKeyError):
+                cache.get_value("a")
+
+        on_eviction.assert_called_once_with("a")
+        self.assertEqual(cache._key_tags, {})
+        self.assertEqual(cache._tag_keys, {})
+
+    def test_tracker_tags(self):
+        """Live trackers should store their state with their cache tags."""
+        tag = f"config:{uuid.uuid4()}"
+        tracker = FlakyTracker(cache_tags=(tag,))
+        tracker.get_state()
+
+        self.assertEqual(cache_store.invalidate(tag=tag), 1)
+        self.assertEqual(tracker.get_state(), 2)
+
+    def test_clear_all_caches(self):
+        """Clearing every cache should skip the ones already released."""
+        cache = Cache(LRU_POLICY)
+        cache.set_value("key", "value")
+        Cache(LRU_POLICY).set_value("key", "value")
+
+        cache_store.clear_all_caches()
+        self.assertFalse(cache.is_valid("key"))
+
+
+class TestFillLock(unittest.TestCase):
+    """
+    Test cases for the in-process fill lock.
+    """
+
+    def test_unrelated_misses_fetch_concurrently(self):
+        """A slow miss should not hold up a miss on another key of the same cache."""
+        cache = Cache(TTLCacheStrategy(60))
+        filling = threading.Event()
+        release = threading.Event()
+
+        def slow_fill():
+            with cache.fill_lock("slow"):
+                filling.set()
+                release.wait(5)
+
+        filler = threading.Thread(target=slow_fill)
+        filler.start()
+        self.addCleanup(filler.join)
+        self.addCleanup(release.set)
+        filling.wait(5)
+
+        started = time.monotonic()
+        with cache.fill_lock("fast"):
+            pass
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_same_key_misses_wait(self):
+        """A miss on the key being filled should wait for the fill."""
+        cache = Cache(TTLCacheStrategy(60))
+        order = []
+
+        def fill(name):
+            with cache.fill_lock("doc"):
+                order.append(f"{name} start")
+                time.sleep(0.05)
+                order.append(f"{name} end")
+
+        threads = [
+            threading.Thread(target=fill, args=(name,)) for name in "ab"
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIn(order[:2], (["a start", "a end"], ["b start", "b end"]))
+        self.assertEqual(cache._backend._fill_locks, {})
+
+
+class TestSQLiteCacheBackend(unittest.TestCase):
+    """
+    Test cases for the SQLiteCacheBackend class.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.db")
+
+    def _backend(self, namespace="default"):
+        backend = SQLiteCacheBackend(self.path, namespace=namespace)
+        self.addCleanup(backend.close)
+        return backend
+
+    def test_values_survive_restart(self):
+        """A new cache on the same file should see previously cached values."""
+        first = Cache(TTLCacheStrategy(seconds=60), backend=self._backend())
+        first.set_value("doc", {"flags": [1, 2, 3]})
+
+        # Simulates a new process opening the same database
+        second = Cache(TTLCacheStrategy(seconds=60), backend=self._backend())
+        self.assertEqual(second.get_value("doc"), {"flags": [1, 2, 3]})
+
+    def test_ttl_metadata_is_persisted(self):
+        """Expired entries should not be served after a restart."""
+        first = Cache(TTLCacheStrategy(seconds=60), backend=self._backend())
+        first.set_value("doc", "value")
+
+        with patch("time.time", return_value=time.time() + 120):
+            second = Cache(
+                TTLCacheStrategy(seconds=60), backend=self._backend()
+            )
+            with self.assertRaises(MissingCacheKeyError):
+                second.get_value("doc")
+
+    def test_lru_tracks_restored_entries(self):
+        """Usage-based strategies should evict entries restored from disk."""
+        first = Cache(LRUCacheStrategy(capacity=2), backend=self._backend())
+        first.set_value("a", 1)
+        first.set_value("b", 2)
+
+        second = Cache(LRUCacheStrategy(capacity=2), backend=self._backend())
+        second.set_value("c", 3)
+
+        self.assertFalse(second.is_valid("a"))
+        self.assertEqual(second.get_value("b"), 2)
+        self.assertEqual(second.get_value("c"), 3)
+
+    def test_namespaces_are_isolated(self):
+        """Caches in different namespaces should not see each other's entries."""
+        first = Cache(LRU_POLICY, backend=self._backend("first"))
+        second = Cache(LRU_POLICY, backend=self._backend("second"))
+        first.set_value("key", "value")
+
+        self.assertFalse(second.is_valid("key"))
+
+        first.clear()
+        self.assertFalse(first.is_valid("key"))
+
+    def test_tracker_with_stable_cache_key(self):
+        """Live trackers with a stable cache key should reuse persisted values."""
+        first = FlakyTracker(
+            cache=Cache(TTLCacheStrategy(60), backend=self._backend()),
+            cache_key="flaky",
+        )
+        self.assertEqual(first.get_state(), 1)
+
+        second = FlakyTracker(
+            cache=Cache(TTLCacheStrategy(60), backend=self._backend()),
+            cache_key="flaky",
+        )
+        self.assertEqual(second.get_state(), 1)
+        self.assertEqual(second.calls, 0)
+
+
+class TestSharedMemoryCacheBackend(unittest.TestCase):
+    """
+    Test cases for the SharedMemoryCacheBackend class.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.lock_path = os.path.join(directory.name, "cache.lock")
+        self.name = f"fastcfg-test-{uuid.uuid4().hex[:12]}"
+
+        # Owns the segment for the duration of the test, like a master process
+        owner = self._backend()
+        self.addCleanup(owner.unlink)
+
+    def _backend(self):
+        backend = SharedMemoryCacheBackend(
+            self.name, size=64 * 1024, lock_path=self.lock_path
+        )
+        self.addCleanup(backend.close)
+        return backend
+
+    def test_workers_share_entries(self):
+        """Entries written through one attachment should be seen by another."""
+        first = Cache(TTLCacheStrategy(seconds=60), backend=self._backend())
+        second = Cache(TTLCacheStrategy(seconds=60), backend=self._backend())
+
+        first.set_value("doc", {"flags": [1, 2, 3]})
+        self.assertEqual(second.get_value("doc"), {"flags": [1, 2, 3]})
+
+        second.evict("doc")
+        self.assertFalse(first.is_valid("doc"))
+
+    def test_generation_signals_freshness(self):
+        """Readers should only decode the index again after a write."""
+        writer = self._backend()
+        reader = self._backend()
+
+        writer.values["a"] = 1
+        generation = writer.generation
+        self.assertEqual(reader.values["a"], 1)
+
+        index = reader._index
+        self.assertEqual(reader.values["a"], 1)
+        self.assertIs(reader._index, index)
+
+        writer.values["a"] = 2
+        self.assertEqual(writer.generation, generation + 1)
+        self.assertEqual(reader.values["a"], 2)
+
+    def test_reads_decode_only_the_requested_entry(self):
+        """Reading an entry should not unpickle the other entries."""
+        writer = self._backend()
+        reader = self._backend()
+        writer.values["small"] = 1
+        writer.values["large"] = b"x" * 10_000
+
+        decoded = []
+        real_loads = pickle.loads
+
+        def loads(payload):
+            decoded.append(len(payload))
+            return real_loads(payload)
+
+        with patch("fastcfg.cache.backends.pickle.loads", loads):
+            self.assertEqual(reader.values["small"], 1)
+
+        self.assertTrue(decoded)
+        self.assertLess(max(decoded), 10_000)
+
+    def test_replaced_entries_are_reclaimed(self):
+        """Rewriting entries should compact the segment instead of filling it."""
+        backend = self._backend()
+        backend.values["other"] = "kept"
+
+        for i in range(20):
+            backend.values["doc"] = bytes([i]) * (20 * 1024)
+
+        self.assertEqual(backend.values["doc"], bytes([19]) * (20 * 1024))
+        self.assertEqual(backend.values["other"], "kept")
+
+        del backend.values["doc"]
+        self.assertNotIn("doc", backend.values)
+        self.assertEqual(list(backend.values), ["other"])
+
+    def test_lock_file_is_private(self):
+        """Lock files should be created for the current user only."""
+        self.assertEqual(os.stat(self.lock_path).st_mode & 0o777, 0o600)
+
+    def test_lock_file_symlink_is_refused(self):
+        """A symlink planted at the lock path should not be followed."""
+        target = f"{self.lock_path}.target"
+        link = f"{self.lock_path}.link"
+        open(target, "w").close()
+        os.symlink(target, link)
+
+        with self.assertRaises(OSError):
+            SharedMemoryCacheBackend(self.name, lock_path=link)
+
+    def test_entry_too_large(self):
+        """Writing more than the segment holds should fail loudly."""
+        backend = self._backend()
+        with self.assertRaises(ValueError):
+            backend.values["big"] = b"x" * (128 * 1024)
+
+    def test_forked_workers_fetch_once(self):
+        """Only one of several forked workers should fetch a missing value."""
+        context = multiprocessing.get_context("fork")
+        counter = context.Value("i", 0)
+        results = context.Queue()
+
+        workers = [
+            context.Process(
+                target=_shared_worker,
+                args=(self.name, self.lock_path, counter, results),
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+        self.assertEqual(
+            [results.get(timeout=1) for _ in workers], ["document"] * 4
+        )
+        self.assertEqual(counter.value, 1)
+
+    def test_backend_created_before_fork(self):
+        """Workers forked after creating the backend should still fetch once."""
+        context = multiprocessing.get_context("fork")
+        counter = context.Value("i", 0)
+        results = context.Queue()
+        backend = self._backend()
+
+        workers = [
+            context.Process(
+                target=_preforked_worker, args=(backend, counter, results)
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+        self.assertEqual(
+            [results.get(timeout=1) for _ in workers], ["document"] * 4
+        )
+        self.assertEqual(counter.value, 1)
+
+    def test_reads_do_not_wait_for_fills(self):
+        """Cached reads from other threads should not wait for a fill in progress."""
+        backend = self._backend()
+        backend.values["cached"] = 1
+        filling = threading.Event()
+        release = threading.Event()
+
+        def fill():
+            with backend.fill_lock():
+                filling.set()
+                release.wait(5)
+
+        filler = threading.Thread(target=fill)
+        filler.start()
+        self.addCleanup(filler.join)
+        self.addCleanup(release.set)
+        filling.wait(5)
+
+        started = time.monotonic()
+        self.assertEqual(backend.values["cached"], 1)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
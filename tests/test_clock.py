@@ -0,0 +1,59 @@
+import time
+import unittest
+
+from fastcfg.cache import Cache
+from fastcfg.cache.strategies import SoftTTLCacheStrategy, TTLCacheStrategy
+from fastcfg.clock import CoarseClock
+from fastcfg.exceptions import MissingCacheKeyError
+
+
+class TestCoarseClock(unittest.TestCase):
+    """
+    Test cases for the CoarseClock class.
+    """
+
+    def setUp(self):
+        self.clock = CoarseClock(resolution=0.001)
+        self.addCleanup(self.clock.stop)
+
+    def test_readings_advance(self):
+        """The ticker should keep readings close to the real time."""
+        first = self.clock.monotonic()
+        time.sleep(0.02)
+
+        self.assertGreater(self.clock.monotonic(), first)
+        self.assertAlmostEqual(self.clock.time(), time.time(), delta=0.5)
+
+    def test_stop(self):
+        """Readings should stop advancing once the clock is stopped."""
+        self.clock.stop()
+        time.sleep(0.005)
+        reading = self.clock.now
+
+        time.sleep(0.01)
+        self.assertEqual(self.clock.now, reading)
+
+    def test_invalid_resolution(self):
+        with self.assertRaises(ValueError):
+            CoarseClock(resolution=0)
+
+    def test_ttl_strategies_read_the_clock(self):
+        """TTL strategies given a clock should expire entries by its readings."""
+        self.clock.stop()
+        time.sleep(0.005)
+
+        for strategy in (
+            TTLCacheStrategy(seconds=10, clock=self.clock),
+            SoftTTLCacheStrategy(5, 10, clock=self.clock),
+        ):
+            cache = Cache(strategy)
+            cache.set_value("key", "value")
+            self.assertEqual(cache.get_value("key"), "value")
+
+            self.clock.now += 11
+            with self.assertRaises(MissingCacheKeyError):
+                cache.get_value("key")
+
+
+if __name__ == "__main__":
+    unittest.main()
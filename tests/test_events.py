@@ -1,9 +1,29 @@
+import asyncio
+import copy
+import time
+import threading
+from datetime import datetime, timedelta
 import unittest
 import os
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 from fastcfg.config import Config
-from fastcfg.sources.memory import from_os_environ
-from fastcfg.config.events import ChangeEvent
+from fastcfg.sources.memory import from_callable, from_os_environ
+from fastcfg.config.events import ChangeEvent, ChangeSet
+from fastcfg.exceptions import (
+    ConfigItemValidationError,
+    InvalidOperationError,
+    JournalTruncatedError,
+)
+from fastcfg.validation import IConfigValidator
+from fastcfg.config.dispatch import AsyncioDispatcher, QueuedDispatcher
+from fastcfg.config.error_sinks import LoggingErrorSink, set_listener_error_sink
+from fastcfg.config.timers import get_timer_thread
+from fastcfg.config.journal import MISSING
+from fastcfg.config.listener_stats import (
+    disable_listener_stats,
+    enable_listener_stats,
+    get_listener_stats,
+)
 
 
 class TestEventSystem(unittest.TestCase):
@@ -515,3 +535,900 @@ class TestEventSystem(unittest.TestCase):
         
         # Clean up
         del os.environ["TEST_REFRESH"]
+
+
+class TestEventDispatchers(unittest.TestCase):
+    """
+    Test cases for listeners delivered through an event dispatcher.
+    """
+
+    def setUp(self):
+        self.config = Config(host="localhost", port=5432)
+        self.received = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def _blocking_listener(self, event):
+        """Record an event, stalling on the first one until released."""
+        self.received.append(event)
+        self.started.set()
+        self.release.wait(5)
+
+    def _dispatcher(self, **kwargs):
+        dispatcher = QueuedDispatcher(**kwargs)
+        self.addCleanup(dispatcher.close)
+        self.addCleanup(self.release.set)
+        return dispatcher
+
+    def test_listener_runs_off_the_setter(self):
+        """A slow listener should not stall the code that changed the value."""
+        dispatcher = self._dispatcher()
+        self.config.host.on_change(self._blocking_listener, dispatcher=dispatcher)
+
+        self.config.host = "first.com"
+        self.assertTrue(self.started.wait(5))
+        self.config.host = "second.com"
+
+        # The setter returned while the listener is still stalled
+        self.assertEqual(len(self.received), 1)
+
+        self.release.set()
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual(
+            [event.new_value for event in self.received], ["first.com", "second.com"]
+        )
+
+    def test_drop_oldest(self):
+        """The oldest pending events should be discarded once the queue is full."""
+        dispatcher = self._dispatcher(maxsize=2, backpressure="drop_oldest")
+        self.config.port.on_change(self._blocking_listener, dispatcher=dispatcher)
+
+        self.config.port = 1
+        self.assertTrue(self.started.wait(5))
+        for port in range(2, 6):
+            self.config.port = port
+
+        self.release.set()
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual([event.new_value for event in self.received], [1, 4, 5])
+        self.assertEqual(dispatcher.dropped, 2)
+
+    def test_coalesce(self):
+        """Pending events for the same item should be merged into one."""
+        dispatcher = self._dispatcher(maxsize=1, backpressure="coalesce")
+        self.config.port.on_change(self._blocking_listener, dispatcher=dispatcher)
+
+        self.config.port = 1
+        self.assertTrue(self.started.wait(5))
+        for port in range(2, 6):
+            self.config.port = port
+
+        self.release.set()
+        self.assertTrue(dispatcher.flush(5))
+
+        first, merged = self.received
+        self.assertEqual((first.old_value, first.new_value), (5432, 1))
+        self.assertEqual((merged.old_value, merged.new_value), (1, 5))
+        self.assertEqual(dispatcher.coalesced, 3)
+
+    def test_coalesce_only_when_full(self):
+        """Pending events should be kept apart while the queue has room."""
+        dispatcher = self._dispatcher(maxsize=10, backpressure="coalesce")
+        self.config.port.on_change(self._blocking_listener, dispatcher=dispatcher)
+
+        self.config.port = 1
+        self.assertTrue(self.started.wait(5))
+        for port in range(2, 6):
+            self.config.port = port
+
+        self.release.set()
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual([event.new_value for event in self.received], [1, 2, 3, 4, 5])
+        self.assertEqual(dispatcher.coalesced, 0)
+
+    def test_block(self):
+        """The notifying thread should wait while the queue is full."""
+        dispatcher = self._dispatcher(maxsize=1)
+        self.config.port.on_change(self._blocking_listener, dispatcher=dispatcher)
+
+        self.config.port = 1
+        self.assertTrue(self.started.wait(5))
+        self.config.port = 2
+
+        setter = threading.Thread(target=setattr, args=(self.config, "port", 3))
+        setter.start()
+        setter.join(0.05)
+        self.assertTrue(setter.is_alive())
+
+        self.release.set()
+        setter.join(5)
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual([event.new_value for event in self.received], [1, 2, 3])
+
+    def test_closed_dispatcher_does_not_break_setters(self):
+        """Dispatch errors should be reported, not raised past the assignment."""
+        errors = []
+        set_listener_error_sink(lambda listener, event, error: errors.append(error))
+        self.addCleanup(set_listener_error_sink, None)
+
+        dispatcher = self._dispatcher()
+        dispatcher.close()
+        self.config.port.on_change(self._blocking_listener, dispatcher=dispatcher)
+        config_events = []
+        self.config.on_change(config_events.append)
+
+        self.config.port = 1
+
+        self.assertEqual(self.config.port, 1)
+        self.assertEqual([event.new_value for event in config_events], [1])
+        (error,) = errors
+        self.assertIsInstance(error, RuntimeError)
+
+    def test_invalid_backpressure(self):
+        with self.assertRaises(ValueError):
+            QueuedDispatcher(backpressure="drop_newest")
+
+    def test_asyncio_dispatcher(self):
+        """Coroutine listeners should be awaited on the dispatcher's loop."""
+
+        async def main():
+            dispatcher = AsyncioDispatcher()
+            done = asyncio.Event()
+
+            async def listener(event):
+                await asyncio.sleep(0)
+                self.received.append(event.new_value)
+                if event.new_value == 3:
+                    done.set()
+
+            self.config.port.on_change(listener, dispatcher=dispatcher)
+
+            # Changes from another thread are delivered on the loop too
+            await asyncio.to_thread(setattr, self.config, "port", 1)
+            self.config.port = 2
+            self.config.port = 3
+
+            await asyncio.wait_for(done.wait(), 5)
+            dispatcher.close()
+
+        asyncio.run(main())
+        self.assertEqual(self.received, [1, 2, 3])
+
+
+class TestChangeEvent(unittest.TestCase):
+    """
+    Test cases for the ChangeEvent object itself.
+    """
+
+    def test_timestamp_is_derived_lazily(self):
+        """The wall clock timestamp should match the time the change occurred."""
+        before = datetime.now()
+        event = ChangeEvent(None, 1, 2)
+        after = datetime.now()
+
+        self.assertIsNone(event._timestamp)
+        self.assertTrue(before - timedelta(milliseconds=50) <= event.timestamp <= after + timedelta(milliseconds=50))
+        self.assertIs(event.timestamp, event.timestamp)
+
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            ChangeEvent(None, 1, 2).extra = True
+
+    def test_event_is_shared_up_the_chain(self):
+        """Listeners at every level should receive the same event object."""
+        config = Config(database={"host": "localhost"})
+        received = []
+        config.database.host.on_change(received.append)
+        config.database.on_change(received.append)
+        config.on_change(received.append)
+
+        config.database.host = "changed.com"
+
+        self.assertEqual(len(received), 3)
+        self.assertTrue(all(event is received[0] for event in received))
+
+
+class CountingPortValidator(IConfigValidator):
+    """Accepts ports below 65536 and counts its calls."""
+
+    def __init__(self):
+        super().__init__(validate_immediately=False)
+        self.calls = 0
+
+    def validate(self, value):
+        self.calls += 1
+        return value < 65536
+
+    def error_message(self):
+        return "Invalid port"
+
+
+class TestBatchedChanges(unittest.TestCase):
+    """
+    Test cases for batched changes committed with aggregated events.
+    """
+
+    def setUp(self):
+        self.config = Config(
+            database={"host": "localhost", "port": 5432},
+            api={"timeout": 30},
+        )
+        self.root_events = []
+        self.database_events = []
+        self.config.on_change(self.root_events.append)
+        self.config.database.on_change(self.database_events.append)
+
+    def test_single_change_set_per_config(self):
+        """Each config above the changes should receive one ChangeSet at commit."""
+        host_events = []
+        self.config.database.host.on_change(host_events.append)
+
+        with self.config.batch():
+            self.config.database.host = "first.com"
+            self.config.database.host = "second.com"
+            self.config.database.port = 6432
+            self.config.api.timeout = 60
+
+            # Nothing is delivered before the commit
+            self.assertEqual(self.root_events, [])
+            self.assertEqual(host_events, [])
+
+        (host_event,) = host_events
+        self.assertEqual((host_event.old_value, host_event.new_value), ("localhost", "second.com"))
+
+        (database_set,) = self.database_events
+        self.assertIsInstance(database_set, ChangeSet)
+        self.assertEqual(
+            [(e.old_value, e.new_value) for e in database_set],
+            [("localhost", "second.com"), (5432, 6432)],
+        )
+
+        (root_set,) = self.root_events
+        self.assertEqual(len(root_set), 3)
+        self.assertIs(root_set.changes[0], host_event)
+
+    def test_reverted_change_is_not_notified(self):
+        with self.config.batch():
+            self.config.database.port = 1
+            self.config.database.port = 5432
+
+        self.assertEqual(self.root_events, [])
+
+    def test_validation_is_deferred(self):
+        """Validators should run once at commit, on the final value."""
+        validator = CountingPortValidator()
+        self.config.database.port.add_validator(validator)
+
+        with self.config.batch():
+            for port in range(6000, 6010):
+                self.config.database.port = port
+
+        self.assertEqual(validator.calls, 1)
+        self.assertEqual(self.config.database.port, 6009)
+
+    def test_failed_validation_rolls_back(self):
+        self.config.database.port.add_validator(CountingPortValidator())
+
+        with self.assertRaises(ConfigItemValidationError):
+            with self.config.batch():
+                self.config.database.host = "changed.com"
+                self.config.database.port = 70000
+
+        self.assertEqual(self.config.database.host, "localhost")
+        self.assertEqual(self.config.database.port, 5432)
+        self.assertEqual(self.root_events, [])
+
+    def test_error_rolls_back(self):
+        """An error inside the block should undo value changes and added attributes."""
+        with self.assertRaises(RuntimeError):
+            with self.config.batch():
+                self.config.database.port = 6432
+                self.config.database.user = "admin"
+                raise RuntimeError("abort")
+
+        self.assertEqual(self.config.database, {"host": "localhost", "port": 5432})
+        self.assertEqual(self.root_events, [])
+
+    def test_nested_batches_join(self):
+        with self.config.batch():
+            with self.config.database.batch():
+                self.config.database.port = 6432
+            self.assertEqual(self.database_events, [])
+            self.config.api.timeout = 60
+
+        self.assertEqual(len(self.database_events), 1)
+        self.assertEqual(len(self.root_events[0]), 2)
+
+    def test_update_is_batched(self):
+        """update should validate and notify once for every merged key."""
+        self.config.update(
+            {"database": {"host": "db.internal", "port": 6432}, "api": {"timeout": 60}}
+        )
+
+        (root_set,) = self.root_events
+        self.assertEqual(
+            [e.new_value for e in root_set], ["db.internal", 6432, 60]
+        )
+
+
+
+class TestPathSubscriptions(unittest.TestCase):
+    """
+    Test cases for path-pattern subscriptions on configs.
+    """
+
+    def setUp(self):
+        self.config = Config(
+            database={
+                "primary": {"host": "db1", "port": 5432},
+                "replica": {"host": "db2", "port": 5432},
+            },
+            api={"timeout": 30},
+        )
+        self.received = []
+
+    def _paths(self):
+        return [event.path for event in self.received]
+
+    def test_single_wildcard(self):
+        self.config.subscribe("database.*.host", self.received.append)
+
+        self.config.database.primary.host = "db3"
+        self.config.database.primary.port = 6432
+        self.config.database.replica.host = "db4"
+
+        self.assertEqual(
+            self._paths(), ["database.primary.host", "database.replica.host"]
+        )
+        self.assertEqual(self.received[0].new_value, "db3")
+
+    def test_multi_wildcard(self):
+        self.config.subscribe("**.port", self.received.append)
+        self.config.subscribe("database.**", self.received.append)
+
+        self.config.database.replica.port = 6432
+        self.config.api.timeout = 60
+
+        # Each subscription is notified once per matching change
+        self.assertEqual(
+            self._paths(), ["database.replica.port", "database.replica.port"]
+        )
+
+    def test_relative_to_nested_config(self):
+        """Patterns on a nested config should be relative to it."""
+        self.config.database.subscribe("primary.host", self.received.append)
+
+        self.config.database.primary.host = "db3"
+        self.assertEqual(self._paths(), ["database.primary.host"])
+
+    def test_decorator_and_unsubscribe(self):
+        @self.config.subscribe("api.timeout")
+        def handler(event):
+            self.received.append(event)
+
+        self.config.api.timeout = 60
+        self.assertTrue(self.config.unsubscribe("api.timeout", handler))
+        self.config.api.timeout = 90
+
+        self.assertEqual(len(self.received), 1)
+        self.assertFalse(self.config.unsubscribe("api.timeout", handler))
+
+    def test_batched_changes(self):
+        """Subscriptions should receive each matching net change at commit."""
+        self.config.subscribe("database.*.host", self.received.append)
+
+        with self.config.batch():
+            self.config.database.primary.host = "db3"
+            self.config.database.primary.host = "db5"
+            self.config.api.timeout = 60
+            self.assertEqual(self.received, [])
+
+        (event,) = self.received
+        self.assertEqual((event.old_value, event.new_value), ("db1", "db5"))
+
+    def test_invalid_pattern(self):
+        with self.assertRaises(ValueError):
+            self.config.subscribe("database..host", self.received.append)
+
+
+class TestDebounceAndThrottle(unittest.TestCase):
+    """
+    Test cases for debounced and throttled listeners.
+    """
+
+    def setUp(self):
+        self.config = Config(port=0)
+        self.received = []
+        self.delivered = threading.Event()
+
+    def _listener(self, event):
+        self.received.append(event)
+        self.delivered.set()
+
+    def test_debounce_coalesces_bursts(self):
+        """A burst of changes should be delivered once, as its net change."""
+        self.config.port.on_change(self._listener, debounce=0.05)
+
+        for port in range(1, 11):
+            self.config.port = port
+        self.assertEqual(self.received, [])
+
+        self.assertTrue(self.delivered.wait(5))
+        time.sleep(0.1)
+
+        (event,) = self.received
+        self.assertEqual((event.old_value, event.new_value), (0, 10))
+
+    def test_debounce_drops_flapping(self):
+        """A value that flipped back during the burst should not be delivered."""
+        self.config.port.on_change(self._listener, debounce=0.02)
+
+        self.config.port = 1
+        self.config.port = 0
+        time.sleep(0.1)
+
+        self.assertEqual(self.received, [])
+
+    def test_throttle(self):
+        """The first change is delivered at once, the rest at the end of the interval."""
+        self.config.port.on_change(self._listener, throttle=0.05)
+
+        self.config.port = 1
+        self.assertEqual(len(self.received), 1)
+
+        self.delivered.clear()
+        self.config.port = 2
+        self.config.port = 3
+        self.assertEqual(len(self.received), 1)
+
+        self.assertTrue(self.delivered.wait(5))
+        self.assertEqual(
+            [(e.old_value, e.new_value) for e in self.received], [(0, 1), (1, 3)]
+        )
+
+    def test_remove_wrapped_listener(self):
+        self.config.port.on_change(self._listener, throttle=1)
+        self.config.port.remove_change_listener(self._listener)
+
+        self.config.port = 1
+        self.assertEqual(self.received, [])
+
+    def test_debounce_and_throttle_are_exclusive(self):
+        with self.assertRaises(ValueError):
+            self.config.port.on_change(self._listener, debounce=1, throttle=1)
+
+    def test_timer_errors_go_to_error_sink(self):
+        """Errors raised on the timer thread should reach the listener error sink."""
+        reported = []
+        set_listener_error_sink(lambda *args: (reported.append(args), self.delivered.set()))
+        self.addCleanup(set_listener_error_sink, None)
+
+        def broken():
+            raise RuntimeError("timer failed")
+
+        get_timer_thread().schedule(0, broken)
+
+        self.assertTrue(self.delivered.wait(5))
+        ((listener, event, error),) = reported
+        self.assertIs(listener, broken)
+        self.assertIsNone(event)
+        self.assertEqual(str(error), "timer failed")
+
+
+class TestChangeJournal(unittest.TestCase):
+    """
+    Test cases for the change journal and rollback.
+    """
+
+    def setUp(self):
+        self.config = Config(database={"host": "localhost", "port": 5432}, debug=False)
+        self.journal = self.config.enable_journal(capacity=5)
+
+    def test_records_changes_with_paths(self):
+        self.config.database.host = "db.internal"
+        self.config.debug = True
+
+        first, second = self.journal.changes_since(0)
+        self.assertEqual(
+            (first.seq, first.path, first.old_value, first.new_value),
+            (1, "database.host", "localhost", "db.internal"),
+        )
+        self.assertEqual((second.seq, second.path), (2, "debug"))
+        self.assertLessEqual(first.monotonic_ns, second.monotonic_ns)
+        self.assertEqual(self.journal.changes_since(2), [])
+
+    def test_enable_is_idempotent(self):
+        self.assertIs(self.config.enable_journal(), self.journal)
+        self.assertIs(self.config.get_journal(), self.journal)
+
+    def test_batched_changes_are_journaled(self):
+        with self.config.batch():
+            self.config.database.port = 1
+            self.config.database.port = 2
+
+        (entry,) = self.journal.changes_since(0)
+        self.assertEqual((entry.old_value, entry.new_value), (5432, 2))
+
+    def test_bounded_capacity(self):
+        """Old changes should be evicted, and catching up past them should fail."""
+        for port in range(1, 9):
+            self.config.database.port = port
+
+        self.assertEqual(len(self.journal), 5)
+        self.assertEqual(self.journal.first_seq, 4)
+        self.assertEqual([e.new_value for e in self.journal.changes_since(3)], [4, 5, 6, 7, 8])
+
+        with self.assertRaises(JournalTruncatedError):
+            self.journal.changes_since(2)
+
+    def test_rollback(self):
+        """Rolling back should restore the values at the sequence number."""
+        self.config.database.host = "first.com"
+        seq = self.journal.last_seq
+
+        self.config.database.host = "second.com"
+        self.config.database.port = 6432
+        self.config.debug = True
+
+        self.config.rollback(seq)
+
+        self.assertEqual(self.config.database.host, "first.com")
+        self.assertEqual(self.config.database.port, 5432)
+        self.assertEqual(self.config.debug, False)
+
+        # The rollback is journaled as new changes
+        self.assertEqual(self.journal.last_seq, seq + 6)
+
+    def test_rollback_removes_added_attributes(self):
+        """Attributes added after the sequence number should be removed."""
+        seq = self.journal.last_seq
+
+        self.config.timeout = 2
+        self.config.timeout = 3
+        with self.config.batch():
+            self.config.database.user = "admin"
+
+        entry = self.journal.changes_since(seq)[0]
+        self.assertEqual((entry.path, entry.old_value, entry.new_value), ("timeout", MISSING, 2))
+
+        self.config.rollback(seq)
+
+        self.assertNotIn("timeout", self.config)
+        self.assertNotIn("user", self.config.database)
+        self.assertEqual(self.config.database.host, "localhost")
+
+        # The removals are journaled after the changes they follow
+        self.assertEqual(
+            [
+                (entry.path, entry.old_value, entry.new_value)
+                for entry in self.journal.changes_since(self.journal.last_seq - 3)
+            ],
+            [
+                ("timeout", 3, 2),
+                ("database.user", "admin", MISSING),
+                ("timeout", 2, MISSING),
+            ],
+        )
+
+    def test_rollback_restores_removed_attributes(self):
+        """Attributes removed after the sequence number should be added back."""
+        seq = self.journal.last_seq
+
+        del self.config.debug
+        del self.config.database
+
+        entry = self.journal.changes_since(seq)[0]
+        self.assertEqual((entry.path, entry.old_value, entry.new_value), ("debug", False, MISSING))
+
+        self.config.rollback(seq)
+
+        self.assertEqual(self.config.debug, False)
+        self.assertEqual(self.config.database.host, "localhost")
+
+    def test_rollback_requires_journal(self):
+        self.config.disable_journal()
+        with self.assertRaises(InvalidOperationError):
+            self.config.rollback(0)
+
+
+class TestListenerErrorSink(unittest.TestCase):
+    """
+    Test cases for the pluggable, rate-limited listener error sink.
+    """
+
+    def setUp(self):
+        self.config = Config(port=0)
+        self.addCleanup(set_listener_error_sink, None)
+
+    @staticmethod
+    def failing_listener(event):
+        raise RuntimeError(f"failed on {event.new_value}")
+
+    def test_custom_sink(self):
+        errors = []
+        set_listener_error_sink(lambda listener, event, error: errors.append((listener, event, error)))
+        self.config.port.on_change(self.failing_listener)
+
+        self.config.port = 1
+
+        ((listener, event, error),) = errors
+        self.assertIs(listener, self.failing_listener)
+        self.assertEqual(event.new_value, 1)
+        self.assertIsInstance(error, RuntimeError)
+
+    def test_logging_is_rate_limited(self):
+        """Repeated failures should be counted, then logged with their count."""
+        self.now = 0
+        sink = LoggingErrorSink(interval=60)
+        set_listener_error_sink(sink)
+        self.config.port.on_change(self.failing_listener)
+
+        with patch("time.monotonic", side_effect=lambda: self.now):
+            with self.assertLogs("fastcfg.events", level="ERROR") as logs:
+                for port in range(1, 11):
+                    self.config.port = port
+
+                self.now = 61
+                self.config.port = 11
+
+        first, second = logs.records
+        self.assertIn("failed on 1", first.getMessage())
+        self.assertIsNotNone(first.exc_info)
+        self.assertIn("failed on 11", second.getMessage())
+        self.assertIn("9 similar failures suppressed", second.getMessage())
+        self.assertEqual(sink.suppressed, 9)
+
+    def test_flush(self):
+        sink = LoggingErrorSink(interval=60)
+        set_listener_error_sink(sink)
+        self.config.port.on_change(self.failing_listener)
+
+        with self.assertLogs("fastcfg.events", level="ERROR") as logs:
+            self.config.port = 1
+            self.config.port = 2
+            sink.flush()
+            sink.flush()
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("failed 1 more times with RuntimeError", logs.records[1].getMessage())
+
+
+class TestListenerStats(unittest.TestCase):
+    """
+    Test cases for listener latency statistics.
+    """
+
+    def setUp(self):
+        self.config = Config(port=0)
+        self.addCleanup(disable_listener_stats)
+
+    @staticmethod
+    def slow_listener(event):
+        time.sleep(0.02)
+
+    @staticmethod
+    def fast_listener(event):
+        pass
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_listener_stats())
+
+    def test_per_listener_timings(self):
+        stats = enable_listener_stats()
+        self.config.port.on_change(self.slow_listener)
+        self.config.port.on_change(self.fast_listener)
+
+        for port in range(1, 4):
+            self.config.port = port
+
+        slow = stats.get(self.slow_listener)
+        self.assertEqual(slow.calls, 3)
+        self.assertGreaterEqual(slow.mean(), 0.02)
+        self.assertGreaterEqual(slow.quantile(0.99), 0.02)
+        self.assertEqual(stats.slowest(1), [slow])
+        self.assertLess(stats.get(self.fast_listener).max_seconds, 0.02)
+
+    def test_slow_listener_reports_registration_site(self):
+        """Slow calls should be reported once per interval, with the registration site."""
+        reports = []
+        enable_listener_stats(
+            slow_threshold=0.01, on_slow=lambda timing, seconds: reports.append((timing, seconds))
+        )
+        self.config.port.on_change(self.slow_listener)  # registration line
+        self.config.port.on_change(self.fast_listener)
+
+        self.config.port = 1
+        self.config.port = 2
+
+        ((timing, seconds),) = reports
+        self.assertTrue(timing.name.endswith("slow_listener"))
+        self.assertGreaterEqual(seconds, 0.01)
+        self.assertIn("test_events.py", timing.registration_site)
+        self.assertIn("test_slow_listener_reports_registration_site", timing.registration_site)
+
+    def test_listeners_sharing_a_name(self):
+        """Listeners with the same qualified name, like lambdas, should be timed apart."""
+        stats = enable_listener_stats()
+        first = lambda event: None
+        second = lambda event: time.sleep(0.02)
+        self.config.port.on_change(first)
+        self.config.port.on_change(second)
+
+        self.config.port = 1
+
+        self.assertEqual(len(stats.timings()), 2)
+        self.assertLess(stats.get(first).max_seconds, 0.02)
+        self.assertGreaterEqual(stats.get(second).max_seconds, 0.02)
+        self.assertIs(stats.get(stats.get(first).name), stats.get(first))
+
+    def test_default_report_logs_warning(self):
+        enable_listener_stats(slow_threshold=0.01)
+        self.config.port.on_change(self.slow_listener)
+
+        with self.assertLogs("fastcfg.events", level="WARNING") as logs:
+            self.config.port = 1
+
+        self.assertIn("Slow event listener", logs.output[0])
+
+
+class TestConfigWatch(unittest.TestCase):
+    def setUp(self):
+        self.config = Config(feature_flags={"beta": False, "dark_mode": False}, port=8080)
+
+    def test_watch_yields_subtree_changes(self):
+        async def consume():
+            async with self.config.watch("feature_flags") as changes:
+                self.config.port = 9090
+                self.config.feature_flags.beta = True
+                self.config.feature_flags.dark_mode = True
+                return [await anext(changes), await anext(changes)]
+
+        first, second = asyncio.run(consume())
+        self.assertEqual((first.path, first.new_value), ("feature_flags.beta", True))
+        self.assertEqual((second.path, second.new_value), ("feature_flags.dark_mode", True))
+
+    def test_changes_from_other_threads(self):
+        async def consume():
+            received = []
+            async with self.config.watch() as changes:
+                thread = threading.Thread(target=lambda: setattr(self.config, "port", 1))
+                thread.start()
+                async for change in changes:
+                    received.append(change)
+                    break
+            thread.join()
+            return received
+
+        (change,) = asyncio.run(consume())
+        self.assertEqual((change.path, change.old_value, change.new_value), ("port", 8080, 1))
+
+    def test_close_ends_iteration_and_unsubscribes(self):
+        async def consume():
+            changes = self.config.watch("port")
+            self.config.port = 1
+            changes.close()
+            self.config.port = 2
+            return [change.new_value async for change in changes]
+
+        self.assertEqual(asyncio.run(consume()), [1])
+        self.assertEqual(len(self.config._subscriptions), 0)
+
+    def test_maxsize_drops_oldest(self):
+        async def consume():
+            changes = self.config.watch("port", maxsize=2)
+            for port in (1, 2, 3):
+                self.config.port = port
+            changes.close()
+            return changes, [change.new_value async for change in changes]
+
+        changes, values = asyncio.run(consume())
+        self.assertEqual(values, [2, 3])
+        self.assertEqual(changes.dropped, 1)
+
+    def test_requires_running_loop(self):
+        with self.assertRaises(RuntimeError):
+            self.config.watch()
+
+
+class TestDictDiffEvents(unittest.TestCase):
+    """
+    Test cases for key-level events of live items returning dictionaries.
+    """
+
+    def setUp(self):
+        self.document = {"checkout_v2": False, "search": {"engine": "v1"}, "legacy": True}
+        self.config = Config()
+        self.config.flags = from_callable(lambda: copy.deepcopy(self.document))
+        self.config.flags.value  # Initial read
+
+    def test_key_listener_fires_only_for_its_key(self):
+        checkout = Mock()
+        self.config.flags.checkout_v2.on_change(checkout)
+
+        self.document["search"]["engine"] = "v2"
+        self.config.flags.value
+        checkout.assert_not_called()
+
+        self.document["checkout_v2"] = True
+        self.config.flags.value
+        (event,) = [c.args[0] for c in checkout.call_args_list]
+        self.assertEqual((event.path, event.old_value, event.new_value), ("flags.checkout_v2", False, True))
+
+    def test_added_removed_and_nested_keys(self):
+        received = []
+        self.config.subscribe("flags.**", received.append)
+
+        del self.document["legacy"]
+        self.document["dark_mode"] = True
+        self.document["search"]["engine"] = "v2"
+        self.config.flags.value
+
+        changes = {event.path: (event.old_value, event.new_value) for event in received}
+        self.assertEqual(
+            changes,
+            {
+                "flags.legacy": (True, None),
+                "flags.dark_mode": (None, True),
+                "flags.search.engine": ("v1", "v2"),
+            },
+        )
+
+    def test_reads_reflect_updated_keys(self):
+        """Keys read through the item should follow the source."""
+        self.document["checkout_v2"] = True
+        self.document["search"]["engine"] = "v2"
+
+        self.assertEqual(self.config.flags.checkout_v2, True)
+        self.assertEqual(self.config.flags.search.engine, "v2")
+
+    def test_parent_listener_receives_key_events(self):
+        received = []
+        self.config.flags.on_change(received.append)
+
+        self.document["checkout_v2"] = True
+        self.config.flags.value
+        self.config.flags.value  # Unchanged
+
+        (event,) = received
+        self.assertEqual(event.path, "flags.checkout_v2")
+
+    def test_key_events_are_journaled_as_live(self):
+        """Key changes come from the source, so rolling back should skip them."""
+        journal = self.config.enable_journal()
+        seq = journal.last_seq
+
+        self.document["checkout_v2"] = True
+        self.config.flags.value
+
+        (entry,) = journal.changes_since(seq)
+        self.assertEqual(entry.path, "flags.checkout_v2")
+        self.assertTrue(entry.live)
+
+        self.config.rollback(seq)
+        self.assertEqual(self.config.flags.checkout_v2, True)
+
+    def test_keys_are_added_again_after_a_scalar(self):
+        received = []
+        self.config.subscribe("flags.**", received.append)
+        document = self.document
+
+        self.document = "disabled"
+        self.config.flags.value
+        self.document = document
+        self.config.flags.value
+
+        changes = {event.path: (event.old_value, event.new_value) for event in received[1:]}
+        self.assertEqual(changes["flags.checkout_v2"], (None, False))
+        self.assertEqual(self.config.flags.search.engine, "v1")
+
+    def test_key_events_in_batch(self):
+        received = []
+        self.config.subscribe("flags.checkout_v2", received.append)
+
+        with self.config.batch():
+            self.document["checkout_v2"] = True
+            self.config.flags.value
+            self.assertEqual(received, [])
+
+        (event,) = received
+        self.assertEqual(event.new_value, True)
@@ -0,0 +1,114 @@
+import threading
+import time
+import unittest
+
+from fastcfg.config.state import AbstractLiveStateTracker
+from fastcfg.hedging import Hedger, HedgingPolicy, LatencyHistogram
+
+
+class SlowFirstSource:
+    """A source whose first call stalls and whose later calls are fast."""
+
+    def __init__(self, stall=0.5, fail=False):
+        self.calls = 0
+        self.stall = stall
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(self.stall)
+        if self.fail:
+            raise ConnectionError(f"call {call} failed")
+        return call
+
+
+def _warm_hedger(policy, latency=0.001):
+    """Create a hedger that already observed enough latencies to hedge."""
+    hedger = Hedger(policy)
+    for _ in range(policy.min_samples):
+        hedger.histogram.record(latency)
+    # Observed calls allow hedging within the ratio
+    hedger.calls = policy.min_samples
+    return hedger
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_quantiles(self):
+        """Quantiles should be estimated within the bucket resolution."""
+        histogram = LatencyHistogram()
+        self.assertIsNone(histogram.quantile(0.95))
+
+        for i in range(1, 101):
+            histogram.record(i / 1000)
+
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.05, delta=0.01)
+        self.assertAlmostEqual(histogram.quantile(0.95), 0.095, delta=0.02)
+
+    def test_window(self):
+        """Counts should be halved once the window is full."""
+        histogram = LatencyHistogram(window=10)
+        for _ in range(10):
+            histogram.record(0.01)
+        self.assertEqual(histogram.count(), 5)
+
+
+class TestHedger(unittest.TestCase):
+
+    def test_no_hedging_before_enough_samples(self):
+        """Calls should run inline until enough latencies were observed."""
+        hedger = Hedger(HedgingPolicy(min_samples=5))
+        self.assertIsNone(hedger.hedge_delay())
+
+        source = SlowFirstSource(stall=0.01)
+        self.assertEqual(hedger.call(source), 1)
+        self.assertEqual(hedger.hedges, 0)
+        self.assertEqual(hedger.histogram.count(), 1)
+
+    def test_hedge_wins(self):
+        """A stalled call should be overtaken by the hedge."""
+        hedger = _warm_hedger(HedgingPolicy(max_hedge_ratio=1))
+        source = SlowFirstSource()
+
+        start = time.perf_counter()
+        self.assertEqual(hedger.call(source), 2)
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(hedger.hedges, 1)
+
+    def test_hedge_ratio_is_capped(self):
+        """Once the hedge budget is spent, slow calls are simply awaited."""
+        hedger = _warm_hedger(HedgingPolicy(max_hedge_ratio=0))
+        source = SlowFirstSource(stall=0.05)
+
+        self.assertEqual(hedger.call(source), 1)
+        self.assertEqual(hedger.hedges, 0)
+        self.assertEqual(source.calls, 1)
+
+    def test_every_call_failed(self):
+        """The first call's error should be raised if the hedge fails too."""
+        hedger = _warm_hedger(HedgingPolicy(max_hedge_ratio=1))
+        source = SlowFirstSource(stall=0.05, fail=True)
+
+        with self.assertRaisesRegex(ConnectionError, "call 1 failed"):
+            hedger.call(source)
+
+    def test_tracker_hedging(self):
+        """Live trackers should hedge their fetches when given a policy."""
+        source = SlowFirstSource()
+
+        class Tracker(AbstractLiveStateTracker):
+            def get_state_value(self):
+                return source()
+
+        tracker = Tracker(hedging_policy=HedgingPolicy(max_hedge_ratio=1))
+        tracker._hedger = _warm_hedger(tracker._hedger.policy)
+
+        self.assertEqual(tracker.get_state(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
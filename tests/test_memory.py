@@ -38,3 +38,27 @@ class TestMemorySources(unittest.TestCase):
 
         with self.assertRaises(MissingEnvironmentVariableError):
             str(config.env)
+
+    def test_os_environ_negative_cache(self):
+        """
+        Test that a missing variable is remembered for the negative TTL
+        """
+
+        os.environ.pop("TEST_NEGATIVE_ENV", None)
+        config = Config()
+        item = from_os_environ("TEST_NEGATIVE_ENV", negative_ttl=60)
+        config.env = item
+
+        with self.assertRaises(MissingEnvironmentVariableError) as first:
+            str(config.env)
+
+        # The miss is served from the negative cache until it expires
+        os.environ["TEST_NEGATIVE_ENV"] = "late"
+        self.addCleanup(os.environ.pop, "TEST_NEGATIVE_ENV", None)
+
+        with self.assertRaises(MissingEnvironmentVariableError) as second:
+            str(config.env)
+        self.assertIs(second.exception, first.exception)
+
+        item._state_tracker._negative_cache.clear()
+        self.assertEqual(config.env, "late")
@@ -8,11 +8,29 @@ from unittest.mock import Mock, patch
 from unittest import skipIf
 
 from fastcfg.config import Config
+from fastcfg.config.items import LiveConfigItem
+from fastcfg.config.state import AbstractLiveStateTracker
+from fastcfg.hedging import HedgingPolicy
 from fastcfg.sources.files import from_ini, from_json, from_yaml
 from fastcfg.sources.memory import from_os_environ
 from fastcfg.sources.aws import from_app_config
 
 
+class HedgedEnvironmentTracker(AbstractLiveStateTracker):
+    """An environment variable tracker hedging its reads."""
+
+    def __init__(self, key):
+        super().__init__(hedging_policy=HedgingPolicy())
+        self._key = key
+
+    def get_state_value(self):
+        return os.environ[self._key]
+
+
+def on_port_change(event):
+    """A listener that can be pickled with its config."""
+
+
 class TestSerialization(unittest.TestCase):
     """
     Test cases for Config serialization functionality.
@@ -437,4 +455,55 @@ class TestSerialization(unittest.TestCase):
         config.import_values(temp_file)
         self.assertEqual(config.nested.level1.level2.existing, "value")  # preserved
         self.assertEqual(config.nested.level1.level2.to_replace, "new")  # updated
-        self.assertEqual(config.nested.level1.level2.added, "fresh")     # added
\ No newline at end of file
+        self.assertEqual(config.nested.level1.level2.added, "fresh")     # added
+
+
+class TestSaveRuntimeState(unittest.TestCase):
+    """
+    Test cases for saving configs whose items hold runtime state, such as locks.
+    """
+
+    def _round_trip(self, config):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "config.pkl")
+
+        config.save(path)
+        return Config.load(path)
+
+    def test_save_with_hedging(self):
+        os.environ["FASTCFG_HEDGED"] = "value"
+        config = Config()
+        config.hedged = LiveConfigItem(HedgedEnvironmentTracker("FASTCFG_HEDGED"))
+        self.assertEqual(config.hedged, "value")
+
+        loaded = self._round_trip(config)
+        self.assertEqual(loaded.hedged, "value")
+
+    def test_save_with_journal(self):
+        config = Config(port=1)
+        config.enable_journal()
+        config.timeout = 5
+        config.port = 2
+
+        loaded = self._round_trip(config)
+        journal = loaded.get_journal()
+        self.assertEqual(journal.last_seq, 2)
+
+        # The sentinel survives pickling, so the addition is still rolled back
+        loaded.rollback(0)
+        self.assertEqual(loaded.port, 1)
+        self.assertNotIn("timeout", loaded)
+
+    def test_save_with_debounced_and_throttled_listeners(self):
+        config = Config(port=1, host="localhost")
+        config.port.on_change(on_port_change, debounce=10)
+        config.host.on_change(on_port_change, throttle=10)
+        config.port = 2  # Leaves a pending delivery
+
+        loaded = self._round_trip(config)
+        self.assertEqual(loaded.port, 2)
+
+        (listener,) = loaded.port._item._event_listeners
+        self.assertEqual(listener._pending, {})
+        self.assertIsNone(listener._deadline)
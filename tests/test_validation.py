@@ -7,7 +7,9 @@ from fastcfg.config import Config
 from fastcfg.config.items import BuiltInConfigItem, LiveConfigItem
 from fastcfg.exceptions import ConfigItemValidationError
 from fastcfg.sources.files import from_yaml
+from fastcfg.validation.pipeline import ValidatorPipeline
 from fastcfg.validation.policies import (
+    LengthValidator,
     PydanticValidator,
     RangeValidator,
     RegexValidator,
@@ -262,3 +264,108 @@ class TestValidation(unittest.TestCase):
 
 
             
+
+
+class TestValidatorPipeline(unittest.TestCase):
+
+    def test_cheap_checks_run_first(self):
+        regex = RegexValidator(r"^\d+$")
+        type_check = TypeValidator(str)
+        pipeline = ValidatorPipeline([regex, type_check])
+
+        self.assertEqual(pipeline.order(), [type_check, regex])
+        self.assertIsNone(pipeline.check("42"))
+        self.assertIs(pipeline.check(42), type_check)
+        self.assertIs(pipeline.check("abc"), regex)
+
+    def test_frequent_failures_move_ahead(self):
+        type_check = TypeValidator(int)
+        range_check = RangeValidator(1, 10)
+        pipeline = ValidatorPipeline([type_check, range_check])
+
+        for _ in range(4):
+            pipeline.record_failure(pipeline.check(11))
+
+        self.assertEqual(pipeline.order(), [range_check, type_check])
+        self.assertIs(pipeline.check(11), range_check)
+
+    def test_raising_check_falls_back_to_validators(self):
+        """Errors should surface as without compilation, in the order validators were added."""
+        pipeline = ValidatorPipeline([LengthValidator(3)])
+
+        with self.assertRaises(TypeError):
+            pipeline.check(42)
+
+        range_check = RangeValidator(1, 10)
+        pipeline = ValidatorPipeline([range_check])
+        self.assertIs(pipeline.check("abc"), range_check)
+
+    def test_overridden_validate_is_called(self):
+        class EvenValidator(RangeValidator):
+            def validate(self, value):
+                return super().validate(value) and value % 2 == 0
+
+        even = EvenValidator(1, 10)
+        pipeline = ValidatorPipeline([even])
+
+        self.assertIsNone(pipeline.check(4))
+        self.assertIs(pipeline.check(5), even)
+
+    def test_items_report_the_failing_validator(self):
+        config = Config(port=8080)
+        config.port.add_validator(TypeValidator(int))
+        config.port.add_validator(RangeValidator(1, 65535))
+
+        with self.assertRaises(ConfigItemValidationError) as ctx:
+            config.port = 0
+
+        self.assertIn("between 1 and 65535", str(ctx.exception))
+
+    def test_items_report_the_first_validator_added(self):
+        """The error should come from the first failing validator added, not the first checked."""
+        config = Config(ratio=5)
+        config.ratio.add_validator(RangeValidator(1, 10))
+        config.ratio.add_validator(TypeValidator(int))
+
+        with self.assertRaises(ConfigItemValidationError) as ctx:
+            config.ratio = 20.5
+
+        self.assertIn("between 1 and 10", str(ctx.exception))
+
+    def test_save_with_validators(self):
+        config = Config(port=8080)
+        config.port.add_validator(RangeValidator(1, 65535))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/config.pkl"
+            config.save(path)
+            loaded = Config.load(path)
+
+        with self.assertRaises(ConfigItemValidationError):
+            loaded.port = 0
+        loaded.port = 443
+        self.assertEqual(loaded.port, 443)
+
+    def test_live_state_fetched_once_per_read(self):
+        state_tracker = MagicMock()
+        state_tracker.get_state = MagicMock(side_effect=[5, 6, 6])
+
+        item = LiveConfigItem(state_tracker)
+        item.add_validator(RangeValidator(1, 10, validate_immediately=False))
+
+        self.assertEqual(item.value, 5)
+        self.assertEqual(item.value, 6)
+        self.assertEqual(state_tracker.get_state.call_count, 2)
+
+    def test_live_scalar_state_type_is_tracked(self):
+        state_tracker = MagicMock()
+        state_tracker.get_state = MagicMock(side_effect=[1, True])
+
+        item = LiveConfigItem(state_tracker)
+        validator = MagicMock(validate_immediately=False)
+        item.add_validator(validator)
+
+        item.value
+        item.value  # Equal to 1, but a different state
+
+        self.assertEqual(validator.validate.call_count, 2)